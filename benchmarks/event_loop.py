@@ -0,0 +1,148 @@
+"""Measure the throughput of the action server with and without `--fast-event-loop`.
+
+Runs concurrent action calls through `ActionExecutor.run`, once without and
+once with awaiting a round trip over a loopback socket in each action, on the
+default asyncio event loop and on the loop of `use_fast_event_loop` (uvloop
+and, on Python 3.12+, eager tasks).
+
+Run with `python -m benchmarks.event_loop` from the repository root.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Text
+
+from rasa_sdk import Action, Tracker
+from rasa_sdk.event_loop import use_fast_event_loop
+from rasa_sdk.executor import ActionExecutor, CollectingDispatcher
+
+CALLS = 20_000
+CONCURRENCY = 100
+REPEAT = 3
+
+
+class ActionGreet(Action):
+    def name(self) -> Text:
+        return "action_greet"
+
+    async def run(
+        self,
+        dispatcher: CollectingDispatcher,
+        tracker: Tracker,
+        domain: Dict[Text, Any],
+    ) -> List[Dict[Text, Any]]:
+        dispatcher.utter_message(text=f"Hello {tracker.sender_id}!")
+        return []
+
+
+class ActionLookup(Action):
+    """Action which waits for a reply of a backend before it answers."""
+
+    def __init__(self) -> None:
+        """Creates an `ActionLookup` without connections to the backend."""
+        self.connections: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    def name(self) -> Text:
+        return "action_lookup"
+
+    async def run(
+        self,
+        dispatcher: CollectingDispatcher,
+        tracker: Tracker,
+        domain: Dict[Text, Any],
+    ) -> List[Dict[Text, Any]]:
+        reader, writer = await self.connections.get()
+        try:
+            writer.write(tracker.sender_id.encode() + b"\n")
+            reply = await reader.readline()
+        finally:
+            self.connections.put_nowait((reader, writer))
+        dispatcher.utter_message(text=reply.decode().strip())
+        return []
+
+
+def action_call(action_name: Text, sender_id: Text) -> Dict[Text, Any]:
+    return {
+        "next_action": action_name,
+        "sender_id": sender_id,
+        "tracker": {"sender_id": sender_id, "events": []},
+        "domain": {},
+    }
+
+
+async def run_calls(call: Callable[[int], Awaitable[Any]]) -> float:
+    """Run `CALLS` calls, `CONCURRENCY` at a time, and return the calls/s."""
+    started = time.perf_counter()
+    for offset in range(0, CALLS, CONCURRENCY):
+        await asyncio.gather(*(call(offset + i) for i in range(CONCURRENCY)))
+    return CALLS / (time.perf_counter() - started)
+
+
+async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while line := await reader.readline():
+        writer.write(line)
+    writer.close()
+
+
+async def benchmark() -> Dict[Text, float]:
+    executor = ActionExecutor()
+    executor.register_action(ActionGreet())
+    lookup = ActionLookup()
+    executor.register_action(lookup)
+
+    handlers: List[asyncio.Task] = []
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handlers.append(asyncio.current_task())
+        await echo(reader, writer)
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    connections = [
+        await asyncio.open_connection("127.0.0.1", port) for _ in range(CONCURRENCY)
+    ]
+    for connection in connections:
+        lookup.connections.put_nowait(connection)
+
+    results = {}
+    for action_name in ("action_greet", "action_lookup"):
+
+        def call(i: int, action_name: Text = action_name) -> Awaitable[Any]:
+            return executor.run(action_call(action_name, str(i)))
+
+        results[action_name] = await run_calls(call)
+
+    for _, writer in connections:
+        writer.close()
+    await asyncio.gather(*handlers)
+    server.close()
+    await server.wait_closed()
+    return results
+
+
+def measure(fast_event_loop: bool) -> Dict[Text, float]:
+    if fast_event_loop:
+        use_fast_event_loop()
+    try:
+        runs = [asyncio.run(benchmark()) for _ in range(REPEAT)]
+    finally:
+        asyncio.set_event_loop_policy(None)
+    return {name: max(run[name] for run in runs) for name in runs[0]}
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    default = measure(fast_event_loop=False)
+    fast = measure(fast_event_loop=True)
+
+    for name in default:
+        print(
+            f"{name:>14}: {default[name]:>9,.0f} calls/s default, "
+            f"{fast[name]:>9,.0f} calls/s fast event loop "
+            f"({fast[name] / default[name]:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure the per-request tracing and version check overhead.
+
+Compares the work every `/webhook` request did before any action code ran
+when tracing is disabled (building the tracing carrier, looking up a tracer,
+starting a span and checking the Rasa version) with the current fast path.
+
+Run with `python -m benchmarks.request_prelude` from the repository root.
+"""
+
+import timeit
+import warnings
+from functools import partial
+
+from sanic.compat import Header
+
+import rasa_sdk
+from rasa_sdk.endpoint import header_to_multi_dict
+from rasa_sdk.tracing.utils import (
+    get_tracer_and_context,
+    set_span_attributes,
+    start_request_span,
+)
+from rasa_sdk.utils import check_version_compatibility
+
+SPAN_NAME = "create_app.webhook"
+NUMBER = 100_000
+
+HEADERS = Header(
+    {
+        "host": "localhost:5055",
+        "user-agent": "aiohttp",
+        "accept": "*/*",
+        "accept-encoding": "gzip, deflate",
+        "content-type": "application/json",
+        "content-length": "4096",
+    }
+)
+ACTION_CALL = {
+    "next_action": "action_search",
+    "version": rasa_sdk.__version__,
+    "tracker": {"sender_id": "1", "latest_message": {"message_id": "1"}},
+}
+
+
+def previous_prelude() -> None:
+    tracer, context = get_tracer_and_context(
+        span_name=SPAN_NAME,
+        tracer_provider=None,
+        tracing_carrier=header_to_multi_dict(HEADERS),
+    )
+    with tracer.start_as_current_span(SPAN_NAME, context=context) as span:
+        check_version_compatibility.__wrapped__(ACTION_CALL["version"])
+        set_span_attributes(span, ACTION_CALL)
+
+
+def current_prelude() -> None:
+    with start_request_span(
+        SPAN_NAME, None, partial(header_to_multi_dict, HEADERS)
+    ) as span:
+        check_version_compatibility(ACTION_CALL["version"])
+        set_span_attributes(span, ACTION_CALL)
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    results = {}
+    for name, prelude in (("previous", previous_prelude), ("current", current_prelude)):
+        seconds = min(timeit.repeat(prelude, number=NUMBER, repeat=5))
+        results[name] = seconds / NUMBER * 1e6
+        print(f"{name:>8}: {results[name]:.2f} µs per request")
+
+    print(f"   saved: {results['previous'] - results['current']:.2f} µs per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,106 @@
 import asyncio
 import logging
+from functools import partial
+from typing import Callable, Optional
 
 from rasa_sdk import utils
+from rasa_sdk.admission import AdmissionController
 from rasa_sdk.constants import APPLICATION_ROOT_LOGGER_NAME
 from rasa_sdk.endpoint import create_argument_parser, run
+from rasa_sdk.event_loop import use_fast_event_loop
 from rasa_sdk.executor import ActionExecutor
-from rasa_sdk.grpc_server import run_grpc
+from rasa_sdk.grpc_options import GRPCServerOptions
+from rasa_sdk.grpc_server import run_grpc, run_grpc_workers
+from rasa_sdk.readiness import ReadinessMonitor
+from rasa_sdk.response_cache import ResponseCache
+from rasa_sdk.stream_sink import StreamSink
+from rasa_sdk.thread_pool import SyncThreadPool
+from rasa_sdk.tracker_cache import TrackerCache
 
 logger = logging.getLogger(__name__)
 
 
+def create_admission_controller(args) -> Optional[AdmissionController]:
+    """Create the admission controller if any concurrency limit is configured."""
+    if args.max_concurrent_actions is None and not args.action_concurrency_limit:
+        return None
+
+    return AdmissionController(
+        max_concurrent_actions=args.max_concurrent_actions,
+        action_limits=dict(args.action_concurrency_limit),
+        max_queue_size=args.max_queued_actions,
+        queue_timeout=args.max_queue_wait,
+    )
+
+
+def create_response_cache(args) -> Optional[ResponseCache]:
+    """Create the response cache if a time to live is configured."""
+    if args.response_cache_ttl is None:
+        return None
+
+    return ResponseCache(
+        max_entries=args.response_cache_size, ttl=args.response_cache_ttl
+    )
+
+
+def create_sync_thread_pool(args) -> Optional[SyncThreadPool]:
+    """Create the thread pool for synchronous actions unless it's disabled."""
+    if args.sync_action_threads <= 0:
+        return None
+
+    return SyncThreadPool(max_workers=args.sync_action_threads)
+
+
+def create_tracker_cache(args) -> Optional[TrackerCache]:
+    """Create the tracker cache if a number of conversations is configured."""
+    if args.tracker_cache_size is None:
+        return None
+
+    return TrackerCache(
+        max_entries=args.tracker_cache_size, max_events=args.tracker_cache_max_events
+    )
+
+
+def create_readiness_monitor(args) -> ReadinessMonitor:
+    """Create the monitor deciding whether the server is ready."""
+    return ReadinessMonitor(
+        max_loop_lag=args.readiness_max_loop_lag,
+        max_in_flight=args.readiness_max_in_flight,
+        max_queue_depth=args.readiness_max_queue_depth,
+        recovery_ratio=args.readiness_recovery_ratio,
+    )
+
+
+def create_grpc_server_options(args) -> GRPCServerOptions:
+    """Create the tuning of the gRPC server."""
+    return GRPCServerOptions(
+        max_concurrent_streams=args.grpc_max_concurrent_streams,
+        max_receive_message_size=args.grpc_max_receive_message_size,
+        max_send_message_size=args.grpc_max_send_message_size,
+        keepalive_time=args.grpc_keepalive_time,
+        keepalive_timeout=args.grpc_keepalive_timeout,
+        max_connection_age=args.grpc_max_connection_age,
+        max_connection_age_grace=args.grpc_max_connection_age_grace,
+        compression=args.grpc_compression,
+        compression_min_size=args.grpc_compression_min_size,
+        thread_pool_size=args.grpc_thread_pool_size,
+        multiplex_max_in_flight=args.grpc_multiplex_max_in_flight,
+        stream_high_water_mark=args.stream_high_water_mark,
+        stream_coalesce_max_delay=args.stream_coalesce_max_delay,
+        stream_coalesce_max_size=args.stream_coalesce_max_size,
+    )
+
+
+def create_stream_sink_factory(args) -> Callable[[], StreamSink]:
+    """Create the factory of the sinks of streaming action calls."""
+    return partial(
+        StreamSink,
+        high_water_mark=args.stream_high_water_mark,
+        coalesce_max_delay=args.stream_coalesce_max_delay,
+        coalesce_max_size=args.stream_coalesce_max_size,
+    )
+
+
 def main_from_args(args):
     """Run with arguments."""
     logging.getLogger("matplotlib").setLevel(logging.WARN)
@@ -23,12 +114,42 @@ def main_from_args(args):
     )
     utils.update_sanic_log_level()
 
-    action_executor = ActionExecutor()
+    if args.fast_event_loop:
+        # Forked gRPC workers inherit the policy, spawned HTTP workers install
+        # it again when they create their app.
+        use_fast_event_loop()
+
+    action_executor = ActionExecutor(
+        admission_controller=create_admission_controller(args),
+        response_cache=create_response_cache(args),
+        tracker_cache=create_tracker_cache(args),
+        default_action_timeout=args.action_timeout,
+        sync_thread_pool=create_sync_thread_pool(args),
+    )
     action_executor.register_package(
         args.actions_module or args.actions,
     )
 
-    if args.grpc:
+    if args.grpc and args.grpc_workers > 1:
+        if args.socket:
+            raise ValueError(
+                "Several gRPC workers can't share a Unix domain socket. Use "
+                "--port instead of --socket, or run a single worker."
+            )
+        run_grpc_workers(
+            args.grpc_workers,
+            action_executor,
+            args.port,
+            args.ssl_certificate,
+            args.ssl_keyfile,
+            args.ssl_ca_file,
+            args.auto_reload,
+            args.endpoints,
+            metrics_port=args.metrics_port,
+            options=create_grpc_server_options(args),
+            readiness_monitor=create_readiness_monitor(args),
+        )
+    elif args.grpc:
         asyncio.run(
             run_grpc(
                 action_executor,
@@ -38,6 +159,10 @@ def main_from_args(args):
                 args.ssl_ca_file,
                 args.auto_reload,
                 args.endpoints,
+                metrics_port=args.metrics_port,
+                unix_socket=args.socket,
+                options=create_grpc_server_options(args),
+                readiness_monitor=create_readiness_monitor(args),
             )
         )
     else:
@@ -50,6 +175,20 @@ def main_from_args(args):
             args.ssl_password,
             args.auto_reload,
             args.endpoints,
+            json_codec=args.json_codec,
+            response_compression_min_size=(
+                args.response_compression_min_size
+                if args.response_compression_min_size >= 0
+                else None
+            ),
+            compression_offload_threshold=args.compression_offload_threshold,
+            batch_concurrency=args.batch_concurrency,
+            request_timeout=args.request_timeout,
+            stream_sink_factory=create_stream_sink_factory(args),
+            readiness_monitor=create_readiness_monitor(args),
+            fast_event_loop=args.fast_event_loop,
+            unix_socket=args.socket,
+            preload=args.preload,
         )
 
 
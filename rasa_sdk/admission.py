@@ -0,0 +1,199 @@
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Text, Tuple
+
+from rasa_sdk.constants import (
+    DEFAULT_MAX_QUEUED_ACTIONS,
+    DEFAULT_OVERLOAD_RETRY_AFTER_SECONDS,
+)
+from rasa_sdk.interfaces import ActionServerOverloadedException
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Limit the number of actions which run concurrently.
+
+    Actions are admitted while both the global limit and the limit of the
+    action itself have free capacity. Otherwise they wait in a bounded FIFO
+    queue. Calls which find the queue full, or which wait longer than the
+    queue timeout, are rejected with an `ActionServerOverloadedException` so
+    the transport can shed the load immediately.
+
+    The controller only keeps plain counters until it is used, so it can be
+    pickled together with the `ActionExecutor` into every Sanic worker; each
+    worker process enforces the limits on its own.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_actions: Optional[int] = None,
+        action_limits: Optional[Dict[Text, int]] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUED_ACTIONS,
+        queue_timeout: Optional[float] = None,
+        retry_after: float = DEFAULT_OVERLOAD_RETRY_AFTER_SECONDS,
+    ) -> None:
+        """Creates an `AdmissionController`.
+
+        Args:
+            max_concurrent_actions: Maximum number of actions running at the
+                same time. `None` means unlimited.
+            action_limits: Maximum number of concurrent runs per action name.
+            max_queue_size: Maximum number of calls waiting for capacity.
+                Calls beyond that are rejected right away.
+            queue_timeout: Maximum number of seconds a call waits in the
+                queue before it is rejected. `None` waits indefinitely.
+            retry_after: Number of seconds clients are advised to wait before
+                retrying a rejected call.
+        """
+        self.max_concurrent_actions = max_concurrent_actions
+        self.action_limits = dict(action_limits or {})
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._in_flight = 0
+        self._in_flight_per_action: Dict[Text, int] = {}
+        self._waiters: Deque[Tuple[Text, asyncio.Future]] = deque()
+        self._shed_count = 0
+        self._shed_per_action: Dict[Text, int] = {}
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop waiters bound to the event loop of the current process."""
+        state = self.__dict__.copy()
+        state["_waiters"] = deque()
+        return state
+
+    @property
+    def in_flight(self) -> int:
+        """Number of actions which are currently running."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls which are waiting for capacity."""
+        return len(self._waiters)
+
+    @property
+    def shed_count(self) -> int:
+        """Number of calls which were rejected since the start."""
+        return self._shed_count
+
+    def stats(self) -> Dict[Text, Any]:
+        """Return the current state of the controller."""
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "shed_count": self._shed_count,
+            "max_concurrent_actions": self.max_concurrent_actions,
+            "max_queue_size": self.max_queue_size,
+            "actions": {
+                action_name: {
+                    "in_flight": self._in_flight_per_action.get(action_name, 0),
+                    "shed_count": self._shed_per_action.get(action_name, 0),
+                    "limit": self.action_limits.get(action_name),
+                }
+                for action_name in sorted(
+                    {*self._in_flight_per_action, *self._shed_per_action}
+                )
+            },
+        }
+
+    @contextlib.asynccontextmanager
+    async def admit(self, action_name: Text) -> AsyncIterator[None]:
+        """Hold a slot for running `action_name` for the duration of the context.
+
+        Raises:
+            ActionServerOverloadedException: If no slot became available.
+        """
+        await self.acquire(action_name)
+        try:
+            yield
+        finally:
+            self.release(action_name)
+
+    async def acquire(self, action_name: Text) -> None:
+        """Wait until `action_name` may run and reserve a slot for it.
+
+        Raises:
+            ActionServerOverloadedException: If the queue is full or the call
+                waited longer than the queue timeout.
+        """
+        if self._has_capacity(action_name):
+            self._reserve(action_name)
+            return
+
+        if len(self._waiters) >= self.max_queue_size:
+            raise self._shed(action_name, "the wait queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (action_name, waiter)
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over right before the wait was aborted.
+                self.release(action_name)
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(entry)
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._shed(action_name, "it waited too long for capacity")
+            raise
+
+    def release(self, action_name: Text) -> None:
+        """Release the slot of `action_name` and admit waiting calls."""
+        self._in_flight -= 1
+        remaining = self._in_flight_per_action.get(action_name, 1) - 1
+        if remaining > 0:
+            self._in_flight_per_action[action_name] = remaining
+        else:
+            self._in_flight_per_action.pop(action_name, None)
+        self._wake_waiters()
+
+    def _has_capacity(self, action_name: Text) -> bool:
+        if (
+            self.max_concurrent_actions is not None
+            and self._in_flight >= self.max_concurrent_actions
+        ):
+            return False
+
+        action_limit = self.action_limits.get(action_name)
+        return (
+            action_limit is None
+            or self._in_flight_per_action.get(action_name, 0) < action_limit
+        )
+
+    def _reserve(self, action_name: Text) -> None:
+        self._in_flight += 1
+        self._in_flight_per_action[action_name] = (
+            self._in_flight_per_action.get(action_name, 0) + 1
+        )
+
+    def _wake_waiters(self) -> None:
+        # Waiters of an action which hit its own limit must not block waiters
+        # of other actions, so the whole queue is scanned in FIFO order.
+        for entry in list(self._waiters):
+            action_name, waiter = entry
+            if waiter.done():
+                self._waiters.remove(entry)
+            elif self._has_capacity(action_name):
+                self._waiters.remove(entry)
+                self._reserve(action_name)
+                waiter.set_result(None)
+
+    def _shed(self, action_name: Text, reason: Text) -> ActionServerOverloadedException:
+        self._shed_count += 1
+        self._shed_per_action[action_name] = (
+            self._shed_per_action.get(action_name, 0) + 1
+        )
+        logger.warning(
+            f"Rejected call of action '{action_name}' because {reason} "
+            f"({self._in_flight} running, {len(self._waiters)} waiting)."
+        )
+        return ActionServerOverloadedException(
+            action_name, retry_after=self.retry_after
+        )
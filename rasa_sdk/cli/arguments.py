@@ -1,6 +1,40 @@
 import argparse
+import os
+from typing import Text, Tuple
 
-from rasa_sdk.constants import DEFAULT_SERVER_PORT, DEFAULT_ENDPOINTS_PATH
+from rasa_sdk.constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD,
+    DEFAULT_ENDPOINTS_PATH,
+    DEFAULT_GRPC_COMPRESSION,
+    DEFAULT_GRPC_COMPRESSION_MIN_SIZE,
+    DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+    DEFAULT_JSON_CODEC,
+    DEFAULT_MAX_QUEUED_ACTIONS,
+    DEFAULT_READINESS_RECOVERY_RATIO,
+    DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+    DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE,
+    DEFAULT_SERVER_PORT,
+    DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+    DEFAULT_STREAM_COALESCE_MAX_SIZE,
+    DEFAULT_STREAM_HIGH_WATER_MARK,
+    DEFAULT_SYNC_ACTION_THREADS,
+    DEFAULT_TRACKER_CACHE_MAX_EVENTS,
+    ENV_GRPC_COMPRESSION,
+    ENV_GRPC_COMPRESSION_MIN_SIZE,
+    ENV_GRPC_KEEPALIVE_TIME,
+    ENV_GRPC_KEEPALIVE_TIMEOUT,
+    ENV_GRPC_MAX_CONCURRENT_STREAMS,
+    ENV_GRPC_MAX_CONNECTION_AGE,
+    ENV_GRPC_MAX_CONNECTION_AGE_GRACE,
+    ENV_GRPC_MAX_RECEIVE_MESSAGE_SIZE,
+    ENV_GRPC_MAX_SEND_MESSAGE_SIZE,
+    ENV_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+    ENV_GRPC_THREAD_POOL_SIZE,
+    ENV_GRPC_WORKERS,
+)
+from rasa_sdk.grpc_options import GRPC_COMPRESSION_POLICIES
+from rasa_sdk.json_codec import JSON_CODECS
 
 
 def action_arg(actions_module_path: str) -> str:
@@ -26,6 +60,138 @@ def action_arg(actions_module_path: str) -> str:
         return actions_module_path
 
 
+def action_concurrency_limit_arg(value: Text) -> Tuple[Text, int]:
+    """Parse a per-action concurrency limit.
+
+    Args:
+        value: The limit in the format `<action name>=<limit>`.
+
+    Returns:
+        The action name and its limit.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is invalid.
+    """
+    action_name, separator, limit = value.rpartition("=")
+    try:
+        parsed_limit = int(limit)
+    except ValueError:
+        parsed_limit = 0
+
+    if not separator or not action_name or parsed_limit < 1:
+        raise argparse.ArgumentTypeError(
+            f"Invalid action concurrency limit '{value}'. The limit should be "
+            "passed as `<action name>=<positive number>` (e.g. action_search=4)."
+        )
+    return action_name, parsed_limit
+
+
+def add_grpc_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments tuning the gRPC server.
+
+    Every argument defaults to the value of its environment variable, which
+    argparse converts and validates like a value passed on the command line.
+    """
+    parser.add_argument(
+        "--grpc-workers",
+        default=os.environ.get(ENV_GRPC_WORKERS, 1),
+        type=int,
+        help="Number of gRPC server processes sharing the port. Crashed "
+        "processes are restarted. Not supported with --socket. "
+        f"Can also be set with {ENV_GRPC_WORKERS}.",
+    )
+    parser.add_argument(
+        "--grpc-max-concurrent-streams",
+        default=os.environ.get(ENV_GRPC_MAX_CONCURRENT_STREAMS),
+        type=int,
+        help="Maximum number of concurrent calls on a single gRPC connection. "
+        f"Can also be set with {ENV_GRPC_MAX_CONCURRENT_STREAMS}.",
+    )
+    parser.add_argument(
+        "--grpc-max-receive-message-size",
+        default=os.environ.get(ENV_GRPC_MAX_RECEIVE_MESSAGE_SIZE),
+        type=int,
+        help="Maximum size in bytes of a gRPC request, e.g. to accept trackers "
+        "above the gRPC default of 4 MB. "
+        f"Can also be set with {ENV_GRPC_MAX_RECEIVE_MESSAGE_SIZE}.",
+    )
+    parser.add_argument(
+        "--grpc-max-send-message-size",
+        default=os.environ.get(ENV_GRPC_MAX_SEND_MESSAGE_SIZE),
+        type=int,
+        help="Maximum size in bytes of a gRPC response. "
+        f"Can also be set with {ENV_GRPC_MAX_SEND_MESSAGE_SIZE}.",
+    )
+    parser.add_argument(
+        "--grpc-keepalive-time",
+        default=os.environ.get(ENV_GRPC_KEEPALIVE_TIME),
+        type=float,
+        help="Number of seconds after which the gRPC server pings idle "
+        f"connections. Can also be set with {ENV_GRPC_KEEPALIVE_TIME}.",
+    )
+    parser.add_argument(
+        "--grpc-keepalive-timeout",
+        default=os.environ.get(ENV_GRPC_KEEPALIVE_TIMEOUT),
+        type=float,
+        help="Number of seconds the gRPC server waits for the answer to a ping "
+        "before it closes the connection. "
+        f"Can also be set with {ENV_GRPC_KEEPALIVE_TIMEOUT}.",
+    )
+    parser.add_argument(
+        "--grpc-max-connection-age",
+        default=os.environ.get(ENV_GRPC_MAX_CONNECTION_AGE),
+        type=float,
+        help="Number of seconds after which clients are asked to reconnect, so "
+        "that connections are rebalanced behind L4 load balancers. "
+        f"Can also be set with {ENV_GRPC_MAX_CONNECTION_AGE}.",
+    )
+    parser.add_argument(
+        "--grpc-max-connection-age-grace",
+        default=os.environ.get(ENV_GRPC_MAX_CONNECTION_AGE_GRACE),
+        type=float,
+        help="Number of seconds running calls may take to finish once their "
+        "connection reached --grpc-max-connection-age. "
+        f"Can also be set with {ENV_GRPC_MAX_CONNECTION_AGE_GRACE}.",
+    )
+    parser.add_argument(
+        "--grpc-compression",
+        default=os.environ.get(ENV_GRPC_COMPRESSION, DEFAULT_GRPC_COMPRESSION),
+        choices=GRPC_COMPRESSION_POLICIES,
+        help="Compression of gRPC responses: `none`, `gzip` for every message, "
+        "or `threshold` to only compress messages of at least "
+        "--grpc-compression-min-size bytes. "
+        f"Can also be set with {ENV_GRPC_COMPRESSION}.",
+    )
+    parser.add_argument(
+        "--grpc-compression-min-size",
+        default=os.environ.get(
+            ENV_GRPC_COMPRESSION_MIN_SIZE, DEFAULT_GRPC_COMPRESSION_MIN_SIZE
+        ),
+        type=int,
+        help="Minimum size in bytes of a compressed gRPC message with "
+        "`--grpc-compression threshold`. "
+        f"Can also be set with {ENV_GRPC_COMPRESSION_MIN_SIZE}.",
+    )
+    parser.add_argument(
+        "--grpc-multiplex-max-in-flight",
+        default=os.environ.get(
+            ENV_GRPC_MULTIPLEX_MAX_IN_FLIGHT, DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT
+        ),
+        type=int,
+        help="Maximum number of requests of a single `WebhookMultiplex` stream "
+        "which are processed at the same time. "
+        f"Can also be set with {ENV_GRPC_MULTIPLEX_MAX_IN_FLIGHT}.",
+    )
+    parser.add_argument(
+        "--grpc-thread-pool-size",
+        default=os.environ.get(ENV_GRPC_THREAD_POOL_SIZE),
+        type=int,
+        help="Number of threads of the gRPC server's thread pool. Defaults to "
+        "the number of Sanic workers. "
+        f"Can also be set with {ENV_GRPC_THREAD_POOL_SIZE}.",
+    )
+
+
 def add_endpoint_arguments(parser: argparse.ArgumentParser) -> None:
     """Add all the arguments to the argument parser."""
     parser.add_argument(
@@ -35,6 +201,13 @@ def add_endpoint_arguments(parser: argparse.ArgumentParser) -> None:
         type=int,
         help="port to run the server at",
     )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        type=str,
+        help="path of a Unix domain socket to run the server at instead of the "
+        "port, e.g. when Rasa runs on the same host",
+    )
     parser.add_argument(
         "--cors",
         nargs="*",
@@ -90,3 +263,195 @@ def add_endpoint_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--grpc", help="Starts grpc server instead of http", action="store_true"
     )
+    parser.add_argument(
+        "--preload",
+        help="Import the actions once and fork the HTTP server workers from the "
+        "main process, so that they share the imported code and data instead of "
+        "importing the actions each",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--fast-event-loop",
+        help="Run the server on a uvloop event loop if uvloop is installed. On "
+        "Python 3.12+, additionally run new tasks eagerly until they first wait",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--json-codec",
+        default=DEFAULT_JSON_CODEC,
+        choices=[DEFAULT_JSON_CODEC, *JSON_CODECS],
+        help="JSON library used to decode action calls and encode action results "
+        "of the HTTP server. `auto` picks the fastest installed library "
+        "(orjson, msgspec or the standard library).",
+    )
+    parser.add_argument(
+        "--response-compression-min-size",
+        default=DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE,
+        type=int,
+        help="Minimum size in bytes of an HTTP response body to be compressed "
+        "with an encoding accepted by the client (zstd, br, gzip or deflate). "
+        "Use a negative value to disable response compression.",
+    )
+    parser.add_argument(
+        "--compression-offload-threshold",
+        default=DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD,
+        type=int,
+        help="Minimum size in bytes of an HTTP request or response body to be "
+        "(de)compressed in a thread pool instead of on the event loop.",
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        default=DEFAULT_BATCH_CONCURRENCY,
+        type=int,
+        help="Maximum number of action calls of a single `/webhook/batch` request "
+        "which are executed concurrently.",
+    )
+    parser.add_argument(
+        "--max-concurrent-actions",
+        default=None,
+        type=int,
+        help="Maximum number of actions which run concurrently in a server process. "
+        "Further calls wait in a bounded queue and are rejected with HTTP 503 "
+        "(gRPC RESOURCE_EXHAUSTED) once it is full. Unlimited by default.",
+    )
+    parser.add_argument(
+        "--action-concurrency-limit",
+        default=[],
+        action="append",
+        type=action_concurrency_limit_arg,
+        help="Maximum number of concurrent runs of a single action, passed as "
+        "`<action name>=<limit>`. Can be passed multiple times.",
+    )
+    parser.add_argument(
+        "--max-queued-actions",
+        default=DEFAULT_MAX_QUEUED_ACTIONS,
+        type=int,
+        help="Maximum number of action calls which wait for a free slot when a "
+        "concurrency limit is reached.",
+    )
+    parser.add_argument(
+        "--max-queue-wait",
+        default=None,
+        type=float,
+        help="Maximum number of seconds an action call waits for a free slot "
+        "before it is rejected. Waits indefinitely by default.",
+    )
+    parser.add_argument(
+        "--response-cache-ttl",
+        default=None,
+        type=float,
+        help="Number of seconds the result of an action call is returned again "
+        "to retried calls with the same sender, user message, action and number "
+        "of tracker events. Identical calls which arrive while the action runs "
+        "share its execution. Disabled by default.",
+    )
+    parser.add_argument(
+        "--response-cache-size",
+        default=DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        type=int,
+        help="Maximum number of action call results kept by --response-cache-ttl.",
+    )
+    parser.add_argument(
+        "--tracker-cache-size",
+        default=None,
+        type=int,
+        help="Maximum number of conversations whose tracker events are kept, so "
+        "that action calls may contain only the events appended since a "
+        "`tracker_base_event_count`. Calls whose earlier events aren't kept are "
+        "answered with HTTP 449 (gRPC NOT_FOUND) and retried with the full "
+        "tracker. Disabled by default.",
+    )
+    parser.add_argument(
+        "--tracker-cache-max-events",
+        default=DEFAULT_TRACKER_CACHE_MAX_EVENTS,
+        type=int,
+        help="Maximum number of events kept by --tracker-cache-size across all "
+        "conversations. The least recently used conversations are dropped first.",
+    )
+    parser.add_argument(
+        "--sync-action-threads",
+        default=DEFAULT_SYNC_ACTION_THREADS,
+        type=int,
+        help="Number of threads which run synchronous actions and synchronous "
+        "`validate_`/`extract_` methods of forms, so that blocking code doesn't "
+        "block other action calls. Actions with `run_in_thread = False` run in "
+        "the event loop. `0` runs all synchronous code in the event loop.",
+    )
+    parser.add_argument(
+        "--action-timeout",
+        default=None,
+        type=float,
+        help="Maximum number of seconds an action may run before it is cancelled "
+        "and the call fails with status 504 or the gRPC status DEADLINE_EXCEEDED. "
+        "Applies to all actions which don't set their own `timeout`. Not "
+        "limited by default.",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        default=None,
+        type=float,
+        help="Maximum number of seconds an action call of the HTTP server may "
+        "take before it is cancelled and answered with status 504. Clients can "
+        "send a shorter timeout in the `X-Request-Timeout` header. gRPC calls use "
+        "the client's deadline. Not limited by default.",
+    )
+    parser.add_argument(
+        "--readiness-max-loop-lag",
+        default=None,
+        type=float,
+        help="Maximum number of seconds the event loop may lag behind before the "
+        "server reports not to be ready: `/ready` answers with status 503 and "
+        "the gRPC health service with NOT_SERVING. Not checked by default.",
+    )
+    parser.add_argument(
+        "--readiness-max-in-flight",
+        default=None,
+        type=int,
+        help="Maximum number of running actions before the server reports not to "
+        "be ready. Not checked by default.",
+    )
+    parser.add_argument(
+        "--readiness-max-queue-depth",
+        default=None,
+        type=int,
+        help="Maximum number of action calls waiting for admission before the "
+        "server reports not to be ready. Not checked by default.",
+    )
+    parser.add_argument(
+        "--readiness-recovery-ratio",
+        default=DEFAULT_READINESS_RECOVERY_RATIO,
+        type=float,
+        help="Fraction of each readiness limit the load must drop to before the "
+        "server reports to be ready again.",
+    )
+    parser.add_argument(
+        "--stream-high-water-mark",
+        default=DEFAULT_STREAM_HIGH_WATER_MARK,
+        type=int,
+        help="Number of events of a streaming action call which may wait to be "
+        "sent to the client. Once reached, streaming further chunks waits until "
+        "the client received earlier ones.",
+    )
+    parser.add_argument(
+        "--stream-coalesce-max-delay",
+        default=DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+        type=float,
+        help="Maximum number of seconds a streamed text chunk is held back to be "
+        "merged with the following chunks of the same response. Text chunks "
+        "which wait to be sent are merged regardless.",
+    )
+    parser.add_argument(
+        "--stream-coalesce-max-size",
+        default=DEFAULT_STREAM_COALESCE_MAX_SIZE,
+        type=int,
+        help="Maximum number of characters of streamed text chunks merged into "
+        "one chunk. 0 disables merging.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        default=None,
+        type=int,
+        help="Port of a separate HTTP server exposing the `/metrics` endpoint when "
+        "running with --grpc. The HTTP server always exposes `/metrics` itself.",
+    )
+    add_grpc_arguments(parser)
@@ -0,0 +1,165 @@
+import asyncio
+import zlib
+from typing import Callable, Dict, List, Optional, Text, Tuple
+
+try:  # Python 3.14+
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+
+    def _zstd_compress(data: bytes) -> bytes:
+        return _zstd.compress(data)
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return _zstd.decompress(data)
+
+except ImportError:
+    try:
+        import zstandard as _zstd  # type: ignore[no-redef]
+
+        def _zstd_compress(data: bytes) -> bytes:
+            return _zstd.ZstdCompressor().compress(data)
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            return _zstd.ZstdDecompressor().decompressobj().decompress(data)
+
+    except ImportError:
+        _zstd = None
+
+try:
+    import brotli as _brotli
+except ImportError:
+    _brotli = None
+
+GZIP_ENCODING = "gzip"
+DEFLATE_ENCODING = "deflate"
+ZSTD_ENCODING = "zstd"
+BROTLI_ENCODING = "br"
+
+# zlib `wbits` selecting the gzip container.
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _GZIP_WBITS
+    )
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data: bytes) -> bytes:
+    return zlib.decompress(data, _GZIP_WBITS)
+
+
+_COMPRESSORS: Dict[Text, Callable[[bytes], bytes]] = {
+    GZIP_ENCODING: _gzip_compress,
+    DEFLATE_ENCODING: zlib.compress,
+}
+_DECOMPRESSORS: Dict[Text, Callable[[bytes], bytes]] = {
+    GZIP_ENCODING: _gzip_decompress,
+    DEFLATE_ENCODING: zlib.decompress,
+}
+
+if _zstd is not None:
+    _COMPRESSORS[ZSTD_ENCODING] = _zstd_compress
+    _DECOMPRESSORS[ZSTD_ENCODING] = _zstd_decompress
+
+if _brotli is not None:
+    _COMPRESSORS[BROTLI_ENCODING] = _brotli.compress
+    _DECOMPRESSORS[BROTLI_ENCODING] = _brotli.decompress
+
+# Server preference when the client accepts several encodings equally.
+_ENCODING_PREFERENCE = (ZSTD_ENCODING, BROTLI_ENCODING, GZIP_ENCODING, DEFLATE_ENCODING)
+
+
+def supported_encodings() -> List[Text]:
+    """Return the content encodings available in this environment."""
+    return [encoding for encoding in _ENCODING_PREFERENCE if encoding in _COMPRESSORS]
+
+
+def is_supported_encoding(encoding: Optional[Text]) -> bool:
+    """Check whether a body with the given `Content-Encoding` can be decoded."""
+    return encoding is not None and encoding.lower() in _DECOMPRESSORS
+
+
+def _parse_accept_encoding(header: Text) -> List[Tuple[Text, float]]:
+    accepted = []
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted.append((coding, quality))
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: Optional[Text]) -> Optional[Text]:
+    """Pick the response encoding for an `Accept-Encoding` header.
+
+    Args:
+        accept_encoding: Value of the request's `Accept-Encoding` header.
+
+    Returns:
+        The accepted encoding with the highest quality value, ties broken by
+        the server preference (zstd, brotli, gzip, deflate). `None` if the
+        client accepts none of the available encodings.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = _parse_accept_encoding(accept_encoding)
+    qualities = dict(accepted)
+    wildcard = qualities.get("*")
+
+    best: Optional[Text] = None
+    best_quality = 0.0
+    for encoding in supported_encodings():
+        quality = qualities.get(encoding, wildcard)
+        if quality is not None and quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: Text) -> bytes:
+    """Compress `data` with the given content encoding."""
+    return _COMPRESSORS[encoding](data)
+
+
+def decompress(data: bytes, encoding: Text) -> bytes:
+    """Decompress `data` which was compressed with the given content encoding."""
+    return _DECOMPRESSORS[encoding.lower()](data)
+
+
+async def _run_above_threshold(
+    function: Callable[[bytes, Text], bytes],
+    data: bytes,
+    encoding: Text,
+    offload_threshold: Optional[int],
+) -> bytes:
+    if offload_threshold is not None and len(data) >= offload_threshold:
+        # zlib, zstd and brotli release the GIL, so large payloads are
+        # processed in a worker thread without blocking the event loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, function, data, encoding)
+    return function(data, encoding)
+
+
+async def compress_async(
+    data: bytes, encoding: Text, offload_threshold: Optional[int]
+) -> bytes:
+    """Compress `data`, in a thread pool if it exceeds `offload_threshold` bytes."""
+    return await _run_above_threshold(compress, data, encoding, offload_threshold)
+
+
+async def decompress_async(
+    data: bytes, encoding: Text, offload_threshold: Optional[int]
+) -> bytes:
+    """Decompress `data`, in a thread pool if it exceeds `offload_threshold` bytes."""
+    return await _run_above_threshold(decompress, data, encoding, offload_threshold)
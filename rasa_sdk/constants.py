@@ -2,6 +2,9 @@ DEFAULT_SERVER_PORT = 5055
 DEFAULT_SANIC_WORKERS = 1
 DEFAULT_KEEP_ALIVE_TIMEOUT = 120  # in seconds
 DEFAULT_STREAM_BARGE_IN_TIMEOUT_SECONDS = 30.0
+DEFAULT_STREAM_HIGH_WATER_MARK = 64
+DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS = 0.0
+DEFAULT_STREAM_COALESCE_MAX_SIZE = 1024  # in characters
 ENV_SANIC_WORKERS = "ACTION_SERVER_SANIC_WORKERS"
 ACTION_SERVER_STREAM_BARGE_IN_TIMEOUT_SECONDS_ENV_VAR = (
     "ACTION_SERVER_STREAM_BARGE_IN_TIMEOUT_SECONDS"
@@ -16,3 +19,39 @@ PYTHON_LOGGING_SCHEMA_DOCS = (
 )
 DEFAULT_ENDPOINTS_PATH = "endpoints.yml"
 NO_GRACE_PERIOD = 0
+DEFAULT_JSON_CODEC = "auto"
+DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE = 1024  # in bytes
+DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD = 256 * 1024  # in bytes
+DEFAULT_BATCH_CONCURRENCY = 16
+DEFAULT_MAX_QUEUED_ACTIONS = 100
+DEFAULT_OVERLOAD_RETRY_AFTER_SECONDS = 1.0
+DEFAULT_AUTO_RELOAD_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_AUTO_RELOAD_SIGNAL_INTERVAL_SECONDS = 0.25
+DEFAULT_METRICS_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_METRICS_REQUEST_TIMEOUT_SECONDS = 5.0
+DEFAULT_READINESS_CHECK_INTERVAL_SECONDS = 0.5
+DEFAULT_READINESS_RECOVERY_RATIO = 0.8
+ENV_METRICS_DIRECTORY = "ACTION_SERVER_METRICS_DIR"
+DEFAULT_DOMAIN_STORE_MAX_ENTRIES = 16
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"  # in seconds
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 1024
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 60.0
+DEFAULT_TRACKER_CACHE_MAX_ENTRIES = 1024
+DEFAULT_TRACKER_CACHE_MAX_EVENTS = 100_000
+DEFAULT_SYNC_ACTION_THREADS = 10
+DEFAULT_GRPC_COMPRESSION = "gzip"
+DEFAULT_GRPC_COMPRESSION_MIN_SIZE = 1024  # in bytes
+ENV_GRPC_MAX_CONCURRENT_STREAMS = "ACTION_SERVER_GRPC_MAX_CONCURRENT_STREAMS"
+ENV_GRPC_MAX_RECEIVE_MESSAGE_SIZE = "ACTION_SERVER_GRPC_MAX_RECEIVE_MESSAGE_SIZE"
+ENV_GRPC_MAX_SEND_MESSAGE_SIZE = "ACTION_SERVER_GRPC_MAX_SEND_MESSAGE_SIZE"
+ENV_GRPC_KEEPALIVE_TIME = "ACTION_SERVER_GRPC_KEEPALIVE_TIME"
+ENV_GRPC_KEEPALIVE_TIMEOUT = "ACTION_SERVER_GRPC_KEEPALIVE_TIMEOUT"
+ENV_GRPC_MAX_CONNECTION_AGE = "ACTION_SERVER_GRPC_MAX_CONNECTION_AGE"
+ENV_GRPC_MAX_CONNECTION_AGE_GRACE = "ACTION_SERVER_GRPC_MAX_CONNECTION_AGE_GRACE"
+ENV_GRPC_COMPRESSION = "ACTION_SERVER_GRPC_COMPRESSION"
+ENV_GRPC_COMPRESSION_MIN_SIZE = "ACTION_SERVER_GRPC_COMPRESSION_MIN_SIZE"
+ENV_GRPC_THREAD_POOL_SIZE = "ACTION_SERVER_GRPC_THREAD_POOL_SIZE"
+ENV_GRPC_WORKERS = "ACTION_SERVER_GRPC_WORKERS"
+DEFAULT_GRPC_WORKER_RESTART_DELAY_SECONDS = 1.0
+DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT = 64
+ENV_GRPC_MULTIPLEX_MAX_IN_FLIGHT = "ACTION_SERVER_GRPC_MULTIPLEX_MAX_IN_FLIGHT"
@@ -0,0 +1,167 @@
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional, Text
+
+from rasa_sdk.constants import DEFAULT_DOMAIN_STORE_MAX_ENTRIES
+from rasa_sdk.json_codec import JSONCodec, get_json_codec
+
+logger = logging.getLogger(__name__)
+
+# tmpfs mount backed by shared memory on Linux.
+_SHARED_MEMORY_DIRECTORY = "/dev/shm"
+
+
+def _modification_time(entry: os.DirEntry) -> float:
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+class DomainStore:
+    """Share domains between the worker processes of the action server.
+
+    Each domain is stored once as a file named after its digest, so a domain
+    sent to one worker is available to all workers without the client
+    sending it again. Every worker still decodes the domain into its own
+    copy. When the directory is on tmpfs (the default on Linux), reading and
+    writing the files doesn't touch the disk.
+
+    `get` and `put` block while they read, decode, encode and write the
+    domain. Servers use `load` and `store`, which do that in a thread.
+    """
+
+    def __init__(
+        self,
+        directory: Text,
+        max_entries: int = DEFAULT_DOMAIN_STORE_MAX_ENTRIES,
+    ) -> None:
+        """Creates a `DomainStore`.
+
+        Args:
+            directory: Directory which holds the domains. It must exist.
+            max_entries: Maximum number of domains to keep. The least recently
+                stored domains are removed first.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self._codec: Optional[JSONCodec] = None
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop the codec, which may hold unpicklable module references."""
+        state = self.__dict__.copy()
+        state["_codec"] = None
+        return state
+
+    @classmethod
+    def create_temporary(cls, **kwargs: Any) -> "DomainStore":
+        """Create a store in a new directory, in shared memory if available."""
+        parent = (
+            _SHARED_MEMORY_DIRECTORY
+            if os.path.isdir(_SHARED_MEMORY_DIRECTORY)
+            and os.access(_SHARED_MEMORY_DIRECTORY, os.W_OK)
+            else None
+        )
+        directory = tempfile.mkdtemp(prefix="rasa-sdk-domains-", dir=parent)
+        return cls(directory, **kwargs)
+
+    @property
+    def codec(self) -> JSONCodec:
+        """The codec used to serialise the domains."""
+        if self._codec is None:
+            self._codec = get_json_codec()
+        return self._codec
+
+    def _path(self, domain_digest: Text) -> Text:
+        # The digest is sent by the client, so it is hashed rather than used
+        # as a file name directly.
+        key = hashlib.sha256(domain_digest.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def __contains__(self, domain_digest: Text) -> bool:
+        """Check whether the domain with the given digest is stored."""
+        return os.path.exists(self._path(domain_digest))
+
+    def get(self, domain_digest: Text) -> Optional[Dict[Text, Any]]:
+        """Load the domain with the given digest.
+
+        Returns:
+            The domain, or `None` if it is not stored.
+        """
+        try:
+            with open(self._path(domain_digest), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return self.codec.loads(data)
+        except ValueError:
+            logger.warning(f"Ignoring corrupt stored domain '{domain_digest}'.")
+            return None
+
+    def put(self, domain_digest: Text, domain: Dict[Text, Any]) -> None:
+        """Store the domain under its digest.
+
+        The file is replaced atomically, so concurrent readers in other
+        workers never see a partially written domain.
+        """
+        path = self._path(domain_digest)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(self.codec.dumps(domain))
+            os.replace(temporary_path, path)
+        except OSError:
+            logger.warning(
+                f"Failed to store domain '{domain_digest}' for other workers.",
+                exc_info=True,
+            )
+            return
+
+        self._evict()
+
+    async def load(self, domain_digest: Text) -> Optional[Dict[Text, Any]]:
+        """Load the domain like `get`, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, domain_digest)
+
+    async def store(self, domain_digest: Text, domain: Dict[Text, Any]) -> None:
+        """Store the domain like `put` unless it's stored already.
+
+        Doesn't block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._put_if_missing, domain_digest, domain)
+
+    def _put_if_missing(self, domain_digest: Text, domain: Dict[Text, Any]) -> None:
+        if domain_digest not in self:
+            self.put(domain_digest, domain)
+
+    def _evict(self) -> None:
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".json")
+            ]
+        except OSError:
+            return
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=_modification_time)
+        for entry in entries[: len(entries) - self.max_entries]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def remove(self) -> None:
+        """Delete the store and all domains in it."""
+        shutil.rmtree(self.directory, ignore_errors=True)
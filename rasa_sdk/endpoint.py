@@ -1,11 +1,17 @@
 import argparse
+import asyncio
+import contextlib
+import gc
 import logging
+import math
+import multiprocessing
 import os
+import shutil
+import tempfile
+import uuid
 import warnings
-import zlib
-import json
 from functools import partial
-from typing import Dict, List, Text, Union, Optional, Any
+from typing import Callable, Dict, List, Text, Tuple, Union, Optional, Any
 
 from multidict import MultiDict
 from sanic import Sanic, response
@@ -29,24 +35,46 @@ with warnings.catch_warnings():
     )
     from sanic_cors import CORS
     from sanic.request import Request
-    from rasa_sdk import utils
+    from rasa_sdk import compression, utils
     from rasa_sdk.cli.arguments import add_endpoint_arguments
     from rasa_sdk.constants import (
+        DEFAULT_BATCH_CONCURRENCY,
+        DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD,
         DEFAULT_ENDPOINTS_PATH,
+        DEFAULT_JSON_CODEC,
         DEFAULT_KEEP_ALIVE_TIMEOUT,
+        DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE,
         DEFAULT_SERVER_PORT,
+        ENV_METRICS_DIRECTORY,
+        REQUEST_TIMEOUT_HEADER,
     )
-    from rasa_sdk.executor import ActionExecutor
+    from rasa_sdk.domain_store import DomainStore
+    from rasa_sdk.event_loop import use_fast_event_loop
+    from rasa_sdk.executor import ActionExecutor, ActionExecutorRunResult
     from rasa_sdk.interfaces import (
         ActionExecutionRejection,
         ActionNotFoundException,
         ActionMissingDomainException,
+        ActionMissingTrackerException,
+        ActionServerOverloadedException,
+        ActionTimeoutException,
+    )
+    from rasa_sdk.json_codec import JSONCodec, get_json_codec
+    from rasa_sdk.metrics import (
+        METRICS_CONTENT_TYPE,
+        load_snapshots,
+        render_snapshot,
+        write_snapshot,
+        write_snapshots,
     )
     from rasa_sdk.plugin import plugin_manager
+    from rasa_sdk.readiness import ReadinessMonitor
+    from rasa_sdk.reloader import ModuleWatcher, reload_on_signal, signal_reload
+    from rasa_sdk.stream_sink import StreamSink
     from rasa_sdk.tracing.utils import (
-        get_tracer_and_context,
         get_tracer_provider,
         set_span_attributes,
+        start_request_span,
     )
 
 logger = logging.getLogger(__name__)
@@ -92,22 +120,507 @@ async def load_tracer_provider(endpoints: str, app: Sanic):
     app.ctx.tracer_provider = tracer_provider
 
 
+async def decode_action_call(
+    request: Request,
+    codec: JSONCodec,
+    offload_threshold: Optional[int] = DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD,
+) -> Optional[Any]:
+    """Decode the action call sent in the body of `request`.
+
+    Args:
+        request: The incoming request.
+        codec: The JSON codec used to decode the body.
+        offload_threshold: Compressed bodies of at least this many bytes are
+            decompressed in a thread pool instead of on the event loop.
+
+    Returns:
+        The decoded action call or `None` if the body is empty or not valid JSON.
+    """
+    body = request.body
+    content_encoding = request.headers.get("Content-Encoding")
+    if body and compression.is_supported_encoding(content_encoding):
+        body = await compression.decompress_async(
+            body, content_encoding, offload_threshold
+        )
+
+    if not body:
+        return None
+
+    try:
+        return codec.loads(body)
+    except ValueError as e:
+        logger.debug(f"Failed to decode the request body: {e}")
+        return None
+
+
+def encode_action_result(
+    result: Optional[ActionExecutorRunResult], codec: JSONCodec
+) -> bytes:
+    """Encode an action result as JSON.
+
+    The result's events and responses are serialized directly, which avoids
+    copying them through `BaseModel.model_dump`.
+
+    Args:
+        result: The result of the action execution.
+        codec: The JSON codec used to encode the result.
+
+    Returns:
+        The encoded result.
+    """
+    if result is None:
+        return codec.dumps(None)
+
+    return codec.dumps({"events": result.events, "responses": result.responses})
+
+
+async def encoded_response(
+    request: Request,
+    body: bytes,
+    min_size: Optional[int] = DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE,
+    offload_threshold: Optional[int] = DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD,
+    status: int = 200,
+) -> HTTPResponse:
+    """Build a JSON response, compressed if the client accepts it.
+
+    Args:
+        request: The request which is answered.
+        body: The encoded JSON body.
+        min_size: Bodies smaller than this many bytes are sent uncompressed.
+            `None` disables response compression.
+        offload_threshold: Bodies of at least this many bytes are compressed in
+            a thread pool instead of on the event loop.
+        status: The status code of the response.
+
+    Returns:
+        The response.
+    """
+    headers = {}
+    if min_size is not None and len(body) >= min_size:
+        encoding = compression.negotiate_encoding(
+            request.headers.get("Accept-Encoding")
+        )
+        if encoding:
+            body = await compression.compress_async(body, encoding, offload_threshold)
+            headers = {"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+
+    return response.raw(
+        body, status=status, headers=headers, content_type="application/json"
+    )
+
+
+def read_request_timeout(
+    request: Request, default_timeout: Optional[float] = None
+) -> Optional[float]:
+    """Return the number of seconds the action call of `request` may take.
+
+    Clients send their own deadline in the `X-Request-Timeout` header, which is
+    capped by the server's default timeout.
+
+    Args:
+        request: The incoming request.
+        default_timeout: The server's default timeout. `None` means no limit.
+
+    Returns:
+        The timeout in seconds, or `None` if the call is not limited.
+    """
+    raw_timeout = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if not raw_timeout:
+        return default_timeout
+
+    try:
+        timeout = float(raw_timeout)
+    except ValueError:
+        timeout = math.nan
+    if not math.isfinite(timeout):
+        logger.debug(
+            f"Ignoring invalid '{REQUEST_TIMEOUT_HEADER}' header '{raw_timeout}'."
+        )
+        return default_timeout
+
+    if default_timeout is None:
+        return timeout
+    return min(timeout, default_timeout)
+
+
+def header_to_multi_dict(headers: Header) -> MultiDict:
+    """Convert request headers to a tracing carrier."""
+    return MultiDict(
+        [
+            (key, value)
+            for key, value in headers.items()
+            if key.lower() not in ("content-length", "content-encoding")
+        ]
+    )
+
+
+ActionCallException = Union[
+    ActionExecutionRejection,
+    ActionNotFoundException,
+    ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionServerOverloadedException,
+    ActionTimeoutException,
+]
+
+# Exceptions of an action call which are answered with a dedicated status code.
+ACTION_CALL_EXCEPTIONS = (
+    ActionExecutionRejection,
+    ActionNotFoundException,
+    ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionServerOverloadedException,
+    ActionTimeoutException,
+)
+
+
+def action_error_response(exception: ActionCallException) -> HTTPResponse:
+    """Build the error response for an exception raised by an action call.
+
+    Args:
+        exception: The exception raised while running the action.
+
+    Returns:
+        The response with the matching status code.
+    """
+    status, body = action_error_status_and_body(exception)
+    headers = {}
+    if (
+        isinstance(exception, ActionServerOverloadedException)
+        and exception.retry_after is not None
+    ):
+        headers["Retry-After"] = str(math.ceil(exception.retry_after))
+    return response.json(body, status=status, headers=headers)
+
+
+def action_error_status_and_body(
+    exception: ActionCallException,
+) -> Tuple[int, Dict[Text, Any]]:
+    """Return the status code and error body for an exception of an action call."""
+    if isinstance(exception, ActionNotFoundException):
+        logger.error(exception)
+        status = 404
+    elif isinstance(
+        exception, (ActionMissingDomainException, ActionMissingTrackerException)
+    ):
+        logger.debug(exception)
+        status = 449
+    elif isinstance(exception, ActionServerOverloadedException):
+        status = 503
+    elif isinstance(exception, ActionTimeoutException):
+        logger.warning(exception)
+        status = 504
+    else:
+        logger.debug(exception)
+        status = 400
+
+    return status, {"error": exception.message, "action_name": exception.action_name}
+
+
+async def run_action_batch(
+    action_executor: ActionExecutor,
+    action_calls: List[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    timeout: Optional[float] = None,
+) -> List[Dict[Text, Any]]:
+    """Run independent action calls concurrently.
+
+    Args:
+        action_executor: The action executor to use.
+        action_calls: The action calls to run.
+        concurrency: Maximum number of action calls which run at the same time.
+        timeout: Optional number of seconds the whole batch may take. Action
+            calls which are still running or waiting afterwards are cancelled.
+
+    Returns:
+        One item per action call, in the order of `action_calls`. Successful
+        calls have the `status` 200 and the action's `result`, failed calls
+        the `status` and `error` body `/webhook` would have answered with.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+
+    async def _run(action_call: Any) -> Dict[Text, Any]:
+        if not isinstance(action_call, dict):
+            return {"status": 400, "error": "Invalid action call"}
+
+        async with semaphore:
+            try:
+                result = await action_executor.run(
+                    action_call,
+                    timeout=deadline - loop.time() if deadline is not None else None,
+                )
+            except ACTION_CALL_EXCEPTIONS as e:
+                status, body = action_error_status_and_body(e)
+                return {"status": status, **body}
+            except Exception as e:
+                logger.exception(
+                    f"Exception occurred during execution of action "
+                    f"'{action_call.get('next_action')}' in batch."
+                )
+                return {"status": 500, "error": str(e)}
+
+        return {
+            "status": 200,
+            "result": {"events": result.events, "responses": result.responses}
+            if result
+            else None,
+        }
+
+    return await asyncio.gather(*[_run(action_call) for action_call in action_calls])
+
+
+# Fields of a streamed chunk which are forwarded to the client. Mirrors the
+# `Chunk` message of the gRPC transport.
+STREAM_CHUNK_FIELDS = ("text", "image", "custom", "attachment", "buttons", "elements")
+
+
+def build_stream_chunk(
+    chunk_payload: Dict[Text, Any], response_id: Text
+) -> Dict[Text, Any]:
+    """Build the `chunk` message for a `stream_chunk` event of the executor."""
+    chunk = {
+        key: chunk_payload[key] for key in STREAM_CHUNK_FIELDS if key in chunk_payload
+    }
+    chunk["response_id"] = response_id
+    return chunk
+
+
+def encode_stream_message(
+    message: Dict[Text, Any], codec: JSONCodec, use_sse: bool
+) -> bytes:
+    """Frame a streamed message as a server-sent event or an NDJSON line."""
+    if use_sse:
+        return b"data: " + codec.dumps(message) + b"\n\n"
+    return codec.dumps(message) + b"\n"
+
+
+async def _run_action_into_sink(
+    action_executor: ActionExecutor,
+    action_call: Dict[Text, Any],
+    sink: asyncio.Queue,
+    timeout: Optional[float] = None,
+) -> None:
+    """Run the action and make sure a terminal event is placed in the sink.
+
+    `ActionExecutor.run` places `stream_error` in the sink before it re-raises,
+    so exceptions are suppressed here to not leave an unretrieved task
+    exception behind.
+    """
+    try:
+        result = await action_executor.run(action_call, sink=sink, timeout=timeout)
+        if result is None:
+            await sink.put({"event": "stream_done", "result": None})
+    except Exception:
+        pass
+
+
+def configure_readiness(
+    app: Sanic, action_executor: ActionExecutor, readiness_monitor: ReadinessMonitor
+) -> None:
+    """Let every Sanic worker watch its own load if readiness limits are set.
+
+    Args:
+        app: The Sanic application.
+        action_executor: The action executor whose load is watched.
+        readiness_monitor: Decides whether the worker is ready.
+    """
+    if not readiness_monitor.enabled:
+        return
+
+    @app.after_server_start
+    async def start_watching_load(app: Sanic, _: Any) -> None:
+        app.ctx.readiness_task = asyncio.create_task(
+            readiness_monitor.watch(action_executor)
+        )
+
+    @app.before_server_stop
+    async def stop_watching_load(app: Sanic, _: Any) -> None:
+        app.ctx.readiness_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.ctx.readiness_task
+
+
+def configure_metrics_aggregation(app: Sanic, action_executor: ActionExecutor) -> None:
+    """Share the metrics of all Sanic workers through a snapshot directory.
+
+    The main process creates a temporary directory and passes it to the
+    workers via the environment. Every worker periodically stores a snapshot
+    of its metrics there, and the worker serving `/metrics` merges them.
+
+    Args:
+        app: The Sanic application.
+        action_executor: The action executor whose metrics are shared.
+    """
+
+    @app.main_process_start
+    async def create_metrics_directory(app: Sanic, _: Any) -> None:
+        app.ctx.metrics_directory = tempfile.mkdtemp(prefix="rasa-sdk-metrics-")
+        os.environ[ENV_METRICS_DIRECTORY] = app.ctx.metrics_directory
+
+    @app.main_process_stop
+    async def remove_metrics_directory(app: Sanic, _: Any) -> None:
+        os.environ.pop(ENV_METRICS_DIRECTORY, None)
+        shutil.rmtree(app.ctx.metrics_directory, ignore_errors=True)
+
+    @app.after_server_start
+    async def start_writing_snapshots(app: Sanic, _: Any) -> None:
+        directory = os.environ.get(ENV_METRICS_DIRECTORY)
+        app.ctx.metrics_task = (
+            asyncio.create_task(
+                write_snapshots(directory, action_executor.collect_metrics)
+            )
+            if directory
+            else None
+        )
+
+    @app.before_server_stop
+    async def stop_writing_snapshots(app: Sanic, _: Any) -> None:
+        if app.ctx.metrics_task is None:
+            return
+
+        app.ctx.metrics_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.ctx.metrics_task
+        # Keep the counters of this worker after it stopped.
+        with contextlib.suppress(OSError):
+            write_snapshot(
+                os.environ[ENV_METRICS_DIRECTORY], action_executor.collect_metrics()
+            )
+
+
+def configure_auto_reload(app: Sanic, action_executor: ActionExecutor) -> None:
+    """Reload the actions in the background when their modules change.
+
+    The main process watches the action modules and bumps a counter in shared
+    memory once per change. Every worker polls that counter and reloads its
+    executor in a thread, so requests never pay for checking the modules.
+    When the app is served without a main process (e.g. by a test client),
+    the worker watches the modules itself.
+
+    Args:
+        app: The Sanic application.
+        action_executor: The action executor to reload.
+    """
+
+    @app.main_process_start
+    async def start_module_watcher(app: Sanic, _: Any) -> None:
+        generation = multiprocessing.Value("Q", 0)
+        app.shared_ctx.action_reload_generation = generation
+        app.ctx.module_watcher = ModuleWatcher(
+            action_executor.watched_paths(), partial(signal_reload, generation)
+        )
+        app.ctx.module_watcher.start()
+
+    @app.main_process_stop
+    async def stop_module_watcher(app: Sanic, _: Any) -> None:
+        app.ctx.module_watcher.stop()
+
+    @app.before_server_start
+    async def start_reloading(app: Sanic, _: Any) -> None:
+        # Executors unpickled in a worker don't track any module yet, so the
+        # first reload records the current state of the modules.
+        action_executor.reload()
+
+        generation = getattr(app.shared_ctx, "action_reload_generation", None)
+        app.ctx.worker_module_watcher = None
+        if generation is None:
+            generation = multiprocessing.Value("Q", 0)
+            app.ctx.worker_module_watcher = ModuleWatcher(
+                action_executor.watched_paths(), partial(signal_reload, generation)
+            )
+            app.ctx.worker_module_watcher.start()
+
+        app.ctx.reload_task = asyncio.create_task(
+            reload_on_signal(action_executor.reload, generation)
+        )
+
+    @app.before_server_stop
+    async def stop_reloading(app: Sanic, _: Any) -> None:
+        app.ctx.reload_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.ctx.reload_task
+        if app.ctx.worker_module_watcher is not None:
+            app.ctx.worker_module_watcher.stop()
+
+
+def configure_preloaded_workers() -> bool:
+    """Fork the Sanic workers from the primary process instead of spawning them.
+
+    The actions are imported and registered once in the primary process, and
+    the forked workers share the imported code and any state built at import
+    time copy-on-write. Spawned workers instead import the action package and
+    rebuild the registry each.
+
+    Returns:
+        `True` if the workers are forked, `False` if the platform doesn't
+        support forking processes.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning(
+            "Preloading actions requires forking worker processes, which is "
+            "not supported on this platform. Each worker imports the actions."
+        )
+        return False
+
+    Sanic.start_method = "fork"
+    # Move everything allocated so far out of the tracked generations, so that
+    # garbage collections in the workers don't write to (and thereby copy) the
+    # shared memory pages.
+    gc.collect()
+    gc.freeze()
+    return True
+
+
 def create_app(
     action_executor: ActionExecutor,
     cors_origins: Union[Text, List[Text], None] = "*",
     auto_reload: bool = False,
+    json_codec: Optional[Text] = DEFAULT_JSON_CODEC,
+    response_compression_min_size: Optional[int] = (
+        DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE
+    ),
+    compression_offload_threshold: Optional[int] = (
+        DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD
+    ),
+    batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    request_timeout: Optional[float] = None,
+    stream_sink_factory: Callable[[], asyncio.Queue] = StreamSink,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
 ) -> Sanic:
     """Create a Sanic application and return it.
 
     Args:
         action_executor: The action executor to use.
         cors_origins: CORS origins to allow.
-        auto_reload: When `True`, auto-reloading of actions is enabled.
+        auto_reload: When `True`, actions are reloaded in the background
+            whenever their modules change.
+        json_codec: Name of the JSON codec used on the `/webhook` route
+            (`auto`, `json`, `orjson` or `msgspec`).
+        response_compression_min_size: Minimum size in bytes of a response body
+            to be compressed according to the request's `Accept-Encoding`.
+            `None` disables response compression.
+        compression_offload_threshold: Minimum size in bytes of a body to be
+            compressed or decompressed in a thread pool rather than on the
+            event loop. `None` keeps all work on the event loop.
+        batch_concurrency: Maximum number of action calls of a single
+            `/webhook/batch` request which run at the same time.
+        request_timeout: Default number of seconds an action call may take
+            before it is cancelled and answered with status 504. Clients can
+            send a shorter timeout in the `X-Request-Timeout` header. `None`
+            only applies the client's timeout.
+        stream_sink_factory: Creates the queue which receives the events of a
+            `/webhook/stream` call. A bounded `StreamSink` slows down actions
+            which stream faster than the client receives.
+        readiness_monitor: Decides whether `/ready` reports the server as
+            ready. Without a monitor the server is always ready.
 
     Returns:
         A new Sanic application ready to be run.
     """
     app = Sanic("rasa_sdk", configure_logging=False)
+    codec = get_json_codec(json_codec)
 
     # Reset Sanic warnings filter that allows the triggering of Sanic warnings
     warnings.filterwarnings("ignore", category=DeprecationWarning, module=r"sanic.*")
@@ -116,62 +629,58 @@ def create_app(
 
     app.ctx.tracer_provider = None
 
+    configure_metrics_aggregation(app, action_executor)
+    readiness_monitor = readiness_monitor or ReadinessMonitor()
+    configure_readiness(app, action_executor, readiness_monitor)
+    if auto_reload:
+        configure_auto_reload(app, action_executor)
+
+    # Sanic cancels the handler task when the client disconnects, which also
+    # cancels the running action. The timeout additionally stops actions whose
+    # result would arrive after the client stopped waiting.
+    def request_timeout_for(request: Request) -> Optional[float]:
+        return read_request_timeout(request, request_timeout)
+
     @app.get("/health")
     async def health(_) -> HTTPResponse:
         """Ping endpoint to check if the server is running and well."""
         body = {"status": "ok"}
         return response.json(body, status=200)
 
+    @app.get("/ready")
+    async def ready(_) -> HTTPResponse:
+        """Check whether the server should receive further action calls."""
+        status = 200 if readiness_monitor.ready else 503
+        return response.json(readiness_monitor.status(), status=status)
+
     @app.post("/webhook")
     async def webhook(request: Request) -> HTTPResponse:
         """Webhook to retrieve action calls."""
         span_name = "create_app.webhook"
 
-        def header_to_multi_dict(headers: Header) -> MultiDict:
-            return MultiDict(
-                [
-                    (key, value)
-                    for key, value in headers.items()
-                    if key.lower() not in ("content-length", "content-encoding")
-                ]
+        with start_request_span(
+            span_name,
+            request.app.ctx.tracer_provider,
+            partial(header_to_multi_dict, request.headers),
+        ) as span:
+            action_call = await decode_action_call(
+                request, codec, compression_offload_threshold
             )
-
-        tracer, context = get_tracer_and_context(
-            span_name=span_name,
-            tracer_provider=request.app.ctx.tracer_provider,
-            tracing_carrier=header_to_multi_dict(request.headers),
-        )
-
-        with tracer.start_as_current_span(span_name, context=context) as span:
-            if request.headers.get("Content-Encoding") == "deflate":
-                # Decompress the request data using zlib
-                decompressed_data = zlib.decompress(request.body)
-                # Load the JSON data from the decompressed request data
-                action_call = json.loads(decompressed_data)
-            else:
-                action_call = request.json
             if action_call is None:
                 body = {"error": "Invalid body request"}
                 return response.json(body, status=400)
 
             utils.check_version_compatibility(action_call.get("version"))
+            action_executor.metrics.request_size.observe(
+                len(request.body), "http", "/webhook"
+            )
 
-            if auto_reload:
-                action_executor.reload()
             try:
-                result = await action_executor.run(action_call)
-            except ActionExecutionRejection as e:
-                logger.debug(e)
-                body = {"error": e.message, "action_name": e.action_name}
-                return response.json(body, status=400)
-            except ActionNotFoundException as e:
-                logger.error(e)
-                body = {"error": e.message, "action_name": e.action_name}
-                return response.json(body, status=404)
-            except ActionMissingDomainException as e:
-                logger.debug(e)
-                body = {"error": e.message, "action_name": e.action_name}
-                return response.json(body, status=449)
+                result = await action_executor.run(
+                    action_call, timeout=request_timeout_for(request)
+                )
+            except ACTION_CALL_EXCEPTIONS as e:
+                return action_error_response(e)
 
             set_http_span_attributes(
                 span,
@@ -180,22 +689,226 @@ def create_app(
                 route="/webhook",
             )
 
-            return response.json(
-                result.model_dump() if result else None,
-                status=200,
+            body = encode_action_result(result, codec)
+            action_executor.metrics.response_size.observe(len(body), "http", "/webhook")
+            return await encoded_response(
+                request,
+                body,
+                response_compression_min_size,
+                compression_offload_threshold,
+            )
+
+    @app.post("/webhook/stream")
+    async def webhook_stream(request: Request) -> Optional[HTTPResponse]:
+        """Webhook to retrieve action calls and stream the response chunks.
+
+        The response is sent with chunked transfer encoding as newline
+        delimited JSON, or as server-sent events if the client accepts
+        `text/event-stream`. Every message has the shape of a gRPC
+        `WebhookStreamEvent`: `chunk_start`, `chunk` and `chunk_end` for each
+        streamed response, followed by a single `final_result` or `error`.
+        """
+        span_name = "create_app.webhook_stream"
+
+        with start_request_span(
+            span_name,
+            request.app.ctx.tracer_provider,
+            partial(header_to_multi_dict, request.headers),
+        ) as span:
+            action_call = await decode_action_call(
+                request, codec, compression_offload_threshold
+            )
+            if action_call is None:
+                body = {"error": "Invalid body request"}
+                return response.json(body, status=400)
+
+            utils.check_version_compatibility(action_call.get("version"))
+            action_executor.metrics.request_size.observe(
+                len(request.body), "http", "/webhook/stream"
+            )
+
+            sink = stream_sink_factory()
+            run_task = asyncio.ensure_future(
+                _run_action_into_sink(
+                    action_executor, action_call, sink, request_timeout_for(request)
+                )
+            )
+            try:
+                chunk = await sink.get()
+                if chunk.get("event") == "stream_error":
+                    # Nothing has been sent yet, so errors raised before the
+                    # action produced any output get a regular status code.
+                    exception = chunk.get("exception")
+                    if isinstance(exception, ACTION_CALL_EXCEPTIONS):
+                        return action_error_response(exception)
+                    raise exception
+
+                use_sse = "text/event-stream" in request.headers.get("Accept", "")
+                stream = await request.respond(
+                    content_type="text/event-stream"
+                    if use_sse
+                    else "application/x-ndjson"
+                )
+                action_name = action_call.get("next_action", "")
+                response_id = ""
+                sent_bytes = 0
+                while True:
+                    event_type = chunk.get("event")
+                    message: Optional[Dict[Text, Any]] = None
+                    if event_type == "stream_start":
+                        response_id = uuid.uuid4().hex
+                        message = {"chunk_start": {"response_id": response_id}}
+                    elif event_type == "stream_chunk":
+                        message = {"chunk": build_stream_chunk(chunk, response_id)}
+                    elif event_type == "stream_end":
+                        message = {"chunk_end": {"response_id": response_id}}
+                    elif event_type == "stream_done":
+                        result = chunk.get("result")
+                        if result is not None:
+                            message = {
+                                "final_result": {
+                                    "events": result.events,
+                                    "responses": result.responses,
+                                }
+                            }
+                        set_http_span_attributes(
+                            span,
+                            action_call,
+                            http_method="POST",
+                            route="/webhook/stream",
+                        )
+                    else:
+                        exception = chunk.get("exception")
+                        logger.error(exception)
+                        message = {
+                            "error": {
+                                "action_name": action_name,
+                                "message": str(exception),
+                            }
+                        }
+
+                    if message is not None:
+                        data = encode_stream_message(message, codec, use_sse)
+                        sent_bytes += len(data)
+                        await stream.send(data)
+                    if event_type in ("stream_done", "stream_error"):
+                        break
+                    chunk = await sink.get()
+
+                await stream.eof()
+                action_executor.metrics.response_size.observe(
+                    sent_bytes, "http", "/webhook/stream"
+                )
+                return None
+            finally:
+                if not run_task.done():
+                    run_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await run_task
+
+    @app.post("/webhook/batch")
+    async def webhook_batch(request: Request) -> HTTPResponse:
+        """Webhook to run a list of independent action calls concurrently."""
+        span_name = "create_app.webhook_batch"
+
+        with start_request_span(
+            span_name,
+            request.app.ctx.tracer_provider,
+            partial(header_to_multi_dict, request.headers),
+        ) as span:
+            action_calls = await decode_action_call(
+                request, codec, compression_offload_threshold
+            )
+            if not isinstance(action_calls, list):
+                body = {"error": "Invalid body request, expected a list"}
+                return response.json(body, status=400)
+
+            action_executor.metrics.request_size.observe(
+                len(request.body), "http", "/webhook/batch"
+            )
+            for version in {
+                action_call.get("version")
+                for action_call in action_calls
+                if isinstance(action_call, dict)
+            }:
+                utils.check_version_compatibility(version)
+
+            results = await run_action_batch(
+                action_executor,
+                action_calls,
+                batch_concurrency,
+                request_timeout_for(request),
+            )
+
+            if span.is_recording():
+                span.set_attribute("http.method", "POST")
+                span.set_attribute("http.route", "/webhook/batch")
+                span.set_attribute("batch_size", len(action_calls))
+
+            body = codec.dumps(results)
+            action_executor.metrics.response_size.observe(
+                len(body), "http", "/webhook/batch"
+            )
+            return await encoded_response(
+                request,
+                body,
+                response_compression_min_size,
+                compression_offload_threshold,
+            )
+
+    @app.route("/domain/<domain_digest:str>", methods=["GET", "PUT"])
+    async def domain(request: Request, domain_digest: Text) -> HTTPResponse:
+        """Register a domain ahead of the action calls.
+
+        `PUT` stores the domain sent in the body under its digest, so action
+        calls only need to send `domain_digest`. `GET` only checks whether the
+        server already holds the domain with the digest.
+        """
+        domain = None
+        if request.method == "PUT":
+            domain = await decode_action_call(
+                request, codec, compression_offload_threshold
             )
+            if not isinstance(domain, dict):
+                body = {"error": "Invalid body request"}
+                return response.json(body, status=400)
+
+        known = await action_executor.register_domain(domain_digest, domain)
+        return response.json({"domain_digest": domain_digest, "known": known})
+
+    @app.get("/admission")
+    async def admission(_) -> HTTPResponse:
+        """Report the in-flight actions, wait queue depth and shed calls."""
+        if action_executor.admission_controller is None:
+            body = {"error": "Admission control is not enabled."}
+            return response.json(body, status=404)
+
+        return response.json(action_executor.admission_controller.stats())
+
+    @app.get("/metrics")
+    async def metrics_endpoint(_) -> HTTPResponse:
+        """Expose the metrics of all workers in the Prometheus text format."""
+        snapshot = action_executor.collect_metrics()
+        directory = os.environ.get(ENV_METRICS_DIRECTORY)
+        if directory:
+            snapshot = await load_snapshots(directory, snapshot)
+        return response.text(
+            render_snapshot(snapshot), content_type=METRICS_CONTENT_TYPE
+        )
 
     @app.get("/actions")
-    async def actions(_) -> HTTPResponse:
+    async def actions(request: Request) -> HTTPResponse:
         """List all registered actions."""
-        if auto_reload:
-            action_executor.reload()
-
         body = [
             action_name_item.model_dump()
             for action_name_item in action_executor.list_actions()
         ]
-        return response.json(body, status=200)
+        return await encoded_response(
+            request,
+            codec.dumps(body),
+            response_compression_min_size,
+            compression_offload_threshold,
+        )
 
     @app.exception(Exception)
     async def exception_handler(request, exception: Exception):
@@ -215,15 +928,38 @@ def create_app_for_serve(
     auto_reload: bool = False,
     endpoints: str = DEFAULT_ENDPOINTS_PATH,
     keep_alive_timeout: int = DEFAULT_KEEP_ALIVE_TIMEOUT,
+    json_codec: Optional[Text] = DEFAULT_JSON_CODEC,
+    response_compression_min_size: Optional[int] = (
+        DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE
+    ),
+    compression_offload_threshold: Optional[int] = (
+        DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD
+    ),
+    batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    request_timeout: Optional[float] = None,
+    stream_sink_factory: Callable[[], asyncio.Queue] = StreamSink,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
+    fast_event_loop: bool = False,
 ) -> Sanic:
     """Build a Sanic app for the primary process and each worker.
 
     Must be module-level so ``Sanic.serve`` can pickle it via ``AppLoader``.
+    With ``fast_event_loop``, the event loop the worker creates afterwards
+    is a ``uvloop`` loop with eager tasks, see ``use_fast_event_loop``.
     """
+    if fast_event_loop:
+        use_fast_event_loop()
     app = create_app(
         action_executor,
         cors_origins=cors_origins,
         auto_reload=auto_reload,
+        json_codec=json_codec,
+        response_compression_min_size=response_compression_min_size,
+        compression_offload_threshold=compression_offload_threshold,
+        batch_concurrency=batch_concurrency,
+        request_timeout=request_timeout,
+        stream_sink_factory=stream_sink_factory,
+        readiness_monitor=readiness_monitor,
     )
     app.config.KEEP_ALIVE_TIMEOUT = keep_alive_timeout
     app.register_listener(
@@ -245,11 +981,40 @@ def run(
     auto_reload: bool = False,
     endpoints: str = DEFAULT_ENDPOINTS_PATH,
     keep_alive_timeout: int = DEFAULT_KEEP_ALIVE_TIMEOUT,
+    json_codec: Optional[Text] = DEFAULT_JSON_CODEC,
+    response_compression_min_size: Optional[int] = (
+        DEFAULT_RESPONSE_COMPRESSION_MIN_SIZE
+    ),
+    compression_offload_threshold: Optional[int] = (
+        DEFAULT_COMPRESSION_OFFLOAD_THRESHOLD
+    ),
+    batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    request_timeout: Optional[float] = None,
+    stream_sink_factory: Callable[[], asyncio.Queue] = StreamSink,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
+    fast_event_loop: bool = False,
+    unix_socket: Optional[Text] = None,
+    preload: bool = False,
 ) -> None:
-    """Starts the action endpoint server with given config values."""
+    """Starts the action endpoint server with given config values.
+
+    When `unix_socket` is set, the server listens on that Unix domain socket
+    instead of `port`. When `preload` is set, the workers are forked from the
+    primary process, which already imported the actions. When
+    `fast_event_loop` is set, every worker runs on a `uvloop` loop with eager
+    tasks if available.
+    """
     logger.info("Starting action endpoint server...")
 
-    loader = AppLoader(
+    workers = utils.number_of_sanic_workers()
+    temporary_domain_store = None
+    if workers > 1 and action_executor.domain_store is None:
+        # Share the domain between the workers, so that a domain sent to one
+        # of them doesn't need to be sent to each of the others as well.
+        temporary_domain_store = DomainStore.create_temporary()
+        action_executor.domain_store = temporary_domain_store
+
+    loader: Optional[AppLoader] = AppLoader(
         factory=partial(
             create_app_for_serve,
             action_executor,
@@ -257,6 +1022,14 @@ def run(
             auto_reload=auto_reload,
             endpoints=endpoints,
             keep_alive_timeout=keep_alive_timeout,
+            json_codec=json_codec,
+            response_compression_min_size=response_compression_min_size,
+            compression_offload_threshold=compression_offload_threshold,
+            batch_concurrency=batch_concurrency,
+            request_timeout=request_timeout,
+            stream_sink_factory=stream_sink_factory,
+            readiness_monitor=readiness_monitor,
+            fast_event_loop=fast_event_loop,
         )
     )
     app = loader.load()
@@ -265,7 +1038,13 @@ def run(
     protocol = "https" if ssl_config else "http"
     host = os.environ.get("SANIC_HOST", "0.0.0.0")
 
-    logger.info(f"Action endpoint is up and running on {protocol}://{host}:{port}")
+    if unix_socket:
+        logger.info(
+            f"Action endpoint is up and running on {protocol} "
+            f"over unix socket {unix_socket}"
+        )
+    else:
+        logger.info(f"Action endpoint is up and running on {protocol}://{host}:{port}")
 
     # Sanic 25 removed ``legacy=True`` from ``app.run``. Use prepare + serve so
     # AppLoader recreates the app (listeners, plugins, config) in each worker.
@@ -273,9 +1052,18 @@ def run(
         host=host,
         port=port,
         ssl=ssl_config,
-        workers=utils.number_of_sanic_workers(),
+        workers=workers,
+        unix=unix_socket,
     )
-    Sanic.serve(primary=app, app_loader=loader)
+    if preload and configure_preloaded_workers():
+        # Without a loader the forked workers serve the app they inherited
+        # from the primary process instead of building it again.
+        loader = None
+    try:
+        Sanic.serve(primary=app, app_loader=loader)
+    finally:
+        if temporary_domain_store is not None:
+            temporary_domain_store.remove()
 
 
 def set_http_span_attributes(
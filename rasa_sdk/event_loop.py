@@ -0,0 +1,45 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Create a policy whose event loops run action calls as fast as possible.
+
+    The loops are `uvloop` loops if `uvloop` is installed. On Python 3.12+
+    they additionally use `asyncio.eager_task_factory`, which runs a new task
+    right away until it first has to wait, instead of scheduling it for the
+    next iteration of the loop. Tasks which finish without waiting, e.g. the
+    calls of actions which don't do any I/O, then never wait for the loop.
+
+    Returns:
+        The event loop policy.
+    """
+    try:
+        import uvloop
+
+        base_policy = uvloop.EventLoopPolicy
+    except ImportError:
+        logger.info("uvloop is not installed. Using the default asyncio event loop.")
+        base_policy = asyncio.DefaultEventLoopPolicy
+
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return base_policy()
+
+    class EagerTaskEventLoopPolicy(base_policy):  # type: ignore[valid-type,misc]
+        def new_event_loop(self) -> asyncio.AbstractEventLoop:
+            loop = super().new_event_loop()
+            loop.set_task_factory(eager_task_factory)
+            return loop
+
+    return EagerTaskEventLoopPolicy()
+
+
+def use_fast_event_loop() -> None:
+    """Create the event loops of this process with `create_event_loop_policy`.
+
+    Only affects event loops which are created afterwards.
+    """
+    asyncio.set_event_loop_policy(create_event_loop_policy())
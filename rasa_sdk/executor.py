@@ -1,16 +1,21 @@
 from __future__ import annotations
 import asyncio
+import contextlib
 import importlib
 import inspect
 import logging
 import pkgutil
+import time
 import warnings
 from typing import (
     Any,
+    AsyncContextManager,
     Awaitable,
     Callable,
     Dict,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Set,
     Text,
@@ -19,6 +24,7 @@ from typing import (
     cast,
 )
 from collections import namedtuple
+from functools import partial
 import types
 import sys
 import os
@@ -30,9 +36,18 @@ from rasa_sdk.interfaces import (
     ActionNotFoundException,
     Action,
     ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionTimeoutException,
 )
 
 from rasa_sdk import utils
+from rasa_sdk.admission import AdmissionController
+from rasa_sdk.domain_store import DomainStore
+from rasa_sdk.grpc_tracker import ProtoTrackerState, events_to_dicts, raw_events
+from rasa_sdk.metrics import UNKNOWN_ACTION_LABEL, ActionServerMetrics
+from rasa_sdk.response_cache import ResponseCache
+from rasa_sdk.thread_pool import SyncThreadPool, call_action_code, use_thread_pool
+from rasa_sdk.tracker_cache import TrackerCache
 
 logger = logging.getLogger(__name__)
 
@@ -402,6 +417,19 @@ class ActionExecutorRunResult(BaseModel):
     responses: List[Dict[Text, Any]] = Field(alias="responses")
 
 
+class _ActionRegistry(NamedTuple):
+    """The registered actions together with their registration options."""
+
+    actions: Dict[Text, Callable]
+    timeouts: Dict[Text, float]
+    threaded: Set[Text]
+
+    def copy(self) -> "_ActionRegistry":
+        return _ActionRegistry(
+            dict(self.actions), dict(self.timeouts), set(self.threaded)
+        )
+
+
 class ActionExecutor:
     """Register and execute custom actions.
 
@@ -424,9 +452,51 @@ class ActionExecutor:
     queue, …) and should not own a queue that only the caller can consume.
     """
 
-    def __init__(self) -> None:
-        """Initializes the `ActionExecutor`."""
+    def __init__(
+        self,
+        admission_controller: Optional[AdmissionController] = None,
+        metrics: Optional[ActionServerMetrics] = None,
+        domain_store: Optional[DomainStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        tracker_cache: Optional[TrackerCache] = None,
+        default_action_timeout: Optional[float] = None,
+        sync_thread_pool: Optional[SyncThreadPool] = None,
+    ) -> None:
+        """Initializes the `ActionExecutor`.
+
+        Args:
+            admission_controller: Limits the number of concurrently running
+                actions. When `None`, every call runs immediately.
+            metrics: Metrics which record the action calls. A new set of
+                metrics is created when omitted.
+            domain_store: Shares received domains with the other worker
+                processes. When `None`, each process only knows the domains
+                sent to it.
+            response_cache: De-duplicates retried action calls. When `None`,
+                every call runs the action.
+            tracker_cache: Keeps the events of recent conversations, so that
+                clients may send incremental trackers. When `None`, every
+                call must contain the full tracker.
+            default_action_timeout: Number of seconds an action may run before
+                it's cancelled, unless it was registered with its own timeout.
+                When `None`, such actions may run indefinitely.
+            sync_thread_pool: Runs synchronous actions and form helpers, so that
+                blocking code doesn't block the event loop. When `None`, such
+                code runs directly in the event loop.
+        """
+        self.admission_controller = admission_controller
+        self.metrics = metrics or ActionServerMetrics()
+        self.domain_store = domain_store
+        self.response_cache = response_cache
+        self.tracker_cache = tracker_cache
         self.actions: Dict[Text, Callable] = {}
+        self.default_action_timeout = default_action_timeout
+        self.action_timeouts: Dict[Text, float] = {}
+        self.sync_thread_pool = sync_thread_pool
+        # Actions whose synchronous code may run in `sync_thread_pool`.
+        self.threaded_actions: Set[Text] = set()
+        # Incremented whenever a reload publishes a new `actions` registry.
+        self.registry_version = 0
         self._modules: Dict[Text, TimestampModule] = {}
         self._registered_packages: Set[Text] = set()
         self.domain: Optional[Dict[Text, Any]] = None
@@ -445,6 +515,11 @@ class ActionExecutor:
             action: Action to be registered. It can either be an instance of
             `Action` subclass class or an actual `Action` subclass.
         """
+        self._register_action(action, self._registry)
+
+    def _register_action(
+        self, action: Union[Type[Action], Action], registry: _ActionRegistry
+    ) -> None:
         if inspect.isclass(action):
             action = cast(Type[Action], action)
             if action.__module__.startswith("rasa."):
@@ -454,7 +529,13 @@ class ActionExecutor:
                 action = action()
 
         if isinstance(action, Action):
-            self.register_function(action.name(), action.run)
+            self._register_function(
+                action.name(),
+                action.run,
+                action.timeout,
+                action.run_in_thread,
+                registry,
+            )
         else:
             raise Exception(
                 "You can only register instances or subclasses of "
@@ -462,13 +543,34 @@ class ActionExecutor:
                 "a function, use `register_function` instead."
             )
 
-    def register_function(self, action_name: Text, f: Callable) -> None:
+    def register_function(
+        self,
+        action_name: Text,
+        f: Callable,
+        timeout: Optional[float] = None,
+        run_in_thread: bool = True,
+    ) -> None:
         """Register an executor function for an action.
 
         Args:
             action_name: Name of the action.
             f: Function to be registered.
+            timeout: Number of seconds the function may run before it's
+                cancelled. When `None`, the executor's default timeout applies.
+            run_in_thread: Whether a synchronous `f` runs in the executor's
+                `sync_thread_pool`. Disable it for fast functions which may run
+                directly in the event loop.
         """
+        self._register_function(action_name, f, timeout, run_in_thread, self._registry)
+
+    @staticmethod
+    def _register_function(
+        action_name: Text,
+        f: Callable,
+        timeout: Optional[float],
+        run_in_thread: bool,
+        registry: _ActionRegistry,
+    ) -> None:
         valid_keys = utils.arguments_of(f)
         if len(valid_keys) < 3:
             raise Exception(
@@ -479,12 +581,40 @@ class ActionExecutor:
                 "parameters."
             )
 
-        if action_name in self.actions:
+        if action_name in registry.actions:
             logger.info(f"Re-registered function for '{action_name}'.")
         else:
             logger.info(f"Registered function for '{action_name}'.")
 
-        self.actions[action_name] = f
+        registry.actions[action_name] = f
+        if timeout is None:
+            registry.timeouts.pop(action_name, None)
+        else:
+            registry.timeouts[action_name] = timeout
+        if run_in_thread:
+            registry.threaded.add(action_name)
+        else:
+            registry.threaded.discard(action_name)
+
+    @property
+    def _registry(self) -> _ActionRegistry:
+        """The published registry, which requests read."""
+        return _ActionRegistry(
+            self.actions, self.action_timeouts, self.threaded_actions
+        )
+
+    @contextlib.contextmanager
+    def _staged_registry(self) -> Iterator[_ActionRegistry]:
+        """Register actions into a copy of the registry and publish it at once.
+
+        Reloads run outside the request path while actions keep executing, so
+        requests must see either the old or the new registry, never a mix. The
+        copy is only published if registering into it succeeded.
+        """
+        staged = self._registry.copy()
+        yield staged
+        self.actions, self.action_timeouts, self.threaded_actions = staged
+        self.registry_version += 1
 
     def _import_submodules(
         self, package: Union[Text, types.ModuleType], recursive: bool = True
@@ -562,10 +692,18 @@ class ActionExecutor:
 
         self._register_all_actions()
 
-    def _register_all_actions(self) -> None:
-        """Scan for all user subclasses of `Action`, and register them."""
+    def _register_all_actions(self, registry: Optional[_ActionRegistry] = None) -> None:
+        """Scan for all user subclasses of `Action`, and register them.
+
+        Args:
+            registry: Registry to register the actions into. Defaults to the
+                published registry.
+        """
         import inspect
 
+        if registry is None:
+            registry = self._registry
+
         actions = utils.all_subclasses(Action)
 
         for action in actions:
@@ -576,7 +714,7 @@ class ActionExecutor:
                 and not action.__module__.startswith("rasa_core_sdk.")
                 and not inspect.isabstract(action)
             ):
-                self.register_action(action)
+                self._register_action(action, registry)
 
     def _find_modules_to_reload(self) -> Dict[Text, TimestampModule]:
         """Finds all Python modules that should be reloaded.
@@ -601,7 +739,7 @@ class ActionExecutor:
 
         return to_reload
 
-    def reload(self) -> None:
+    def reload(self) -> bool:
         """Reload all Python modules that have been loaded in the past.
 
         To check if a module should be reloaded, the file's last timestamp is
@@ -614,7 +752,11 @@ class ActionExecutor:
 
         If one or more modules are reloaded during this process, the entire
         `Action` class hierarchy is scanned again to see what new classes can
-        be registered.
+        be registered. The updated registry replaces `actions` in a single
+        assignment.
+
+        Returns:
+            `True` if any module was reloaded or discovered.
         """
         to_reload = self._find_modules_to_reload()
         any_module_reloaded = False
@@ -654,7 +796,23 @@ class ActionExecutor:
                 )
 
         if any_module_reloaded:
-            self._register_all_actions()
+            with self._staged_registry() as registry:
+                self._register_all_actions(registry)
+
+        return any_module_reloaded
+
+    def watched_paths(self) -> List[Text]:
+        """Return the files and package directories which auto-reload watches.
+
+        Returns:
+            The files of all imported action modules and the directories of
+            all registered packages, so that new modules are noticed as well.
+        """
+        paths = set(self._modules)
+        for package_name in self._registered_packages:
+            package = sys.modules.get(package_name)
+            paths.update(getattr(package, "__path__", []))
+        return sorted(paths)
 
     @staticmethod
     def _create_api_response(
@@ -745,24 +903,191 @@ class ActionExecutor:
         payload_domain = payload.get("domain")
         payload_domain_digest = payload.get("domain_digest")
 
-        # If digest is invalid and no domain is available - raise the error
         if (
-            not self.is_domain_digest_valid(payload_domain_digest)
-            and payload_domain is None
+            payload_domain is None
+            and not self.is_domain_digest_valid(payload_domain_digest)
+            and not self._load_shared_domain(payload_domain_digest)
         ):
+            # If digest is invalid and no domain is available - raise the error
             raise ActionMissingDomainException(action_name)
 
         if payload_domain:
-            self.domain = payload_domain
-            self.domain_digest = payload_domain_digest
+            self._set_domain(payload_domain_digest, payload_domain)
 
         return self.domain
 
+    async def _update_domain(
+        self, payload: Dict[Text, Any], action_name: Text
+    ) -> Optional[Dict[Text, Any]]:
+        """Like `update_and_return_domain`, without blocking the event loop.
+
+        The domain store is read and written in a thread.
+        """
+        payload_domain = payload.get("domain")
+        payload_domain_digest = payload.get("domain_digest")
+
+        if (
+            payload_domain is None
+            and not self.is_domain_digest_valid(payload_domain_digest)
+            and not await self._load_shared_domain_async(payload_domain_digest)
+        ):
+            raise ActionMissingDomainException(action_name)
+
+        if payload_domain:
+            await self._set_domain_async(payload_domain_digest, payload_domain)
+
+        return self.domain
+
+    async def register_domain(
+        self, domain_digest: Text, domain: Optional[Dict[Text, Any]] = None
+    ) -> bool:
+        """Make the domain with the given digest the current domain.
+
+        Later action calls only need to send the digest instead of the domain.
+
+        Args:
+            domain_digest: Digest of the domain.
+            domain: The domain. When `None`, the executor only checks whether it
+                already holds the domain.
+
+        Returns:
+            `True` if the executor, or the domain store shared with other
+            workers, already held the domain with the given digest.
+        """
+        if self.is_domain_digest_valid(
+            domain_digest
+        ) or await self._load_shared_domain_async(domain_digest):
+            return True
+
+        if domain is not None:
+            logger.debug(f"Registered domain '{domain_digest}'.")
+            await self._set_domain_async(domain_digest, domain)
+        return False
+
+    def _store_for_new_domain(
+        self, domain_digest: Optional[Text]
+    ) -> Optional[DomainStore]:
+        """Return the domain store if the domain with the digest must be added."""
+        if domain_digest and domain_digest != self.domain_digest:
+            return self.domain_store
+        return None
+
+    def _set_domain(
+        self, domain_digest: Optional[Text], domain: Dict[Text, Any]
+    ) -> None:
+        domain_store = self._store_for_new_domain(domain_digest)
+        if domain_store is not None and domain_digest not in domain_store:
+            domain_store.put(domain_digest, domain)
+        self.domain = domain
+        self.domain_digest = domain_digest
+
+    async def _set_domain_async(
+        self, domain_digest: Optional[Text], domain: Dict[Text, Any]
+    ) -> None:
+        """Like `_set_domain`, writing the domain store in a thread."""
+        domain_store = self._store_for_new_domain(domain_digest)
+        self.domain = domain
+        self.domain_digest = domain_digest
+        if domain_store is not None:
+            await domain_store.store(domain_digest, domain)
+
+    def _load_shared_domain(self, domain_digest: Optional[Text]) -> bool:
+        """Load a domain which another worker received from the domain store.
+
+        Returns:
+            `True` if the domain was found and is now the current domain.
+        """
+        if self.domain_store is None or not domain_digest:
+            return False
+
+        return self._use_shared_domain(
+            domain_digest, self.domain_store.get(domain_digest)
+        )
+
+    async def _load_shared_domain_async(self, domain_digest: Optional[Text]) -> bool:
+        """Like `_load_shared_domain`, reading the domain store in a thread."""
+        if self.domain_store is None or not domain_digest:
+            return False
+
+        return self._use_shared_domain(
+            domain_digest, await self.domain_store.load(domain_digest)
+        )
+
+    def _use_shared_domain(
+        self, domain_digest: Text, domain: Optional[Dict[Text, Any]]
+    ) -> bool:
+        if domain is None:
+            return False
+
+        logger.debug(f"Loaded domain '{domain_digest}' from the domain store.")
+        self.domain = domain
+        self.domain_digest = domain_digest
+        return True
+
+    def complete_tracker(
+        self, action_call: Dict[Text, Any], action_name: Text
+    ) -> Dict[Text, Any]:
+        """Complete an incremental tracker and cache the events of the call.
+
+        An action call with a `tracker_base_event_count` only contains the
+        events appended after that many events of the conversation. They are
+        prepended from the executor's tracker cache.
+
+        Args:
+            action_call: Request payload containing the tracker.
+            action_name: Name of the action that should be executed.
+
+        Returns:
+            The action call with the full tracker.
+
+        Raises:
+            ActionMissingTrackerException: The call contains an incremental
+                tracker but the executor doesn't hold the preceding events.
+        """
+        tracker_state = action_call.get("tracker")
+        base_event_count = action_call.get("tracker_base_event_count")
+        if not tracker_state or (
+            self.tracker_cache is None and base_event_count is None
+        ):
+            return action_call
+
+        sender_id = tracker_state.get("sender_id")
+        if base_event_count is None:
+            # Cached without converting them, since the action may not read
+            # the events of a gRPC call at all.
+            events = raw_events(tracker_state)
+        else:
+            if self.tracker_cache is None or not sender_id:
+                raise ActionMissingTrackerException(action_name, sender_id)
+
+            full_events = self.tracker_cache.events(
+                sender_id, base_event_count, tracker_state.get("events") or []
+            )
+            if full_events is None:
+                raise ActionMissingTrackerException(action_name, sender_id)
+
+            events = events_to_dicts(full_events)
+            action_call = {
+                key: value
+                for key, value in action_call.items()
+                if key != "tracker_base_event_count"
+            }
+            action_call["tracker"] = (
+                tracker_state.replace("events", events)
+                if isinstance(tracker_state, ProtoTrackerState)
+                else {**tracker_state, "events": events}
+            )
+
+        if sender_id:
+            self.tracker_cache.store(sender_id, events)
+        return action_call
+
     async def run(
         self,
         action_call: Dict[Text, Any],
         sink: Optional[asyncio.Queue] = None,
         dispatcher: Optional["CollectingDispatcher"] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[ActionExecutorRunResult]:
         """Run the action and return the response.
 
@@ -799,52 +1124,63 @@ class ActionExecutor:
                 gRPC ``WebhookStream`` handler) that need to hold a reference to
                 the dispatcher before the action runs — e.g. to register it in a
                 cancellation registry — should pass it here.
+            timeout: Optional number of seconds the call may take, including
+                the time spent waiting for admission. The action is cancelled
+                once the timeout expires.
+
+        When the executor has a :class:`~rasa_sdk.response_cache.ResponseCache`,
+        identical unary calls share one execution and finished results are
+        returned again to retried calls.
 
         Returns:
             Response containing the events and messages, or ``None`` if no
             action name was provided in *action_call*.
-        """
-        from rasa_sdk.interfaces import Tracker
 
+        Raises:
+            ActionMissingTrackerException: If the call contains an incremental
+                tracker whose earlier events aren't cached.
+            ActionServerOverloadedException: If the executor's admission
+                controller rejected the call.
+            ActionTimeoutException: If the action did not finish within
+                *timeout* seconds or within the timeout it was registered with.
+        """
         action_name = action_call.get("next_action")
         if action_name:
             logger.debug(f"Received request to run '{action_name}'")
+            action = self.actions.get(action_name)
+            action_label = action_name if action else UNKNOWN_ACTION_LABEL
             try:
-                action = self.actions.get(action_name)
                 if not action:
                     raise ActionNotFoundException(action_name)
 
-                tracker_json = action_call["tracker"]
-                domain = self.update_and_return_domain(action_call, action_name)
-                tracker = Tracker.from_dict(tracker_json)
-                if dispatcher is None:
-                    dispatcher = CollectingDispatcher()
-                if sink is not None:
-                    dispatcher._stream_sink = sink.put
-
-                events = await utils.call_potential_coroutine(
-                    action(dispatcher, tracker, domain)
+                action_call = self.complete_tracker(action_call, action_name)
+                run_action = partial(
+                    self._admit_and_run_action,
+                    action,
+                    action_name,
+                    action_call,
+                    sink,
+                    dispatcher,
                 )
-
-                if dispatcher.is_streaming_active:
-                    logger.warning(
-                        f"Action '{action_name}' called stream_start() / "
-                        f"stream_chunk() but never called stream_end(). "
-                        "Closing the stream automatically."
-                    )
-                    await dispatcher.stream_end()
-
-                if not events:
-                    # make sure the action did not just return `None`...
-                    events = []
-
-                validated_events = self.validate_events(events, action_name)
-                result = self._create_api_response(
-                    validated_events, dispatcher.messages
+                cache_key = (
+                    self.response_cache.key(action_call)
+                    # Streamed chunks can't be replayed to another caller.
+                    if self.response_cache is not None
+                    and sink is None
+                    and dispatcher is None
+                    else None
+                )
+                result = await self._with_timeout(
+                    self.response_cache.get_or_run(cache_key, run_action)
+                    if cache_key is not None
+                    else run_action(),
+                    action_name,
+                    timeout,
                 )
                 if sink is not None:
                     await sink.put({"event": "stream_done", "result": result})
             except Exception as exc:
+                self.metrics.action_errors.inc(action_label, type(exc).__name__)
                 if sink is not None:
                     await sink.put({"event": "stream_error", "exception": exc})
                 raise
@@ -855,6 +1191,126 @@ class ActionExecutor:
         logger.warning("Received an action call without an action.")
         return None
 
+    async def _admit_and_run_action(
+        self,
+        action: Callable,
+        action_name: Text,
+        action_call: Dict[Text, Any],
+        sink: Optional[asyncio.Queue],
+        dispatcher: Optional["CollectingDispatcher"],
+    ) -> ActionExecutorRunResult:
+        async with self._admit(action_name):
+            with self._measure(action_name):
+                return await self._with_timeout(
+                    self._run_action(
+                        action, action_name, action_call, sink, dispatcher
+                    ),
+                    action_name,
+                    self.action_timeouts.get(action_name, self.default_action_timeout),
+                )
+
+    @staticmethod
+    async def _with_timeout(
+        coroutine: Awaitable[ActionExecutorRunResult],
+        action_name: Text,
+        timeout: Optional[float],
+    ) -> ActionExecutorRunResult:
+        """Await `coroutine`, cancelling it once `timeout` seconds passed."""
+        if timeout is None:
+            return await coroutine
+
+        try:
+            return await asyncio.wait_for(coroutine, max(timeout, 0.0))
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Cancelled action '{action_name}' since it didn't finish within "
+                f"{timeout:g} seconds."
+            )
+            raise ActionTimeoutException(action_name, timeout=timeout) from None
+
+    def _admit(self, action_name: Text) -> AsyncContextManager[None]:
+        """Reserve capacity for running `action_name` if admission is limited."""
+        if self.admission_controller is None:
+            return contextlib.nullcontext()
+        return self.admission_controller.admit(action_name)
+
+    @contextlib.contextmanager
+    def _measure(self, action_name: Text) -> Iterator[None]:
+        """Track the running action in the in-flight gauge and its duration."""
+        self.metrics.actions_in_flight.inc(action_name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.actions_in_flight.dec(action_name)
+            self.metrics.action_duration.observe(
+                time.perf_counter() - start, action_name
+            )
+
+    def _counting_sink(
+        self, put: Callable[[Dict[Text, Any]], Awaitable[None]], action_name: Text
+    ) -> Callable[[Dict[Text, Any]], Awaitable[None]]:
+        """Wrap a sink so that streamed chunks are counted."""
+
+        async def _put(chunk: Dict[Text, Any]) -> None:
+            if chunk.get("event") == "stream_chunk":
+                self.metrics.stream_chunks.inc(action_name)
+            await put(chunk)
+
+        return _put
+
+    def collect_metrics(self) -> Dict[Text, Any]:
+        """Return a snapshot of the metrics of this executor."""
+        if self.admission_controller is not None:
+            self.metrics.admission_queue_depth.set(
+                value=self.admission_controller.queue_depth
+            )
+        return self.metrics.registry.snapshot()
+
+    async def _run_action(
+        self,
+        action: Callable,
+        action_name: Text,
+        action_call: Dict[Text, Any],
+        sink: Optional[asyncio.Queue],
+        dispatcher: Optional["CollectingDispatcher"],
+    ) -> ActionExecutorRunResult:
+        """Run a registered action and build its result."""
+        from rasa_sdk.interfaces import Tracker
+
+        tracker_json = action_call["tracker"]
+        domain = await self._update_domain(action_call, action_name)
+        tracker = (
+            tracker_json.to_tracker()
+            if isinstance(tracker_json, ProtoTrackerState)
+            else Tracker.from_dict(tracker_json)
+        )
+        if dispatcher is None:
+            dispatcher = CollectingDispatcher()
+        if sink is not None:
+            dispatcher._stream_sink = self._counting_sink(sink.put, action_name)
+
+        thread_pool = (
+            self.sync_thread_pool if action_name in self.threaded_actions else None
+        )
+        with use_thread_pool(thread_pool):
+            events = await call_action_code(action, dispatcher, tracker, domain)
+
+        if dispatcher.is_streaming_active:
+            logger.warning(
+                f"Action '{action_name}' called stream_start() / "
+                f"stream_chunk() but never called stream_end(). "
+                "Closing the stream automatically."
+            )
+            await dispatcher.stream_end()
+
+        if not events:
+            # make sure the action did not just return `None`...
+            events = []
+
+        validated_events = self.validate_events(events, action_name)
+        return self._create_api_response(validated_events, dispatcher.messages)
+
     async def run_streaming(
         self,
         action_call: Dict[Text, Any],
@@ -4,9 +4,9 @@ import warnings
 from typing import Dict, Text, Any, List, Optional
 
 from abc import ABC
-from rasa_sdk import utils
 from rasa_sdk.events import SlotSet, EventType
 from rasa_sdk.interfaces import Action
+from rasa_sdk.thread_pool import call_action_code
 
 logger = logging.getLogger(__name__)
 
@@ -163,8 +163,8 @@ class ValidationAction(Action, ABC):
                 )
                 continue
 
-            validation_output = await utils.call_potential_coroutine(
-                validate_method(slot_value, dispatcher, tracker, domain)
+            validation_output = await call_action_code(
+                validate_method, slot_value, dispatcher, tracker, domain
             )
 
             if isinstance(validation_output, dict):
@@ -231,9 +231,7 @@ class ValidationAction(Action, ABC):
                 )
             return {}
 
-        extracted = await utils.call_potential_coroutine(
-            extract_method(dispatcher, tracker, domain)
-        )
+        extracted = await call_action_code(extract_method, dispatcher, tracker, domain)
 
         if isinstance(extracted, dict):
             return extracted
@@ -22,6 +22,7 @@ class ResourceNotFoundType(str, Enum):
 
     ACTION = "ACTION"
     DOMAIN = "DOMAIN"
+    TRACKER = "TRACKER"
 
 
 class ResourceNotFound(BaseModel):
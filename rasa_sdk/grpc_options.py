@@ -0,0 +1,169 @@
+from functools import partial
+from typing import Any, Callable, List, Optional, Text, Tuple
+
+import grpc
+
+from rasa_sdk.constants import (
+    DEFAULT_GRPC_COMPRESSION,
+    DEFAULT_GRPC_COMPRESSION_MIN_SIZE,
+    DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+    DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+    DEFAULT_STREAM_COALESCE_MAX_SIZE,
+    DEFAULT_STREAM_HIGH_WATER_MARK,
+)
+from rasa_sdk.stream_sink import StreamSink
+
+GRPC_COMPRESSION_NONE = "none"
+GRPC_COMPRESSION_GZIP = "gzip"
+GRPC_COMPRESSION_THRESHOLD = "threshold"
+
+GRPC_COMPRESSION_POLICIES = [
+    GRPC_COMPRESSION_NONE,
+    GRPC_COMPRESSION_GZIP,
+    GRPC_COMPRESSION_THRESHOLD,
+]
+
+
+def _milliseconds(seconds: float) -> int:
+    return int(seconds * 1000)
+
+
+class GRPCServerOptions:
+    """Tuning of the gRPC server and of the compression of its responses.
+
+    Every setting left at `None` keeps the default of gRPC itself.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_streams: Optional[int] = None,
+        max_receive_message_size: Optional[int] = None,
+        max_send_message_size: Optional[int] = None,
+        keepalive_time: Optional[float] = None,
+        keepalive_timeout: Optional[float] = None,
+        max_connection_age: Optional[float] = None,
+        max_connection_age_grace: Optional[float] = None,
+        compression: Text = DEFAULT_GRPC_COMPRESSION,
+        compression_min_size: int = DEFAULT_GRPC_COMPRESSION_MIN_SIZE,
+        thread_pool_size: Optional[int] = None,
+        multiplex_max_in_flight: int = DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+        stream_high_water_mark: int = DEFAULT_STREAM_HIGH_WATER_MARK,
+        stream_coalesce_max_delay: float = DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+        stream_coalesce_max_size: int = DEFAULT_STREAM_COALESCE_MAX_SIZE,
+    ) -> None:
+        """Creates `GRPCServerOptions`.
+
+        Args:
+            max_concurrent_streams: Maximum number of concurrent calls on a
+                single HTTP/2 connection.
+            max_receive_message_size: Maximum size in bytes of a request
+                message. gRPC rejects requests above 4 MB by default.
+            max_send_message_size: Maximum size in bytes of a response message.
+            keepalive_time: Number of seconds after which the server pings an
+                idle connection.
+            keepalive_timeout: Number of seconds the server waits for the
+                answer to a ping before it closes the connection.
+            max_connection_age: Number of seconds after which the server asks
+                the client to reconnect, so that long-lived connections are
+                rebalanced across the servers behind a load balancer.
+            max_connection_age_grace: Number of seconds running calls may take
+                to finish once a connection reached its maximum age.
+            compression: One of `GRPC_COMPRESSION_POLICIES`. `none` never
+                compresses responses, `gzip` compresses every response and
+                `threshold` only compresses messages of at least
+                `compression_min_size` bytes.
+            compression_min_size: Minimum size in bytes of a compressed
+                message when `compression` is `threshold`.
+            thread_pool_size: Number of threads of the server's thread pool.
+                Defaults to the number of Sanic workers.
+            multiplex_max_in_flight: Maximum number of requests of a single
+                `WebhookMultiplex` stream which are processed at the same time.
+            stream_high_water_mark: Number of events of a `WebhookStream` call
+                waiting to be sent above which the action is slowed down.
+            stream_coalesce_max_delay: Maximum number of seconds a streamed
+                text chunk is held back to be merged with following chunks.
+            stream_coalesce_max_size: Maximum number of characters of merged
+                text chunks. `0` disables merging.
+
+        Raises:
+            ValueError: If `compression` is not a known policy.
+        """
+        if compression not in GRPC_COMPRESSION_POLICIES:
+            raise ValueError(
+                f"Unknown gRPC compression policy '{compression}'. Valid policies "
+                f"are {', '.join(GRPC_COMPRESSION_POLICIES)}."
+            )
+
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_receive_message_size = max_receive_message_size
+        self.max_send_message_size = max_send_message_size
+        self.keepalive_time = keepalive_time
+        self.keepalive_timeout = keepalive_timeout
+        self.max_connection_age = max_connection_age
+        self.max_connection_age_grace = max_connection_age_grace
+        self.compression = compression
+        self.compression_min_size = compression_min_size
+        self.thread_pool_size = thread_pool_size
+        self.multiplex_max_in_flight = multiplex_max_in_flight
+        self.stream_high_water_mark = stream_high_water_mark
+        self.stream_coalesce_max_delay = stream_coalesce_max_delay
+        self.stream_coalesce_max_size = stream_coalesce_max_size
+
+    @property
+    def server_compression(self) -> grpc.Compression:
+        """Compression algorithm the server uses for its responses."""
+        if self.compression == GRPC_COMPRESSION_NONE:
+            return grpc.Compression.NoCompression
+        return grpc.Compression.Gzip
+
+    @property
+    def message_compression_min_size(self) -> Optional[int]:
+        """Size in bytes below which single messages are sent uncompressed.
+
+        `None` when the size of a message doesn't affect its compression.
+        """
+        if self.compression == GRPC_COMPRESSION_THRESHOLD:
+            return self.compression_min_size
+        return None
+
+    @property
+    def stream_sink_factory(self) -> Callable[[], StreamSink]:
+        """Creates the sink of the events of a `WebhookStream` call."""
+        return partial(
+            StreamSink,
+            high_water_mark=self.stream_high_water_mark,
+            coalesce_max_delay=self.stream_coalesce_max_delay,
+            coalesce_max_size=self.stream_coalesce_max_size,
+        )
+
+    def channel_options(self) -> List[Tuple[Text, Any]]:
+        """Return the options passed to the gRPC server."""
+        options: List[Tuple[Text, Any]] = []
+        if self.max_concurrent_streams is not None:
+            options.append(("grpc.max_concurrent_streams", self.max_concurrent_streams))
+        if self.max_receive_message_size is not None:
+            options.append(
+                ("grpc.max_receive_message_length", self.max_receive_message_size)
+            )
+        if self.max_send_message_size is not None:
+            options.append(("grpc.max_send_message_length", self.max_send_message_size))
+        if self.keepalive_time is not None:
+            options.append(
+                ("grpc.keepalive_time_ms", _milliseconds(self.keepalive_time))
+            )
+        if self.keepalive_timeout is not None:
+            options.append(
+                ("grpc.keepalive_timeout_ms", _milliseconds(self.keepalive_timeout))
+            )
+        if self.max_connection_age is not None:
+            options.append(
+                ("grpc.max_connection_age_ms", _milliseconds(self.max_connection_age))
+            )
+        if self.max_connection_age_grace is not None:
+            options.append(
+                (
+                    "grpc.max_connection_age_grace_ms",
+                    _milliseconds(self.max_connection_age_grace),
+                )
+            )
+        return options
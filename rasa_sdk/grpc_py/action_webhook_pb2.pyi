@@ -153,20 +153,22 @@ class Domain(_message.Message):
     def __init__(self, config: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., session_config: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., intents: _Optional[_Iterable[_Union[Intent, _Mapping]]] = ..., entities: _Optional[_Iterable[_Union[Entity, _Mapping]]] = ..., slots: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., responses: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., actions: _Optional[_Iterable[_Union[Action, _Mapping]]] = ..., forms: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., e2e_actions: _Optional[_Iterable[_Union[_struct_pb2.Struct, _Mapping]]] = ...) -> None: ...
 
 class WebhookRequest(_message.Message):
-    __slots__ = ("next_action", "sender_id", "tracker", "domain", "version", "domain_digest")
+    __slots__ = ("next_action", "sender_id", "tracker", "domain", "version", "domain_digest", "tracker_base_event_count")
     NEXT_ACTION_FIELD_NUMBER: _ClassVar[int]
     SENDER_ID_FIELD_NUMBER: _ClassVar[int]
     TRACKER_FIELD_NUMBER: _ClassVar[int]
     DOMAIN_FIELD_NUMBER: _ClassVar[int]
     VERSION_FIELD_NUMBER: _ClassVar[int]
     DOMAIN_DIGEST_FIELD_NUMBER: _ClassVar[int]
+    TRACKER_BASE_EVENT_COUNT_FIELD_NUMBER: _ClassVar[int]
     next_action: str
     sender_id: str
     tracker: Tracker
     domain: Domain
     version: str
     domain_digest: str
-    def __init__(self, next_action: _Optional[str] = ..., sender_id: _Optional[str] = ..., tracker: _Optional[_Union[Tracker, _Mapping]] = ..., domain: _Optional[_Union[Domain, _Mapping]] = ..., version: _Optional[str] = ..., domain_digest: _Optional[str] = ...) -> None: ...
+    tracker_base_event_count: int
+    def __init__(self, next_action: _Optional[str] = ..., sender_id: _Optional[str] = ..., tracker: _Optional[_Union[Tracker, _Mapping]] = ..., domain: _Optional[_Union[Domain, _Mapping]] = ..., version: _Optional[str] = ..., domain_digest: _Optional[str] = ..., tracker_base_event_count: _Optional[int] = ...) -> None: ...
 
 class WebhookResponse(_message.Message):
     __slots__ = ("events", "responses")
@@ -175,3 +177,45 @@ class WebhookResponse(_message.Message):
     events: _containers.RepeatedCompositeFieldContainer[_struct_pb2.Struct]
     responses: _containers.RepeatedCompositeFieldContainer[_struct_pb2.Struct]
     def __init__(self, events: _Optional[_Iterable[_Union[_struct_pb2.Struct, _Mapping]]] = ..., responses: _Optional[_Iterable[_Union[_struct_pb2.Struct, _Mapping]]] = ...) -> None: ...
+
+class MultiplexedWebhookRequest(_message.Message):
+    __slots__ = ("correlation_id", "request")
+    CORRELATION_ID_FIELD_NUMBER: _ClassVar[int]
+    REQUEST_FIELD_NUMBER: _ClassVar[int]
+    correlation_id: str
+    request: WebhookRequest
+    def __init__(self, correlation_id: _Optional[str] = ..., request: _Optional[_Union[WebhookRequest, _Mapping]] = ...) -> None: ...
+
+class WebhookError(_message.Message):
+    __slots__ = ("code", "details", "retry_after")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    DETAILS_FIELD_NUMBER: _ClassVar[int]
+    RETRY_AFTER_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    details: str
+    retry_after: float
+    def __init__(self, code: _Optional[int] = ..., details: _Optional[str] = ..., retry_after: _Optional[float] = ...) -> None: ...
+
+class MultiplexedWebhookResponse(_message.Message):
+    __slots__ = ("correlation_id", "response", "error")
+    CORRELATION_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    correlation_id: str
+    response: WebhookResponse
+    error: WebhookError
+    def __init__(self, correlation_id: _Optional[str] = ..., response: _Optional[_Union[WebhookResponse, _Mapping]] = ..., error: _Optional[_Union[WebhookError, _Mapping]] = ...) -> None: ...
+
+class RegisterDomainRequest(_message.Message):
+    __slots__ = ("domain_digest", "domain")
+    DOMAIN_DIGEST_FIELD_NUMBER: _ClassVar[int]
+    DOMAIN_FIELD_NUMBER: _ClassVar[int]
+    domain_digest: str
+    domain: Domain
+    def __init__(self, domain_digest: _Optional[str] = ..., domain: _Optional[_Union[Domain, _Mapping]] = ...) -> None: ...
+
+class RegisterDomainResponse(_message.Message):
+    __slots__ = ("known",)
+    KNOWN_FIELD_NUMBER: _ClassVar[int]
+    known: bool
+    def __init__(self, known: bool = ...) -> None: ...
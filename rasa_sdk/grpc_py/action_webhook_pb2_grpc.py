@@ -55,6 +55,16 @@ class ActionServiceStub(object):
                 request_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.ActionsRequest.SerializeToString,
                 response_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.ActionsResponse.FromString,
                 _registered_method=True)
+        self.WebhookMultiplex = channel.stream_stream(
+                '/action_server_webhook.ActionService/WebhookMultiplex',
+                request_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookRequest.SerializeToString,
+                response_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookResponse.FromString,
+                _registered_method=True)
+        self.RegisterDomain = channel.unary_unary(
+                '/action_server_webhook.ActionService/RegisterDomain',
+                request_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainRequest.SerializeToString,
+                response_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainResponse.FromString,
+                _registered_method=True)
 
 
 class ActionServiceServicer(object):
@@ -84,6 +94,18 @@ class ActionServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WebhookMultiplex(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RegisterDomain(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ActionServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -107,6 +129,16 @@ def add_ActionServiceServicer_to_server(servicer, server):
                     request_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.ActionsRequest.FromString,
                     response_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.ActionsResponse.SerializeToString,
             ),
+            'WebhookMultiplex': grpc.stream_stream_rpc_method_handler(
+                    servicer.WebhookMultiplex,
+                    request_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookRequest.FromString,
+                    response_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookResponse.SerializeToString,
+            ),
+            'RegisterDomain': grpc.unary_unary_rpc_method_handler(
+                    servicer.RegisterDomain,
+                    request_deserializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainRequest.FromString,
+                    response_serializer=rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'action_server_webhook.ActionService', rpc_method_handlers)
@@ -225,3 +257,57 @@ class ActionService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def WebhookMultiplex(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/action_server_webhook.ActionService/WebhookMultiplex',
+            rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookRequest.SerializeToString,
+            rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.MultiplexedWebhookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RegisterDomain(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/action_server_webhook.ActionService/RegisterDomain',
+            rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainRequest.SerializeToString,
+            rasa__sdk_dot_grpc__py_dot_action__webhook__pb2.RegisterDomainResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import os
+import shutil
 import signal
+import tempfile
 import time
 import uuid
 
@@ -10,7 +12,17 @@ import asyncio
 
 import grpc
 import logging
-from typing import AsyncIterator, Optional, Any, Dict
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
 from concurrent import futures
 
 from google.protobuf import empty_pb2
@@ -18,7 +30,7 @@ from grpc import aio
 from grpc_health.v1 import health
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
-from google.protobuf.json_format import MessageToDict, ParseDict
+from google.protobuf.json_format import MessageToDict
 from grpc.aio import Metadata
 from multidict import MultiDict
 
@@ -26,19 +38,28 @@ from rasa_sdk.constants import (
     DEFAULT_SERVER_PORT,
     DEFAULT_ENDPOINTS_PATH,
     DEFAULT_STREAM_BARGE_IN_TIMEOUT_SECONDS,
+    DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
     ACTION_SERVER_STREAM_BARGE_IN_TIMEOUT_SECONDS_ENV_VAR,
     NO_GRACE_PERIOD,
 )
-from rasa_sdk.executor import ActionExecutor, CollectingDispatcher
+from rasa_sdk.domain_store import DomainStore
+from rasa_sdk.executor import (
+    ActionExecutor,
+    ActionExecutorRunResult,
+    CollectingDispatcher,
+)
 from rasa_sdk.grpc_errors import (
     ResourceNotFound,
     ResourceNotFoundType,
     ActionExecutionFailed,
 )
+from rasa_sdk.grpc_options import GRPCServerOptions
+from rasa_sdk.grpc_workers import GRPCWorker, supervise_workers
 from rasa_sdk.grpc_py import (
     action_webhook_pb2,
     action_webhook_pb2_grpc,
 )
+from rasa_sdk.grpc_tracker import ProtoTrackerState
 from rasa_sdk.grpc_py.action_webhook_pb2 import (
     ActionsResponse,
     ActionsRequest,
@@ -48,12 +69,24 @@ from rasa_sdk.interfaces import (
     ActionExecutionRejection,
     ActionNotFoundException,
     ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionServerOverloadedException,
+    ActionTimeoutException,
+)
+from rasa_sdk.metrics import (
+    load_snapshots,
+    start_metrics_server,
+    write_snapshot,
+    write_snapshots,
 )
+from rasa_sdk.readiness import ReadinessMonitor
+from rasa_sdk.reloader import ModuleWatcher
+from rasa_sdk.stream_sink import StreamSink
 from rasa_sdk.tracing.utils import (
     get_tracer_provider,
     TracerProvider,
-    get_tracer_and_context,
     set_span_attributes,
+    start_request_span,
 )
 from rasa_sdk.utils import (
     check_version_compatibility,
@@ -110,6 +143,32 @@ def _convert_metadata_to_multidict(
     return MultiDict(metadata)
 
 
+def _action_call_from_request(
+    request: WebhookRequest, executor: ActionExecutor
+) -> Dict[str, Any]:
+    """Build the action call of a webhook request without converting it all.
+
+    The result equals `MessageToDict(request, preserving_proto_field_name=True)`
+    with two exceptions: the tracker is a `ProtoTrackerState` which converts
+    its fields on first access, and the domain is left out if the executor
+    already holds the domain with the request's digest.
+    """
+    action_call: Dict[str, Any] = {
+        field.name: value
+        for field, value in request.ListFields()
+        if field.name not in ("tracker", "domain")
+    }
+    if request.HasField("tracker"):
+        action_call["tracker"] = ProtoTrackerState(request.tracker)
+    if request.HasField("domain") and not executor.is_domain_digest_valid(
+        action_call.get("domain_digest")
+    ):
+        action_call["domain"] = MessageToDict(
+            request.domain, preserving_proto_field_name=True
+        )
+    return action_call
+
+
 class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
     """Runs webhook RPC which is served through gRPC server."""
 
@@ -119,17 +178,34 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
         auto_reload: bool = False,
         tracer_provider: Optional[TracerProvider] = None,
         stream_barge_in_timeout_seconds: Optional[float] = None,
+        compression_min_size: Optional[int] = None,
+        worker: Optional[GRPCWorker] = None,
+        multiplex_max_in_flight: int = DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+        stream_sink_factory: Callable[[], asyncio.Queue] = StreamSink,
     ) -> None:
         """Initializes the ActionServerWebhook.
 
         Args:
             tracer_provider: The tracer provider.
-            auto_reload: Enable auto-reloading of modules containing Action subclasses.
+            auto_reload: Whether auto-reloading of modules containing Action
+                subclasses is enabled. The modules are reloaded by the watcher
+                started in `run_grpc`, never on the request path.
             executor: The action executor.
             stream_barge_in_timeout_seconds: Maximum time to wait for a streaming
                 action to finish after a barge-in before the task is cancelled.
                 When omitted, reads from the environment variable
                 ``ACTION_SERVER_STREAM_BARGE_IN_TIMEOUT_SECONDS`` (default 30s).
+            compression_min_size: Size in bytes below which response messages
+                are sent uncompressed although the server compresses responses.
+                When omitted, the server's compression applies to every message.
+            worker: The worker process this servicer runs in, when several
+                worker processes share the port.
+            multiplex_max_in_flight: Maximum number of requests of a single
+                `WebhookMultiplex` stream which are processed at the same time.
+                Further requests are only read once a response was sent.
+            stream_sink_factory: Creates the queue which receives the events
+                of a `WebhookStream` call. A bounded `StreamSink` slows down
+                actions which stream faster than the client receives.
         """
         self.tracer_provider = tracer_provider
         self.auto_reload = auto_reload
@@ -137,6 +213,11 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
         self._stream_barge_in_timeout_seconds = (
             _resolve_stream_barge_in_timeout_seconds(stream_barge_in_timeout_seconds)
         )
+        self.compression_min_size = compression_min_size
+        self.worker = worker
+        self.multiplex_max_in_flight = multiplex_max_in_flight
+        self.stream_sink_factory = stream_sink_factory
+        self._actions_response: Optional[Tuple[Tuple[int, int], ActionsResponse]] = None
         # Maps response_id → CollectingDispatcher for in-flight streaming RPCs.
         # Used by AckStreamChunks to reach the active dispatcher without
         # coupling the RPC handler to the WebhookStream coroutine.
@@ -156,17 +237,15 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
         Returns:
             gRPC response.
         """
-        if self.auto_reload:
-            self.executor.reload()
-
-        actions = [action.model_dump() for action in self.executor.list_actions()]
-        response = ActionsResponse()
-        return ParseDict(
-            {
-                "actions": actions,
-            },
-            response,
-        )
+        # Reloads publish a new registry and increment its version, while
+        # registering more actions only grows the current registry.
+        registry_key = (self.executor.registry_version, len(self.executor.actions))
+        if self._actions_response is None or self._actions_response[0] != registry_key:
+            response = ActionsResponse()
+            for action in self.executor.list_actions():
+                response.actions.add()["name"] = action.name
+            self._actions_response = (registry_key, response)
+        return self._actions_response[1]
 
     async def Webhook(
         self,
@@ -175,6 +254,8 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
     ) -> action_webhook_pb2.WebhookResponse:
         """Handle RPC request for the webhook.
 
+        The action is cancelled once the client's deadline expires.
+
         Args:
             request: The webhook request.
             context: The context of the request.
@@ -183,21 +264,19 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
             gRPC response.
         """
         span_name = "GRPCActionServerWebhook.Webhook"
-        invocation_metadata = context.invocation_metadata()
-
-        tracer, tracing_context = get_tracer_and_context(
-            span_name=span_name,
-            tracer_provider=self.tracer_provider,
-            tracing_carrier=_convert_metadata_to_multidict(invocation_metadata),
-        )
-
-        with tracer.start_as_current_span(span_name, context=tracing_context) as span:
+        with start_request_span(
+            span_name,
+            self.tracer_provider,
+            lambda: _convert_metadata_to_multidict(context.invocation_metadata()),
+        ) as span:
             check_version_compatibility(request.version)
-            if self.auto_reload:
-                self.executor.reload()
+            metrics = self.executor.metrics
+            metrics.request_size.observe(request.ByteSize(), "grpc", "Webhook")
             try:
-                action_call = MessageToDict(request, preserving_proto_field_name=True)
-                result = await self.executor.run(action_call)
+                action_call = _action_call_from_request(request, self.executor)
+                result = await self.executor.run(
+                    action_call, timeout=context.time_remaining()
+                )
             except ActionExecutionRejection as e:
                 logger.debug(e)
 
@@ -227,12 +306,37 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(body)
                 return action_webhook_pb2.WebhookResponse()
+            except ActionMissingTrackerException as e:
+                logger.debug(e)
+                body = ResourceNotFound(
+                    action_name=e.action_name,
+                    message=e.message,
+                    resource_type=ResourceNotFoundType.TRACKER,
+                ).model_dump_json()
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(body)
+                return action_webhook_pb2.WebhookResponse()
+            except ActionServerOverloadedException as e:
+                _set_overloaded_status(e, context)
+                return action_webhook_pb2.WebhookResponse()
+            except ActionTimeoutException as e:
+                logger.warning(e)
+                context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+                context.set_details(
+                    ActionExecutionFailed(
+                        action_name=e.action_name, message=e.message
+                    ).model_dump_json()
+                )
+                return action_webhook_pb2.WebhookResponse()
             if not result:
                 return action_webhook_pb2.WebhookResponse()
 
             _set_grpc_span_attributes(span, action_call, method_name="Webhook")
-            response = action_webhook_pb2.WebhookResponse()
-            return ParseDict(result.model_dump(), response)
+            response = _build_webhook_response(result)
+            response_size = response.ByteSize()
+            metrics.response_size.observe(response_size, "grpc", "Webhook")
+            self._apply_compression_policy(context, response_size)
+            return response
 
     async def WebhookStream(
         self,
@@ -264,23 +368,51 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
         Yields:
             :class:`WebhookStreamEvent` messages.
         """
+        metrics = self.executor.metrics
+        metrics.request_size.observe(request.ByteSize(), "grpc", "WebhookStream")
+        sent_bytes = 0
+        async with contextlib.aclosing(
+            self._webhook_stream(request, context)
+        ) as events:
+            async for event in events:
+                event_size = event.ByteSize()
+                sent_bytes += event_size
+                self._apply_compression_policy(context, event_size)
+                yield event
+        metrics.response_size.observe(sent_bytes, "grpc", "WebhookStream")
+
+    def _new_response_id(self) -> str:
+        if self.worker is not None:
+            return self.worker.new_response_id()
+        return uuid.uuid4().hex
+
+    def _apply_compression_policy(
+        self, context: grpc.aio.ServicerContext, message_size: int
+    ) -> None:
+        """Send the next message uncompressed if it's too small to benefit."""
+        if (
+            self.compression_min_size is not None
+            and message_size < self.compression_min_size
+        ):
+            context.disable_next_message_compression()
+
+    async def _webhook_stream(
+        self,
+        request: WebhookRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[action_webhook_pb2.WebhookStreamEvent]:
+        """Run the action of a `WebhookStream` call and yield its events."""
         span_name = "GRPCActionServerWebhook.WebhookStream"
-        invocation_metadata = context.invocation_metadata()
-
-        tracer, tracing_context = get_tracer_and_context(
-            span_name=span_name,
-            tracer_provider=self.tracer_provider,
-            tracing_carrier=_convert_metadata_to_multidict(invocation_metadata),
-        )
-
-        with tracer.start_as_current_span(span_name, context=tracing_context) as span:
+        with start_request_span(
+            span_name,
+            self.tracer_provider,
+            lambda: _convert_metadata_to_multidict(context.invocation_metadata()),
+        ) as span:
             check_version_compatibility(request.version)
-            if self.auto_reload:
-                self.executor.reload()
 
-            action_call = MessageToDict(request, preserving_proto_field_name=True)
+            action_call = _action_call_from_request(request, self.executor)
             action_name = action_call.get("next_action", "")
-            sink: asyncio.Queue = asyncio.Queue()
+            sink = self.stream_sink_factory()
 
             # Pre-construct the dispatcher so it is ready to be stored in the
             # cancellation registry once a response_id is available after
@@ -313,6 +445,9 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
                     ActionExecutionRejection,
                     ActionNotFoundException,
                     ActionMissingDomainException,
+                    ActionMissingTrackerException,
+                    ActionServerOverloadedException,
+                    ActionTimeoutException,
                 ):
                     pass  # stream_error already placed in sink by executor.run()
                 except Exception:
@@ -373,7 +508,7 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
                         # AckStreamChunks cannot target a completed sequence.
                         if current_response_id:
                             self._dispatcher_registry.pop(current_response_id, None)
-                        current_response_id = uuid.uuid4().hex
+                        current_response_id = self._new_response_id()
                         self._dispatcher_registry[current_response_id] = dispatcher
                         yield action_webhook_pb2.WebhookStreamEvent(
                             chunk_start=action_webhook_pb2.ChunkStart(
@@ -424,6 +559,131 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
                         with contextlib.suppress(asyncio.CancelledError):
                             await run_task
 
+    async def WebhookMultiplex(
+        self,
+        request_iterator: AsyncIterator[action_webhook_pb2.MultiplexedWebhookRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[action_webhook_pb2.MultiplexedWebhookResponse]:
+        """Handle webhook requests multiplexed over one bidirectional stream.
+
+        Every request carries a ``correlation_id`` which is copied into its
+        response. The requests are run concurrently and their responses are
+        sent as soon as they are ready, so they may arrive out of order. A
+        failing request is answered with the ``error`` the unary ``Webhook``
+        call would fail with, while the stream stays open.
+
+        At most ``multiplex_max_in_flight`` requests are processed or wait to
+        be sent at the same time. The stream isn't read beyond that, so HTTP/2
+        flow control slows down the client.
+
+        Args:
+            request_iterator: The multiplexed webhook requests.
+            context: The context of the stream.
+
+        Yields:
+            The response of every request.
+        """
+        slots = asyncio.Semaphore(self.multiplex_max_in_flight)
+        responses: asyncio.Queue = asyncio.Queue()
+        tasks: Set[asyncio.Task] = set()
+
+        async def read_requests() -> None:
+            try:
+                async for request in request_iterator:
+                    await slots.acquire()
+                    task = asyncio.create_task(
+                        self._run_multiplexed_request(request, context, responses)
+                    )
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            finally:
+                responses.put_nowait(None)
+
+        reader = asyncio.create_task(read_requests())
+        try:
+            while (response := await responses.get()) is not None:
+                self._apply_compression_policy(context, response.ByteSize())
+                yield response
+                slots.release()
+            # Fail the stream if reading the requests failed.
+            await reader
+        finally:
+            for task in (reader, *tasks):
+                task.cancel()
+            await asyncio.gather(reader, *tasks, return_exceptions=True)
+
+    async def _run_multiplexed_request(
+        self,
+        request: action_webhook_pb2.MultiplexedWebhookRequest,
+        context: grpc.aio.ServicerContext,
+        responses: asyncio.Queue,
+    ) -> None:
+        """Run a request of a `WebhookMultiplex` stream and queue its response."""
+        response = action_webhook_pb2.MultiplexedWebhookResponse(
+            correlation_id=request.correlation_id
+        )
+        metrics = self.executor.metrics
+        webhook_request = request.request
+        with start_request_span(
+            "GRPCActionServerWebhook.WebhookMultiplex",
+            self.tracer_provider,
+            lambda: _convert_metadata_to_multidict(context.invocation_metadata()),
+        ) as span:
+            metrics.request_size.observe(
+                webhook_request.ByteSize(), "grpc", "WebhookMultiplex"
+            )
+            try:
+                check_version_compatibility(webhook_request.version)
+                action_call = _action_call_from_request(webhook_request, self.executor)
+                result = await self.executor.run(
+                    action_call, timeout=context.time_remaining()
+                )
+            except Exception as e:
+                _set_webhook_error(response.error, e)
+            else:
+                response.response.SetInParent()
+                if result:
+                    _set_grpc_span_attributes(
+                        span, action_call, method_name="WebhookMultiplex"
+                    )
+                    _fill_webhook_response(response.response, result)
+            metrics.response_size.observe(
+                response.ByteSize(), "grpc", "WebhookMultiplex"
+            )
+        responses.put_nowait(response)
+
+    async def RegisterDomain(
+        self,
+        request: action_webhook_pb2.RegisterDomainRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> action_webhook_pb2.RegisterDomainResponse:
+        """Handle RPC request registering a domain ahead of the action calls.
+
+        Once the domain is registered, webhook requests only need to send its
+        ``domain_digest``. Requests without a domain only check whether the
+        server already holds the domain with the digest.
+
+        Args:
+            request: The digest and, optionally, the domain.
+            context: The context of the request.
+
+        Returns:
+            Whether the server already held the domain.
+        """
+        if not request.domain_digest:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("The domain digest must not be empty.")
+            return action_webhook_pb2.RegisterDomainResponse()
+
+        domain = (
+            MessageToDict(request.domain, preserving_proto_field_name=True)
+            if request.HasField("domain")
+            else None
+        )
+        known = await self.executor.register_domain(request.domain_digest, domain)
+        return action_webhook_pb2.RegisterDomainResponse(known=known)
+
     async def AckStreamChunks(
         self,
         request: action_webhook_pb2.StreamChunkAck,
@@ -449,14 +709,20 @@ class GRPCActionServerWebhook(action_webhook_pb2_grpc.ActionServiceServicer):
 
         Args:
             request: The acknowledgement request carrying ``response_id``.
-            context: The gRPC context (unused but required by the servicer API).
+            context: The gRPC context of the request.
 
         Returns:
             ``google.protobuf.Empty``.
         """
         dispatcher = self._dispatcher_registry.get(request.response_id)
+        owner = self.worker.owner(request.response_id) if self.worker else None
         if dispatcher is not None:
             dispatcher.cancel_stream()
+        elif owner is not None and owner != self.worker.index:
+            # The stream is served by another worker process.
+            await self.worker.forward_ack(
+                owner, request, timeout=context.time_remaining()
+            )
         else:
             logger.debug(
                 f"AckStreamChunks: no active stream found for "
@@ -568,6 +834,38 @@ async def _await_barge_in_run_task(
         )
 
 
+def _add_structs(structs: Any, values: Iterable[Dict[str, Any]]) -> None:
+    """Append a ``Struct`` for each dictionary in *values* to *structs*."""
+    for value in values:
+        structs.add().update(value)
+
+
+def _build_webhook_response(
+    result: ActionExecutorRunResult,
+) -> action_webhook_pb2.WebhookResponse:
+    """Build the ``WebhookResponse`` for the result of an action run.
+
+    The events and responses are copied straight into their ``Struct``
+    messages, which gives the same message as ``ParseDict`` over the dumped
+    result without the reflective walk.
+    """
+    response = action_webhook_pb2.WebhookResponse()
+    _fill_webhook_response(response, result)
+    return response
+
+
+def _fill_webhook_response(
+    response: action_webhook_pb2.WebhookResponse, result: ActionExecutorRunResult
+) -> None:
+    """Copy the events and responses of an action run into *response*."""
+    _add_structs(response.events, result.events)
+    _add_structs(response.responses, result.responses)
+
+
+_CHUNK_STRING_FIELDS: List[str] = ["text", "image", "attachment"]
+_CHUNK_STRUCT_LIST_FIELDS: List[str] = ["buttons", "elements"]
+
+
 def _build_chunk_event(
     chunk_payload: Dict[str, Any],
     response_id: str,
@@ -576,25 +874,28 @@ def _build_chunk_event(
 
     Only the fields defined in the ``Chunk`` protobuf message are forwarded;
     any extra kwargs present in *chunk_payload* are silently dropped because
-    the wire format has no place for them.
+    the wire format has no place for them. As with ``ParseDict``, fields whose
+    value is ``None`` are left unset.
     """
-    return action_webhook_pb2.WebhookStreamEvent(
-        chunk=ParseDict(
-            {
-                k: chunk_payload[k]
-                for k in (
-                    "text",
-                    "image",
-                    "custom",
-                    "attachment",
-                    "buttons",
-                    "elements",
-                )
-                if k in chunk_payload
-            },
-            action_webhook_pb2.Chunk(response_id=response_id),
-        )
-    )
+    event = action_webhook_pb2.WebhookStreamEvent()
+    chunk = event.chunk
+    chunk.SetInParent()
+    chunk.response_id = response_id
+    for field in _CHUNK_STRING_FIELDS:
+        value = chunk_payload.get(field)
+        if value is not None:
+            setattr(chunk, field, value)
+
+    custom = chunk_payload.get("custom")
+    if custom is not None:
+        chunk.custom.SetInParent()
+        chunk.custom.update(custom)
+
+    for field in _CHUNK_STRUCT_LIST_FIELDS:
+        values = chunk_payload.get(field)
+        if values is not None:
+            _add_structs(getattr(chunk, field), values)
+    return event
 
 
 def _build_empty_final_result_event() -> action_webhook_pb2.WebhookStreamEvent:
@@ -618,9 +919,9 @@ def _build_final_result_event(
     """
     if not result:
         return None
-    final_response = action_webhook_pb2.WebhookResponse()
-    ParseDict(result.model_dump(), final_response)
-    return action_webhook_pb2.WebhookStreamEvent(final_result=final_response)
+    return action_webhook_pb2.WebhookStreamEvent(
+        final_result=_build_webhook_response(result)
+    )
 
 
 def _handle_stream_error_event(
@@ -631,7 +932,7 @@ def _handle_stream_error_event(
     """Set the appropriate gRPC status code/details for *exc* on *context* and
     return the corresponding ``WebhookStreamEvent`` error message.
 
-    Handles the three known action-level exceptions with specific status codes;
+    Handles the known action-level exceptions with specific status codes;
     any other exception falls back to ``INTERNAL``.
     """
     if isinstance(exc, ActionExecutionRejection):
@@ -662,6 +963,26 @@ def _handle_stream_error_event(
                 resource_type=ResourceNotFoundType.DOMAIN,
             ).model_dump_json()
         )
+    elif isinstance(exc, ActionMissingTrackerException):
+        logger.debug(exc)
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        context.set_details(
+            ResourceNotFound(
+                action_name=exc.action_name,
+                message=exc.message,
+                resource_type=ResourceNotFoundType.TRACKER,
+            ).model_dump_json()
+        )
+    elif isinstance(exc, ActionServerOverloadedException):
+        _set_overloaded_status(exc, context)
+    elif isinstance(exc, ActionTimeoutException):
+        logger.warning(exc)
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+        context.set_details(
+            ActionExecutionFailed(
+                action_name=exc.action_name, message=exc.message
+            ).model_dump_json()
+        )
     else:
         logger.error(exc)
         context.set_code(grpc.StatusCode.INTERNAL)
@@ -674,6 +995,77 @@ def _handle_stream_error_event(
     )
 
 
+def _set_webhook_error(error: action_webhook_pb2.WebhookError, exc: Exception) -> None:
+    """Describe *exc* with the status the unary ``Webhook`` call would fail with."""
+    if isinstance(exc, ActionExecutionRejection):
+        logger.debug(exc)
+        code = grpc.StatusCode.INTERNAL
+        details = ActionExecutionFailed(
+            action_name=exc.action_name, message=exc.message
+        ).model_dump_json()
+    elif isinstance(exc, (ActionNotFoundException, ActionMissingDomainException)):
+        logger.error(exc)
+        code = grpc.StatusCode.NOT_FOUND
+        details = ResourceNotFound(
+            action_name=exc.action_name,
+            message=exc.message,
+            resource_type=(
+                ResourceNotFoundType.ACTION
+                if isinstance(exc, ActionNotFoundException)
+                else ResourceNotFoundType.DOMAIN
+            ),
+        ).model_dump_json()
+    elif isinstance(exc, ActionMissingTrackerException):
+        logger.debug(exc)
+        code = grpc.StatusCode.NOT_FOUND
+        details = ResourceNotFound(
+            action_name=exc.action_name,
+            message=exc.message,
+            resource_type=ResourceNotFoundType.TRACKER,
+        ).model_dump_json()
+    elif isinstance(exc, ActionServerOverloadedException):
+        code = grpc.StatusCode.RESOURCE_EXHAUSTED
+        details = ActionExecutionFailed(
+            action_name=exc.action_name, message=exc.message
+        ).model_dump_json()
+        if exc.retry_after is not None:
+            error.retry_after = exc.retry_after
+    elif isinstance(exc, ActionTimeoutException):
+        logger.warning(exc)
+        code = grpc.StatusCode.DEADLINE_EXCEEDED
+        details = ActionExecutionFailed(
+            action_name=exc.action_name, message=exc.message
+        ).model_dump_json()
+    else:
+        logger.exception(exc)
+        code = grpc.StatusCode.INTERNAL
+        details = str(exc)
+
+    error.code = code.value[0]
+    error.details = details
+
+
+def _set_overloaded_status(
+    exc: ActionServerOverloadedException,
+    context: grpc.aio.ServicerContext,
+) -> None:
+    """Reject a call with ``RESOURCE_EXHAUSTED`` because the server is overloaded.
+
+    The retry delay is sent in the ``grpc-retry-pushback-ms`` trailer which
+    gRPC clients with retry policies honour.
+    """
+    context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+    context.set_details(
+        ActionExecutionFailed(
+            action_name=exc.action_name, message=exc.message
+        ).model_dump_json()
+    )
+    if exc.retry_after is not None:
+        context.set_trailing_metadata(
+            (("grpc-retry-pushback-ms", str(int(exc.retry_after * 1000))),)
+        )
+
+
 def _set_grpc_span_attributes(
     span: Any, action_call: Dict[str, Any], method_name: str
 ) -> None:
@@ -709,11 +1101,15 @@ def _initialise_interrupts(server: grpc.Server) -> None:
     )
 
 
-def _initialise_health_service(server: grpc.Server):
+def _initialise_health_service(
+    server: grpc.Server, readiness_monitor: Optional[ReadinessMonitor] = None
+):
     """Initialise the health service.
 
     Args:
         server: The gRPC server.
+        readiness_monitor: Switches the action service to `NOT_SERVING` while
+            the server isn't ready.
     """
     health_servicer = health.HealthServicer(
         experimental_non_blocking=True,
@@ -722,12 +1118,26 @@ def _initialise_health_service(server: grpc.Server):
     health_servicer.set(GRPC_ACTION_SERVER_NAME, health_pb2.HealthCheckResponse.SERVING)
     health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
 
+    if readiness_monitor is not None:
+        readiness_monitor.add_listener(
+            lambda ready: health_servicer.set(
+                GRPC_ACTION_SERVER_NAME,
+                health_pb2.HealthCheckResponse.SERVING
+                if ready
+                else health_pb2.HealthCheckResponse.NOT_SERVING,
+            )
+        )
+
 
 def _initialise_action_service(
     server: grpc.Server,
     action_executor: ActionExecutor,
     auto_reload: bool,
     endpoints: str,
+    compression_min_size: Optional[int] = None,
+    worker: Optional[GRPCWorker] = None,
+    multiplex_max_in_flight: int = DEFAULT_GRPC_MULTIPLEX_MAX_IN_FLIGHT,
+    stream_sink_factory: Callable[[], asyncio.Queue] = StreamSink,
 ):
     """Initialise the action service.
 
@@ -736,10 +1146,26 @@ def _initialise_action_service(
         action_executor: The action executor.
         auto_reload: Enable auto-reloading of modules containing Action subclasses.
         endpoints: Path to the endpoints file.
+        compression_min_size: Size in bytes below which response messages are
+            sent uncompressed.
+        worker: The worker process the service runs in.
+        multiplex_max_in_flight: Maximum number of requests of a single
+            `WebhookMultiplex` stream which are processed at the same time.
+        stream_sink_factory: Creates the queue of the events of a
+            `WebhookStream` call.
     """
     tracer_provider = get_tracer_provider(endpoints)
     action_webhook_pb2_grpc.add_ActionServiceServicer_to_server(
-        GRPCActionServerWebhook(action_executor, auto_reload, tracer_provider), server
+        GRPCActionServerWebhook(
+            action_executor,
+            auto_reload,
+            tracer_provider,
+            compression_min_size=compression_min_size,
+            worker=worker,
+            multiplex_max_in_flight=multiplex_max_in_flight,
+            stream_sink_factory=stream_sink_factory,
+        ),
+        server,
     )
 
 
@@ -749,13 +1175,15 @@ def _initialise_port(
     ssl_server_cert: Optional[bytes] = None,
     ssl_server_cert_key: Optional[bytes] = None,
     ssl_ca_cert: Optional[bytes] = None,
+    unix_socket: Optional[str] = None,
 ) -> None:
+    address = f"unix:{unix_socket}" if unix_socket else f"[::]:{port}"
     if ssl_server_cert and ssl_server_cert_key:
         # Use SSL/TLS if certificate and key are provided
         grpc.ssl_channel_credentials()
-        logger.info(f"Starting gRPC server with SSL support on port {port}")
+        logger.info(f"Starting gRPC server with SSL support on {address}")
         server.add_secure_port(
-            f"[::]:{port}",
+            address,
             server_credentials=grpc.ssl_server_credentials(
                 private_key_certificate_chain_pairs=[
                     (ssl_server_cert_key, ssl_server_cert)
@@ -765,9 +1193,9 @@ def _initialise_port(
             ),
         )
     else:
-        logger.info(f"Starting gRPC server without SSL on port {port}")
+        logger.info(f"Starting gRPC server without SSL on {address}")
         # Use insecure connection if no SSL/TLS information is provided
-        server.add_insecure_port(f"[::]:{port}")
+        server.add_insecure_port(address)
 
 
 def _initialise_grpc_server(
@@ -779,6 +1207,10 @@ def _initialise_grpc_server(
     ssl_ca_cert: Optional[bytes] = None,
     auto_reload: bool = False,
     endpoints: str = DEFAULT_ENDPOINTS_PATH,
+    unix_socket: Optional[str] = None,
+    options: Optional[GRPCServerOptions] = None,
+    worker: Optional[GRPCWorker] = None,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
 ) -> grpc.Server:
     """Create a gRPC server to handle incoming action requests.
 
@@ -791,18 +1223,45 @@ def _initialise_grpc_server(
         ssl_ca_cert: File path to the SSL CA certificate file.
         auto_reload: Enable auto-reloading of modules containing Action subclasses.
         endpoints: Path to the endpoints file.
+        unix_socket: Path of a Unix domain socket to listen on instead of `port`.
+        options: Tuning of the server and of the compression of its responses.
+        worker: The worker process the server runs in. The port is then bound
+            with `SO_REUSEPORT` and the server also listens on the private
+            socket of the worker.
+        readiness_monitor: Decides whether the health service reports the
+            action service as serving.
 
     Returns:
         The gRPC server.
     """
+    options = options or GRPCServerOptions()
+    channel_options = options.channel_options()
+    if worker is not None:
+        channel_options.append(("grpc.so_reuseport", 1))
     server = aio.server(
-        futures.ThreadPoolExecutor(max_workers=max_number_of_workers),
-        compression=grpc.Compression.Gzip,
+        futures.ThreadPoolExecutor(
+            max_workers=options.thread_pool_size or max_number_of_workers
+        ),
+        options=channel_options,
+        compression=options.server_compression,
     )
 
-    _initialise_health_service(server)
-    _initialise_action_service(server, action_executor, auto_reload, endpoints)
-    _initialise_port(server, port, ssl_server_cert, ssl_server_cert_key, ssl_ca_cert)
+    _initialise_health_service(server, readiness_monitor)
+    _initialise_action_service(
+        server,
+        action_executor,
+        auto_reload,
+        endpoints,
+        compression_min_size=options.message_compression_min_size,
+        worker=worker,
+        multiplex_max_in_flight=options.multiplex_max_in_flight,
+        stream_sink_factory=options.stream_sink_factory,
+    )
+    _initialise_port(
+        server, port, ssl_server_cert, ssl_server_cert_key, ssl_ca_cert, unix_socket
+    )
+    if worker is not None:
+        server.add_insecure_port(f"unix:{worker.socket_path}")
 
     return server
 
@@ -815,6 +1274,11 @@ async def run_grpc(
     ssl_ca_file_path: Optional[str] = None,
     auto_reload: bool = False,
     endpoints: str = DEFAULT_ENDPOINTS_PATH,
+    metrics_port: Optional[int] = None,
+    unix_socket: Optional[str] = None,
+    options: Optional[GRPCServerOptions] = None,
+    worker: Optional[GRPCWorker] = None,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
 ):
     """Start a gRPC server to handle incoming action requests.
 
@@ -826,6 +1290,13 @@ async def run_grpc(
         ssl_ca_file_path: File path to the SSL CA certificate file.
         auto_reload: Enable auto-reloading of modules containing Action subclasses.
         endpoints: Path to the endpoints file.
+        metrics_port: Port of a side HTTP server exposing `/metrics`. The
+            metrics are not exposed when `None`.
+        unix_socket: Path of a Unix domain socket to listen on instead of `port`.
+        options: Tuning of the server and of the compression of its responses.
+        worker: The worker process the server runs in, see `run_grpc_workers`.
+        readiness_monitor: Reports the action service as `NOT_SERVING` to
+            health checks while the server is overloaded.
     """
     max_number_of_workers = number_of_sanic_workers()
     ssl_server_cert = (
@@ -847,10 +1318,134 @@ async def run_grpc(
         ssl_ca_cert,
         auto_reload,
         endpoints,
+        unix_socket,
+        options,
+        worker,
+        readiness_monitor,
     )
 
     _initialise_interrupts(server)
 
+    module_watcher = None
+    if auto_reload:
+        # The watcher thread reloads the executor itself, off the event loop.
+        module_watcher = ModuleWatcher(
+            action_executor.watched_paths(), action_executor.reload
+        )
+        module_watcher.start()
+
+    async def collect_metrics() -> Dict[str, Any]:
+        snapshot = action_executor.collect_metrics()
+        if worker is None:
+            return snapshot
+        # Every worker shares its metrics, and `/metrics` merges them.
+        return await load_snapshots(worker.directory, snapshot)
+
+    snapshots_task = None
+    if worker is not None:
+        snapshots_task = asyncio.create_task(
+            write_snapshots(worker.directory, action_executor.collect_metrics)
+        )
+
+    metrics_server = None
+    if metrics_port is not None:
+        metrics_server = await start_metrics_server(collect_metrics, metrics_port)
+
+    readiness_task = None
+    if readiness_monitor is not None and readiness_monitor.enabled:
+        readiness_task = asyncio.create_task(readiness_monitor.watch(action_executor))
+
     await server.start()
-    logger.info(f"gRPC Server started on port {port}")
-    await server.wait_for_termination()
+    if unix_socket:
+        logger.info(f"gRPC Server started on unix socket {unix_socket}")
+    else:
+        logger.info(f"gRPC Server started on port {port}")
+    try:
+        await server.wait_for_termination()
+    finally:
+        if module_watcher is not None:
+            module_watcher.stop()
+        if metrics_server is not None:
+            metrics_server.close()
+        if readiness_task is not None:
+            readiness_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await readiness_task
+        if worker is not None:
+            snapshots_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await snapshots_task
+            # Keep the counters of this worker after it stopped.
+            with contextlib.suppress(OSError):
+                write_snapshot(worker.directory, action_executor.collect_metrics())
+            await worker.close()
+
+
+def run_grpc_workers(
+    worker_count: int,
+    action_executor: ActionExecutor,
+    port: int = DEFAULT_SERVER_PORT,
+    ssl_server_cert_path: Optional[str] = None,
+    ssl_server_cert_key_file_path: Optional[str] = None,
+    ssl_ca_file_path: Optional[str] = None,
+    auto_reload: bool = False,
+    endpoints: str = DEFAULT_ENDPOINTS_PATH,
+    metrics_port: Optional[int] = None,
+    options: Optional[GRPCServerOptions] = None,
+    readiness_monitor: Optional[ReadinessMonitor] = None,
+) -> None:
+    """Serve gRPC requests from several processes sharing the same port.
+
+    The worker processes are forked from the current process, so they inherit
+    the registered actions, and each runs its own event loop and executor.
+    The port is bound with `SO_REUSEPORT`, which lets the kernel distribute
+    the connections across the workers. Crashed workers are restarted.
+
+    Args:
+        worker_count: Number of worker processes.
+        action_executor: The action executor.
+        port: Port to start the server on.
+        ssl_server_cert_path: File path to the client SSL certificate.
+        ssl_server_cert_key_file_path: File path to the SSL key for client cert.
+        ssl_ca_file_path: File path to the SSL CA certificate file.
+        auto_reload: Enable auto-reloading of modules containing Action subclasses.
+        endpoints: Path to the endpoints file.
+        metrics_port: Port of a side HTTP server exposing the merged `/metrics`
+            of all workers. The metrics are not exposed when `None`.
+        options: Tuning of the server and of the compression of its responses.
+        readiness_monitor: Decides whether a worker reports the action service
+            as serving. Every worker watches its own load.
+    """
+    directory = tempfile.mkdtemp(prefix="rasa-sdk-grpc-workers-")
+    temporary_domain_store = None
+    if action_executor.domain_store is None:
+        # Share the domain between the workers, so that a domain sent to one
+        # of them doesn't need to be sent to each of the others as well.
+        temporary_domain_store = DomainStore.create_temporary()
+        action_executor.domain_store = temporary_domain_store
+
+    def run_worker(index: int) -> None:
+        asyncio.run(
+            run_grpc(
+                action_executor,
+                port,
+                ssl_server_cert_path,
+                ssl_server_cert_key_file_path,
+                ssl_ca_file_path,
+                auto_reload,
+                endpoints,
+                # Only the first worker binds the metrics port.
+                metrics_port=metrics_port if index == 0 else None,
+                options=options,
+                worker=GRPCWorker(index, directory),
+                readiness_monitor=readiness_monitor,
+            )
+        )
+
+    logger.info(f"Starting {worker_count} gRPC workers on port {port}.")
+    try:
+        supervise_workers(worker_count, run_worker)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        if temporary_domain_store is not None:
+            temporary_domain_store.remove()
@@ -0,0 +1,200 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Text,
+)
+
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.struct_pb2 import Struct
+
+from rasa_sdk.grpc_py import action_webhook_pb2
+from rasa_sdk.interfaces import Tracker
+
+
+def _structs_to_dicts(structs: Any) -> Any:
+    return [MessageToDict(struct) for struct in structs]
+
+
+# Converts the tracker message fields which aren't plain Python values. The
+# results match converting the whole request with `MessageToDict`.
+_FIELD_CONVERTERS: Dict[Text, Callable[[Any], Any]] = {
+    "slots": MessageToDict,
+    "latest_message": MessageToDict,
+    "events": _structs_to_dicts,
+    "stack": _structs_to_dicts,
+    "active_loop": dict,
+}
+
+
+class ProtoTrackerState(Mapping[Text, Any]):
+    """Tracker state backed by the tracker message of a gRPC request.
+
+    Behaves like the dictionary `MessageToDict` creates for the message, but
+    every field is only converted to Python objects when it's first read.
+    Actions which only look at a few slots therefore never pay for converting
+    all events of the conversation.
+    """
+
+    def __init__(self, message: action_webhook_pb2.Tracker) -> None:
+        """Creates a `ProtoTrackerState`.
+
+        Args:
+            message: The tracker message of the request.
+        """
+        self._message = message
+        self._values: Dict[Text, Any] = {}
+        self._fields: Optional[FrozenSet[Text]] = None
+
+    @property
+    def fields(self) -> FrozenSet[Text]:
+        """Names of the fields which are set in the message."""
+        if self._fields is None:
+            self._fields = frozenset(
+                field.name for field, _ in self._message.ListFields()
+            )
+        return self._fields
+
+    def __getitem__(self, key: Text) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key not in self.fields:
+            raise KeyError(key)
+
+        value = getattr(self._message, key)
+        converter = _FIELD_CONVERTERS.get(key)
+        if converter is not None:
+            value = converter(value)
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.fields
+
+    def __iter__(self) -> Iterator[Text]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def count(self, key: Text) -> int:
+        """Return the number of items of the repeated field `key`.
+
+        Doesn't convert the field if it wasn't read yet.
+        """
+        if key in self._values:
+            return len(self._values[key])
+        if key not in self.fields:
+            return 0
+        return len(getattr(self._message, key))
+
+    def raw_events(self) -> Sequence[Any]:
+        """Return the events without converting them if they weren't read yet.
+
+        Unconverted events are `Struct` messages of a copy of the events, so
+        keeping them doesn't keep the whole request message alive.
+        """
+        if "events" in self._values:
+            return self._values["events"]
+
+        events = action_webhook_pb2.Tracker()
+        events.events.extend(self._message.events)
+        return events.events
+
+    def replace(self, key: Text, value: Any) -> "ProtoTrackerState":
+        """Return a copy of the state in which the field `key` has `value`.
+
+        The copy shares the message and the fields converted so far.
+        """
+        state = ProtoTrackerState(self._message)
+        state._values = {**self._values, key: value}
+        state._fields = self.fields | {key}
+        return state
+
+    def to_tracker(self) -> "ProtoTracker":
+        """Create the `Tracker` passed to the action."""
+        return ProtoTracker(self)
+
+
+def count_events(tracker_state: Mapping[Text, Any]) -> int:
+    """Return the number of events of a tracker state.
+
+    Events of a `ProtoTrackerState` are counted without converting them.
+    """
+    if isinstance(tracker_state, ProtoTrackerState):
+        return tracker_state.count("events")
+    return len(tracker_state.get("events") or [])
+
+
+def raw_events(tracker_state: Mapping[Text, Any]) -> Sequence[Any]:
+    """Return the events of a tracker state without converting them.
+
+    See `ProtoTrackerState.raw_events`. `events_to_dicts` converts them.
+    """
+    if isinstance(tracker_state, ProtoTrackerState):
+        return tracker_state.raw_events()
+    return tracker_state.get("events") or []
+
+
+def events_to_dicts(events: Iterable[Any]) -> List[Dict[Text, Any]]:
+    """Convert the events which `raw_events` left as `Struct` messages."""
+    return [
+        MessageToDict(event) if isinstance(event, Struct) else event for event in events
+    ]
+
+
+class _LazyField:
+    """Tracker attribute which is read from the tracker state on first access."""
+
+    def __init__(self, default_factory: Callable[[], Any]) -> None:
+        self.default_factory = default_factory
+
+    def __set_name__(self, owner: type, name: Text) -> None:
+        self.name = name
+
+    def __get__(self, tracker: Optional["ProtoTracker"], owner: type) -> Any:
+        if tracker is None:
+            return self
+
+        if self.name not in tracker.__dict__:
+            value = tracker._state.get(self.name) or self.default_factory()
+            tracker.__dict__[self.name] = value
+        return tracker.__dict__[self.name]
+
+    def __set__(self, tracker: "ProtoTracker", value: Any) -> None:
+        tracker.__dict__[self.name] = value
+
+
+class ProtoTracker(Tracker):
+    """A `Tracker` backed by the tracker message of a gRPC request.
+
+    The events, slots, latest message, active loop and stack are converted
+    when the action first reads them. Everything else behaves exactly like a
+    `Tracker` created with `Tracker.from_dict`.
+    """
+
+    events = _LazyField(list)
+    slots = _LazyField(dict)
+    latest_message = _LazyField(dict)
+    active_loop = _LazyField(dict)
+    stack = _LazyField(list)
+
+    def __init__(self, state: ProtoTrackerState) -> None:
+        """Creates a `ProtoTracker`.
+
+        Args:
+            state: The state of the tracker message.
+        """
+        self._state = state
+        self.sender_id = state.get("sender_id", "")
+        self.followup_action = state.get("followup_action")
+        self._paused = state.get("paused", False)
+        self.latest_action_name = state.get("latest_action_name")
+        self.user_id = state.get("user_id")
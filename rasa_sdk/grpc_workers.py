@@ -0,0 +1,183 @@
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Text
+
+import grpc
+from grpc import aio
+
+from rasa_sdk.constants import DEFAULT_GRPC_WORKER_RESTART_DELAY_SECONDS
+from rasa_sdk.grpc_py import action_webhook_pb2, action_webhook_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+# Separates the index of the worker owning a streamed response from the
+# random part of its `response_id`.
+RESPONSE_ID_SEPARATOR = "-"
+
+
+def worker_socket_path(directory: Text, index: int) -> Text:
+    """Return the path of the Unix domain socket of the worker `index`."""
+    return os.path.join(directory, f"worker-{index}.sock")
+
+
+class GRPCWorker:
+    """One of several gRPC server processes which share the same port.
+
+    The kernel distributes the connections of clients across the workers, so
+    the `AckStreamChunks` call for a streamed response may reach another
+    worker than the `WebhookStream` call which produced it. Every worker
+    therefore prefixes its `response_id`s with its index and additionally
+    listens on a private Unix domain socket, to which the other workers
+    forward acknowledgements they don't own.
+    """
+
+    def __init__(self, index: int, directory: Text) -> None:
+        """Creates a `GRPCWorker`.
+
+        Args:
+            index: Index of the worker, unique among its siblings.
+            directory: Directory shared by all workers. It holds their Unix
+                domain sockets and metrics snapshots.
+        """
+        self.index = index
+        self.directory = directory
+        self._channels: Dict[int, aio.Channel] = {}
+
+    @property
+    def socket_path(self) -> Text:
+        """Path of the private Unix domain socket of this worker."""
+        return worker_socket_path(self.directory, self.index)
+
+    def new_response_id(self) -> Text:
+        """Create a `response_id` which identifies this worker as its owner."""
+        return f"{self.index}{RESPONSE_ID_SEPARATOR}{uuid.uuid4().hex}"
+
+    @staticmethod
+    def owner(response_id: Text) -> Optional[int]:
+        """Return the index of the worker which created `response_id`."""
+        index, separator, _ = response_id.partition(RESPONSE_ID_SEPARATOR)
+        if not separator or not index.isdigit():
+            return None
+        return int(index)
+
+    async def forward_ack(
+        self,
+        owner: int,
+        request: action_webhook_pb2.StreamChunkAck,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Forward an `AckStreamChunks` call to the worker owning the response.
+
+        Args:
+            owner: Index of the worker owning the streamed response.
+            request: The acknowledgement to forward.
+            timeout: Maximum number of seconds to wait for the owner.
+        """
+        channel = self._channels.get(owner)
+        if channel is None:
+            channel = aio.insecure_channel(
+                f"unix:{worker_socket_path(self.directory, owner)}"
+            )
+            self._channels[owner] = channel
+
+        try:
+            await action_webhook_pb2_grpc.ActionServiceStub(channel).AckStreamChunks(
+                request, timeout=timeout
+            )
+        except grpc.aio.AioRpcError as e:
+            logger.debug(
+                f"Failed to forward the acknowledgement of response "
+                f"'{request.response_id}' to gRPC worker {owner}: {e.details()}"
+            )
+
+    async def close(self) -> None:
+        """Close the channels to the other workers."""
+        for channel in self._channels.values():
+            await channel.close()
+        self._channels.clear()
+
+
+def _run_worker(run: Callable[[int], Any], index: int) -> None:
+    # The worker handles signals itself instead of forwarding them again.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    run(index)
+
+
+def supervise_workers(
+    worker_count: int,
+    run: Callable[[int], Any],
+    restart_delay: float = DEFAULT_GRPC_WORKER_RESTART_DELAY_SECONDS,
+) -> None:
+    """Run `worker_count` forked worker processes until they are stopped.
+
+    Workers which crash are restarted after `restart_delay` seconds. SIGINT
+    and SIGTERM received by the supervisor are forwarded to the workers as
+    SIGTERM, and the supervisor returns once all workers have exited.
+
+    Args:
+        worker_count: Number of worker processes.
+        run: Runs the worker with the given index in the forked process.
+        restart_delay: Number of seconds to wait before a crashed worker is
+            restarted.
+    """
+    context = multiprocessing.get_context("fork")
+    processes: Dict[int, multiprocessing.process.BaseProcess] = {}
+    stopping = False
+
+    def start(index: int) -> None:
+        process = context.Process(
+            target=_run_worker, args=(run, index), name=f"grpc-worker-{index}"
+        )
+        process.start()
+        processes[index] = process
+        logger.info(f"Started gRPC worker {index} (pid {process.pid}).")
+
+    def stop(signal_number: int, _: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        logger.info(
+            f"Received {signal.Signals(signal_number).name} signal. "
+            "Stopping gRPC workers..."
+        )
+        for process in processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    previous_handlers = {
+        signal_number: signal.signal(signal_number, stop)
+        for signal_number in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        for index in range(worker_count):
+            start(index)
+
+        while processes:
+            multiprocessing.connection.wait(
+                [process.sentinel for process in processes.values()]
+            )
+            for index, process in list(processes.items()):
+                if process.is_alive():
+                    continue
+
+                process.join()
+                del processes[index]
+                if stopping or process.exitcode == 0:
+                    logger.info(f"gRPC worker {index} stopped.")
+                    continue
+
+                logger.warning(
+                    f"gRPC worker {index} exited with code {process.exitcode}. "
+                    f"Restarting it in {restart_delay} seconds."
+                )
+                time.sleep(restart_delay)
+                if not stopping:
+                    start(index)
+    finally:
+        for signal_number, handler in previous_handlers.items():
+            signal.signal(signal_number, handler)
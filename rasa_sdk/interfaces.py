@@ -338,6 +338,14 @@ class Tracker:
 class Action:
     """Next action to be taken in response to a dialogue state."""
 
+    # Number of seconds `run` may take before it's cancelled. `None` uses the
+    # default timeout of the action server.
+    timeout: Optional[float] = None
+    # Whether synchronous code of the action, e.g. a synchronous `run` method,
+    # runs in the thread pool of the action server. Disable it for fast code
+    # which may run directly in the event loop.
+    run_in_thread: bool = True
+
     def name(self) -> Text:
         """Unique identifier of this simple action."""
         raise NotImplementedError("An action must implement a name")
@@ -419,3 +427,91 @@ class ActionMissingDomainException(Exception):
     def __str__(self) -> Text:
         """Return the string representation of the exception."""
         return self.message
+
+
+class ActionMissingTrackerException(Exception):
+    """Raised when the events preceding an incremental tracker aren't cached."""
+
+    def __init__(
+        self,
+        action_name: Text,
+        sender_id: Optional[Text] = None,
+        message: Optional[Text] = None,
+    ) -> None:
+        """Create an exception for when the tracker can't be completed.
+
+        Args:
+            action_name: Name of the called action.
+            sender_id: Id of the conversation of the call.
+            message: Optional message to provide more information.
+        """
+        self.action_name = action_name
+        self.sender_id = sender_id
+        self.message = message or (
+            f"The action server doesn't hold the earlier events of conversation "
+            f"'{sender_id}', assistant will retry the request and include the "
+            f"full tracker in the request payload."
+        )
+
+    def __str__(self) -> Text:
+        """Return the string representation of the exception."""
+        return self.message
+
+
+class ActionServerOverloadedException(Exception):
+    """Raised when an action call is rejected because the server is overloaded."""
+
+    def __init__(
+        self,
+        action_name: Text,
+        message: Optional[Text] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Create an exception for when an action call is shed.
+
+        Args:
+            action_name: Name of the action that was rejected.
+            message: Optional message to provide more information.
+            retry_after: Number of seconds after which the call may be retried.
+        """
+        self.action_name = action_name
+        self.retry_after = retry_after
+        self.message = message or (
+            f"The action server is overloaded and rejected the call of "
+            f"action '{action_name}'. Please retry later."
+        )
+
+    def __str__(self) -> Text:
+        """Return the string representation of the exception."""
+        return self.message
+
+
+class ActionTimeoutException(Exception):
+    """Raised when an action call did not finish before its deadline."""
+
+    def __init__(
+        self,
+        action_name: Text,
+        message: Optional[Text] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Create an exception for when an action call timed out.
+
+        Args:
+            action_name: Name of the action that timed out.
+            message: Optional message to provide more information.
+            timeout: Number of seconds the action call was allowed to take.
+        """
+        self.action_name = action_name
+        self.timeout = timeout
+        self.message = message or (
+            f"Custom action '{action_name}' did not finish within "
+            f"{timeout:g} seconds and was cancelled."
+            if timeout is not None
+            else f"Custom action '{action_name}' did not finish in time and was "
+            f"cancelled."
+        )
+
+    def __str__(self) -> Text:
+        """Return the string representation of the exception."""
+        return self.message
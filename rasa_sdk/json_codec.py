@@ -0,0 +1,157 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Text, Union
+
+from rasa_sdk.constants import DEFAULT_JSON_CODEC
+
+logger = logging.getLogger(__name__)
+
+
+class JSONCodec:
+    """Decode action calls and encode action results using the standard library.
+
+    This is the fallback codec which is always available. Faster codecs
+    subclass it and override :meth:`loads` and :meth:`dumps`.
+    """
+
+    name: Text = "json"
+
+    def loads(self, data: Union[bytes, Text]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded Python object.
+
+        Raises:
+            ValueError: If `data` is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 encoded JSON.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            The encoded JSON document.
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initializes the codec."""
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, Text]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as JSON.
+
+        Falls back to the standard library for values `orjson` refuses to
+        encode (e.g. integers larger than 64 bits).
+        """
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return super().dumps(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by `msgspec`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initializes the codec."""
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._encode_error = msgspec.EncodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, Text]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as JSON.
+
+        Falls back to the standard library for values `msgspec` refuses to
+        encode.
+        """
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, self._encode_error):
+            return super().dumps(obj)
+
+
+JSON_CODECS: Dict[Text, Callable[[], JSONCodec]] = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+# Order in which codecs are tried when the codec is selected automatically.
+_AUTO_CODEC_PREFERENCE = (OrjsonCodec.name, MsgspecCodec.name, JSONCodec.name)
+
+
+def get_json_codec(name: Optional[Text] = DEFAULT_JSON_CODEC) -> JSONCodec:
+    """Return the JSON codec with the given name.
+
+    Args:
+        name: Name of the codec (`json`, `orjson` or `msgspec`). When `auto` or
+            `None`, the fastest installed codec is used.
+
+    Returns:
+        The codec. If the requested codec's library is not installed, the
+        standard library codec is returned instead.
+
+    Raises:
+        ValueError: If `name` is not a known codec.
+    """
+    if name is None or name == DEFAULT_JSON_CODEC:
+        for candidate in _AUTO_CODEC_PREFERENCE:
+            try:
+                codec = JSON_CODECS[candidate]()
+            except ImportError:
+                continue
+            logger.debug(f"Using JSON codec '{codec.name}'.")
+            return codec
+
+    if name not in JSON_CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{name}'. "
+            f"Valid options are: {', '.join([DEFAULT_JSON_CODEC, *JSON_CODECS])}."
+        )
+
+    try:
+        return JSON_CODECS[name]()
+    except ImportError:
+        logger.warning(
+            f"JSON codec '{name}' is not installed. "
+            f"Falling back to the '{JSONCodec.name}' codec."
+        )
+        return JSONCodec()
@@ -0,0 +1,536 @@
+import asyncio
+import bisect
+import json
+import logging
+import math
+import os
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Text,
+    Tuple,
+    TypeVar,
+)
+
+from rasa_sdk.constants import (
+    DEFAULT_METRICS_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_METRICS_REQUEST_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label value used for action names which are not registered, so that calls
+# with arbitrary action names can't create an unbounded number of series.
+UNKNOWN_ACTION_LABEL = "unknown"
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+DEFAULT_DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+DEFAULT_SIZE_BUCKETS = (
+    256.0,
+    1024.0,
+    4096.0,
+    16384.0,
+    65536.0,
+    262144.0,
+    1048576.0,
+    4194304.0,
+)
+
+LabelValues = Tuple[Text, ...]
+
+
+class Metric:
+    """A metric family with a fixed set of label names.
+
+    Metrics only keep plain dictionaries so they can be updated from the event
+    loop without locking and be pickled into every Sanic worker.
+    """
+
+    type: Text = COUNTER
+
+    def __init__(
+        self, name: Text, documentation: Text, label_names: Sequence[Text] = ()
+    ) -> None:
+        """Creates a metric.
+
+        Args:
+            name: Name of the metric.
+            documentation: Help text of the metric.
+            label_names: Names of the labels of the metric.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, Any] = {}
+
+    def samples(self) -> List[Tuple[LabelValues, Any]]:
+        """Return the current value of each series."""
+        return list(self._values.items())
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    type = COUNTER
+
+    def inc(self, *label_values: Text, amount: float = 1.0) -> None:
+        """Increase the series with the given label values by `amount`."""
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+
+class Gauge(Metric):
+    """A value which can go up and down."""
+
+    type = GAUGE
+
+    def inc(self, *label_values: Text, amount: float = 1.0) -> None:
+        """Increase the series with the given label values by `amount`."""
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, *label_values: Text, amount: float = 1.0) -> None:
+        """Decrease the series with the given label values by `amount`."""
+        self.inc(*label_values, amount=-amount)
+
+    def set(self, *label_values: Text, value: float) -> None:
+        """Set the series with the given label values to `value`."""
+        self._values[label_values] = value
+
+
+class Histogram(Metric):
+    """Counts observations in buckets and keeps their sum."""
+
+    type = HISTOGRAM
+
+    def __init__(
+        self,
+        name: Text,
+        documentation: Text,
+        label_names: Sequence[Text] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        """Creates a histogram.
+
+        Args:
+            name: Name of the metric.
+            documentation: Help text of the metric.
+            label_names: Names of the labels of the metric.
+            buckets: Upper bounds of the buckets in increasing order. The
+                `+Inf` bucket is added automatically.
+        """
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values: Text) -> None:
+        """Record an observation for the series with the given label values."""
+        series = self._values.get(label_values)
+        if series is None:
+            # Non-cumulative bucket counts (the last one is `+Inf`), sum, count.
+            series = self._values[label_values] = {
+                "buckets": [0] * (len(self.buckets) + 1),
+                "sum": 0.0,
+                "count": 0,
+            }
+        series["buckets"][bisect.bisect_left(self.buckets, value)] += 1
+        series["sum"] += value
+        series["count"] += 1
+
+    def samples(self) -> List[Tuple[LabelValues, Any]]:
+        """Return a copy of each series."""
+        return [
+            (label_values, {**series, "buckets": list(series["buckets"])})
+            for label_values, series in self._values.items()
+        ]
+
+
+MetricType = TypeVar("MetricType", bound=Metric)
+
+
+class MetricsRegistry:
+    """A collection of metrics which can be exported as a snapshot."""
+
+    def __init__(self) -> None:
+        """Creates an empty registry."""
+        self._metrics: Dict[Text, Metric] = {}
+
+    def register(self, metric: MetricType) -> MetricType:
+        """Add a metric to the registry.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def snapshot(self) -> Dict[Text, Any]:
+        """Return the current values of all metrics as JSON serialisable data."""
+        snapshot = {}
+        for metric in self._metrics.values():
+            snapshot[metric.name] = {
+                "type": metric.type,
+                "help": metric.documentation,
+                "labels": list(metric.label_names),
+                "buckets": list(getattr(metric, "buckets", [])),
+                "samples": [
+                    [list(label_values), value]
+                    for label_values, value in metric.samples()
+                ],
+            }
+        return snapshot
+
+
+class ActionServerMetrics:
+    """Request, error and duration (RED) metrics of the action server."""
+
+    def __init__(self) -> None:
+        """Creates the metrics of the action server."""
+        self.registry = MetricsRegistry()
+        self.action_duration = self.registry.register(
+            Histogram(
+                "rasa_sdk_action_duration_seconds",
+                "Time spent running an action.",
+                ["action_name"],
+            )
+        )
+        self.actions_in_flight = self.registry.register(
+            Gauge(
+                "rasa_sdk_actions_in_flight",
+                "Number of actions which are currently running.",
+                ["action_name"],
+            )
+        )
+        self.action_errors = self.registry.register(
+            Counter(
+                "rasa_sdk_action_errors_total",
+                "Number of action calls which failed, by exception type.",
+                ["action_name", "exception"],
+            )
+        )
+        self.stream_chunks = self.registry.register(
+            Counter(
+                "rasa_sdk_stream_chunks_total",
+                "Number of chunks streamed by actions.",
+                ["action_name"],
+            )
+        )
+        self.request_size = self.registry.register(
+            Histogram(
+                "rasa_sdk_request_size_bytes",
+                "Size of the request payloads.",
+                ["transport", "endpoint"],
+                buckets=DEFAULT_SIZE_BUCKETS,
+            )
+        )
+        self.response_size = self.registry.register(
+            Histogram(
+                "rasa_sdk_response_size_bytes",
+                "Size of the response payloads.",
+                ["transport", "endpoint"],
+                buckets=DEFAULT_SIZE_BUCKETS,
+            )
+        )
+        self.admission_queue_depth = self.registry.register(
+            Gauge(
+                "rasa_sdk_admission_queue_depth",
+                "Number of action calls waiting for a free slot.",
+            )
+        )
+
+
+def merge_snapshots(
+    snapshots: Iterable[Dict[Text, Any]],
+    live_snapshots: Optional[Iterable[Dict[Text, Any]]] = None,
+) -> Dict[Text, Any]:
+    """Combine the snapshots of several processes into one.
+
+    Counters and histograms of all snapshots are summed up. Gauges are summed
+    up from the snapshots in `live_snapshots` only, so gauges of processes
+    which are gone don't distort the current value.
+
+    Args:
+        snapshots: Snapshots of processes which stopped or crashed.
+        live_snapshots: Snapshots of processes which are still running.
+
+    Returns:
+        The merged snapshot.
+    """
+    merged: Dict[Text, Any] = {}
+    tagged = [(snapshot, False) for snapshot in snapshots]
+    tagged += [(snapshot, True) for snapshot in live_snapshots or []]
+
+    for snapshot, is_live in tagged:
+        for name, family in snapshot.items():
+            if family["type"] == GAUGE and not is_live:
+                continue
+
+            target = merged.setdefault(
+                name,
+                {**family, "samples": {}},
+            )
+            for label_values, value in family["samples"]:
+                key = tuple(label_values)
+                existing = target["samples"].get(key)
+                if existing is None:
+                    target["samples"][key] = _copy_value(value)
+                elif family["type"] == HISTOGRAM:
+                    existing["sum"] += value["sum"]
+                    existing["count"] += value["count"]
+                    existing["buckets"] = [
+                        a + b for a, b in zip(existing["buckets"], value["buckets"])
+                    ]
+                else:
+                    target["samples"][key] = existing + value
+
+    for family in merged.values():
+        family["samples"] = [
+            [list(key), value] for key, value in family["samples"].items()
+        ]
+    return merged
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {**value, "buckets": list(value["buckets"])}
+    return value
+
+
+def _format_labels(names: Sequence[Text], values: Sequence[Text]) -> Text:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_number(value: float) -> Text:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_snapshot(snapshot: Dict[Text, Any]) -> Text:
+    """Render a snapshot in the Prometheus text exposition format."""
+    lines = []
+    for name, family in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        label_names = family["labels"]
+        for label_values, value in sorted(family["samples"]):
+            if family["type"] != HISTOGRAM:
+                labels = _format_labels(label_names, label_values)
+                lines.append(f"{name}{labels} {_format_number(value)}")
+                continue
+
+            cumulative = 0
+            bounds = [*family["buckets"], math.inf]
+            for bound, count in zip(bounds, value["buckets"]):
+                cumulative += count
+                labels = _format_labels(
+                    [*label_names, "le"], [*label_values, _format_number(bound)]
+                )
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _format_labels(label_names, label_values)
+            lines.append(f"{name}_sum{labels} {_format_number(value['sum'])}")
+            lines.append(f"{name}_count{labels} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def write_snapshot(directory: Text, snapshot: Dict[Text, Any]) -> None:
+    """Store the snapshot of the current process in `directory`.
+
+    The file is replaced atomically so readers never see a partial snapshot.
+    """
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(snapshot, file)
+    os.replace(temporary_path, path)
+
+
+async def write_snapshots(
+    directory: Text,
+    collect: Callable[[], Dict[Text, Any]],
+    interval: float = DEFAULT_METRICS_FLUSH_INTERVAL_SECONDS,
+) -> None:
+    """Periodically store the snapshot of the current process in `directory`.
+
+    Args:
+        directory: Directory the worker processes write their snapshots to.
+        collect: Returns the snapshot of the current process.
+        interval: Number of seconds between two snapshots.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, write_snapshot, directory, collect())
+        except OSError:
+            logger.debug("Failed to store the metrics snapshot.", exc_info=True)
+
+
+def collect_snapshots(
+    directory: Text, current_snapshot: Dict[Text, Any]
+) -> Dict[Text, Any]:
+    """Merge the snapshot of this process with those stored by other processes.
+
+    Args:
+        directory: Directory the worker processes write their snapshots to.
+        current_snapshot: Up to date snapshot of the current process. It
+            replaces the stored snapshot of this process.
+
+    Returns:
+        The merged snapshot of all processes.
+    """
+    stopped, live = [], [current_snapshot]
+    try:
+        file_names = os.listdir(directory)
+    except OSError:
+        file_names = []
+
+    for file_name in file_names:
+        pid_text, _, extension = file_name.partition(".")
+        if extension != "json" or not pid_text.isdigit():
+            continue
+        pid = int(pid_text)
+        if pid == os.getpid():
+            continue
+
+        try:
+            with open(os.path.join(directory, file_name), encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            logger.debug(f"Skipping unreadable metrics snapshot '{file_name}'.")
+            continue
+
+        (live if _is_process_alive(pid) else stopped).append(snapshot)
+
+    return merge_snapshots(stopped, live)
+
+
+async def load_snapshots(
+    directory: Text, current_snapshot: Dict[Text, Any]
+) -> Dict[Text, Any]:
+    """Merge the snapshots like `collect_snapshots`, without blocking the loop.
+
+    The stored snapshots are read in a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, collect_snapshots, directory, current_snapshot
+    )
+
+
+async def _read_request_head(reader: asyncio.StreamReader) -> bytes:
+    request_line = await reader.readline()
+    # The headers of the request are not needed.
+    while (await reader.readline()).strip():
+        pass
+    return request_line
+
+
+async def _handle_metrics_request(
+    collect: Callable[[], Awaitable[Dict[Text, Any]]],
+    request_timeout: float,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    try:
+        try:
+            request_line = await asyncio.wait_for(
+                _read_request_head(reader), request_timeout
+            )
+        except (asyncio.TimeoutError, ValueError):
+            # Clients which don't send the request in time, or send a line
+            # longer than the limit of the stream, are disconnected.
+            return
+
+        method, _, target = request_line.decode("latin-1").partition(" ")
+        path = target.split(" ")[0].split("?")[0]
+        if method == "GET" and path == "/metrics":
+            status, content_type = "200 OK", METRICS_CONTENT_TYPE
+            body = render_snapshot(await collect()).encode("utf-8")
+        else:
+            status, content_type = "404 Not Found", "text/plain; charset=utf-8"
+            body = b"Not Found\n"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(
+    collect: Callable[[], Awaitable[Dict[Text, Any]]],
+    port: int,
+    host: Text = "0.0.0.0",
+    request_timeout: float = DEFAULT_METRICS_REQUEST_TIMEOUT_SECONDS,
+) -> asyncio.AbstractServer:
+    """Serve `/metrics` on a separate port, e.g. next to the gRPC server.
+
+    Args:
+        collect: Returns the snapshot to expose.
+        port: Port to listen on.
+        host: Interface to listen on.
+        request_timeout: Number of seconds a client has to send its request
+            before it is disconnected.
+
+    Returns:
+        The started server.
+    """
+    server = await asyncio.start_server(
+        partial(_handle_metrics_request, collect, request_timeout), host, port
+    )
+    logger.info(f"Metrics are exposed on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Text
+
+from rasa_sdk.constants import (
+    DEFAULT_READINESS_CHECK_INTERVAL_SECONDS,
+    DEFAULT_READINESS_RECOVERY_RATIO,
+)
+from rasa_sdk.executor import ActionExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessMonitor:
+    """Decide whether the server should receive further action calls.
+
+    Orchestrators and load balancers keep sending traffic to a server as long
+    as it reports to be ready. The monitor therefore periodically checks the
+    load of the server and reports it as not ready once the lag of the event
+    loop, the number of running actions or the number of action calls waiting
+    for admission exceeds its limit.
+
+    To keep the readiness from flapping around a limit, the server only
+    becomes ready again once every value dropped to `recovery_ratio` times
+    its limit. Limits left at `None` aren't checked, so a monitor without
+    limits always reports the server as ready.
+    """
+
+    def __init__(
+        self,
+        max_loop_lag: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        recovery_ratio: float = DEFAULT_READINESS_RECOVERY_RATIO,
+        check_interval: float = DEFAULT_READINESS_CHECK_INTERVAL_SECONDS,
+    ) -> None:
+        """Creates a `ReadinessMonitor`.
+
+        Args:
+            max_loop_lag: Maximum number of seconds the event loop may be late
+                to run a scheduled callback.
+            max_in_flight: Maximum number of actions which run at the same time.
+            max_queue_depth: Maximum number of action calls which wait for
+                admission.
+            recovery_ratio: Fraction of each limit which all values must drop
+                to before the server becomes ready again.
+            check_interval: Number of seconds between two checks.
+        """
+        self.max_loop_lag = max_loop_lag
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.recovery_ratio = recovery_ratio
+        self.check_interval = check_interval
+
+        self.ready = True
+        self.loop_lag = 0.0
+        self.reasons: List[Text] = []
+        self._listeners: List[Callable[[bool], Any]] = []
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop the listeners of the current process."""
+        state = self.__dict__.copy()
+        state["_listeners"] = []
+        return state
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return any(
+            limit is not None
+            for limit in (self.max_loop_lag, self.max_in_flight, self.max_queue_depth)
+        )
+
+    def add_listener(self, listener: Callable[[bool], Any]) -> None:
+        """Call `listener` with the new readiness whenever it changes."""
+        self._listeners.append(listener)
+
+    def status(self) -> Dict[Text, Any]:
+        """Return the readiness and the reasons the server isn't ready."""
+        return {
+            "status": "ready" if self.ready else "not ready",
+            "loop_lag": self.loop_lag,
+            "reasons": list(self.reasons),
+        }
+
+    def check(self, executor: ActionExecutor, loop_lag: float = 0.0) -> bool:
+        """Update the readiness from the current load of `executor`.
+
+        Args:
+            executor: The executor running the action calls.
+            loop_lag: Number of seconds the event loop was late in the last
+                check interval.
+
+        Returns:
+            Whether the server is ready.
+        """
+        self.loop_lag = loop_lag
+        values = [
+            ("event loop lag", loop_lag, self.max_loop_lag),
+            ("actions in flight", _in_flight(executor), self.max_in_flight),
+            ("queued action calls", _queue_depth(executor), self.max_queue_depth),
+        ]
+
+        # A server which isn't ready must drop below the recovery levels.
+        ratio = 1.0 if self.ready else self.recovery_ratio
+        self.reasons = [
+            f"{name} {value:g} exceeds {limit * ratio:g}"
+            for name, value, limit in values
+            if limit is not None and value > limit * ratio
+        ]
+
+        ready = not self.reasons
+        if ready != self.ready:
+            self._set_ready(ready)
+        return ready
+
+    def _set_ready(self, ready: bool) -> None:
+        self.ready = ready
+        if ready:
+            logger.info("The action server is ready again.")
+        else:
+            logger.warning(
+                f"The action server is overloaded and reports not to be ready: "
+                f"{', '.join(self.reasons)}."
+            )
+        for listener in self._listeners:
+            listener(ready)
+
+    async def watch(self, executor: ActionExecutor) -> None:
+        """Check the load of `executor` every `check_interval` seconds.
+
+        Runs until it's cancelled. The event loop lag is the time by which
+        waking up after each interval is late.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.check_interval
+            await asyncio.sleep(self.check_interval)
+            self.check(executor, max(loop.time() - scheduled, 0.0))
+
+
+def _in_flight(executor: ActionExecutor) -> float:
+    return sum(value for _, value in executor.metrics.actions_in_flight.samples())
+
+
+def _queue_depth(executor: ActionExecutor) -> float:
+    if executor.admission_controller is None:
+        return 0
+    return executor.admission_controller.queue_depth
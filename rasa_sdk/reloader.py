@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Text
+
+from rasa_sdk.constants import (
+    DEFAULT_AUTO_RELOAD_POLL_INTERVAL_SECONDS,
+    DEFAULT_AUTO_RELOAD_SIGNAL_INTERVAL_SECONDS,
+)
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+logger = logging.getLogger(__name__)
+
+# Directories which never contain action modules.
+_SKIPPED_DIRECTORIES = {"__pycache__", ".git", ".mypy_cache", ".pytest_cache"}
+
+
+def _add_modification_time(times: Dict[Text, float], path: Text) -> None:
+    try:
+        times[path] = os.stat(path).st_mtime
+    except OSError:
+        # The file was removed while scanning.
+        pass
+
+
+def snapshot_modification_times(paths: Iterable[Text]) -> Dict[Text, float]:
+    """Collect the modification times of the watched Python files.
+
+    Args:
+        paths: Files and directories to scan. Directories are scanned
+            recursively for Python files.
+
+    Returns:
+        Modification time by file path.
+    """
+    times: Dict[Text, float] = {}
+    for path in paths:
+        if not os.path.isdir(path):
+            _add_modification_time(times, path)
+            continue
+
+        for root, directories, files in os.walk(path):
+            directories[:] = [d for d in directories if d not in _SKIPPED_DIRECTORIES]
+            for name in files:
+                if name.endswith(".py"):
+                    _add_modification_time(times, os.path.join(root, name))
+    return times
+
+
+class ModuleWatcher:
+    """Watch action modules in a background thread.
+
+    Uses `watchfiles` (inotify on Linux) when it is installed. Otherwise the
+    modification times of the watched files are compared in a fixed interval.
+    Every detected change calls `on_change` from the watcher thread, so the
+    callback must not touch the event loop directly.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Text],
+        on_change: Callable[[], Any],
+        poll_interval: float = DEFAULT_AUTO_RELOAD_POLL_INTERVAL_SECONDS,
+        use_watchfiles: Optional[bool] = None,
+    ) -> None:
+        """Creates a `ModuleWatcher`.
+
+        Args:
+            paths: Module files and package directories to watch.
+            on_change: Called after one or more watched files changed.
+            poll_interval: Seconds between two scans of the polling fallback.
+            use_watchfiles: Whether to use `watchfiles`. Defaults to using it
+                if it is installed.
+        """
+        self.paths: List[Text] = [path for path in paths if os.path.exists(path)]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_watchfiles = (
+            watchfiles is not None if use_watchfiles is None else use_watchfiles
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="rasa-sdk-module-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.debug(
+            f"Watching {len(self.paths)} path(s) for changes of action modules "
+            f"({'watchfiles' if self.use_watchfiles else 'polling'})."
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop watching and wait for the watcher thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _watch(self) -> None:
+        if self.use_watchfiles:
+            self._watch_with_watchfiles()
+        else:
+            self._poll()
+
+    def _watch_with_watchfiles(self) -> None:
+        for _changes in watchfiles.watch(
+            *self.paths,
+            watch_filter=watchfiles.PythonFilter(),
+            stop_event=self._stop_event,
+            raise_interrupt=False,
+        ):
+            self._notify()
+
+    def _poll(self) -> None:
+        previous = snapshot_modification_times(self.paths)
+        while not self._stop_event.wait(self.poll_interval):
+            current = snapshot_modification_times(self.paths)
+            if current != previous:
+                previous = current
+                self._notify()
+
+    def _notify(self) -> None:
+        try:
+            self.on_change()
+        except Exception:
+            logger.exception("Error while handling changed action modules.")
+
+
+def signal_reload(generation: Any) -> None:
+    """Bump the shared reload counter which the server workers observe.
+
+    Args:
+        generation: A `multiprocessing.Value` holding an integer.
+    """
+    with generation.get_lock():
+        generation.value += 1
+
+
+async def reload_on_signal(
+    reload: Callable[[], Any],
+    generation: Any,
+    interval: float = DEFAULT_AUTO_RELOAD_SIGNAL_INTERVAL_SECONDS,
+) -> None:
+    """Run `reload` in a worker thread whenever the shared counter changes.
+
+    Reading the counter is a shared memory access, so every worker process
+    notices a change within `interval` seconds without any file system access.
+
+    Args:
+        reload: Reloads the actions of this process.
+        generation: A `multiprocessing.Value` bumped by `signal_reload`.
+        interval: Seconds between two checks of the counter.
+    """
+    loop = asyncio.get_running_loop()
+    seen = generation.value
+    while True:
+        await asyncio.sleep(interval)
+        current = generation.value
+        if current == seen:
+            continue
+
+        seen = current
+        try:
+            await loop.run_in_executor(None, reload)
+        except Exception:
+            logger.exception("Error while reloading actions.")
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Text,
+    Tuple,
+    TypeVar,
+)
+
+from rasa_sdk.constants import (
+    DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+)
+from rasa_sdk.grpc_tracker import count_events
+
+logger = logging.getLogger(__name__)
+
+ResultType = TypeVar("ResultType")
+
+ResponseCacheKey = Tuple[Text, Text, Text, int]
+
+
+class _InFlightCall:
+    """A running call which is shared by all identical callers."""
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class ResponseCache:
+    """De-duplicate retried action calls.
+
+    Rasa retries an action call when it doesn't receive the response in time.
+    Calls for the same action, conversation, user message and tracker state
+    are identical, so concurrent identical calls share one running execution
+    and the result of a finished call is returned again for a limited time
+    instead of running the action once more.
+
+    Only successful results are kept. Failed calls are not cached, so a retry
+    after an error runs the action again. The cache lives in the memory of a
+    single process: retries which reach another Sanic worker run the action
+    again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: float = DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Creates a `ResponseCache`.
+
+        Args:
+            max_entries: Maximum number of results to keep. The least recently
+                used results are dropped first.
+            ttl: Number of seconds a result is returned for identical calls.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlightCall] = {}
+        self._hits = 0
+        self._shared = 0
+        self._misses = 0
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop results and tasks of the current process."""
+        state = self.__dict__.copy()
+        state["_results"] = OrderedDict()
+        state["_in_flight"] = {}
+        return state
+
+    @staticmethod
+    def key(action_call: Dict[Text, Any]) -> Optional[ResponseCacheKey]:
+        """Return the key identifying the action call.
+
+        Returns:
+            The key, or `None` if the call can't be identified because it
+            lacks the conversation or the id of the latest user message.
+        """
+        action_name = action_call.get("next_action")
+        tracker = action_call.get("tracker")
+        # gRPC calls carry a `ProtoTrackerState` instead of a dict.
+        if not action_name or not isinstance(tracker, Mapping):
+            return None
+
+        sender_id = tracker.get("sender_id")
+        message_id = (tracker.get("latest_message") or {}).get("message_id")
+        if not sender_id or not message_id:
+            return None
+
+        return sender_id, message_id, action_name, count_events(tracker)
+
+    def stats(self) -> Dict[Text, Any]:
+        """Return the current state of the cache."""
+        return {
+            "entries": len(self._results),
+            "in_flight": len(self._in_flight),
+            "hits": self._hits,
+            "shared": self._shared,
+            "misses": self._misses,
+        }
+
+    def _cached_result(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._results[key]
+            return False, None
+
+        self._results.move_to_end(key)
+        return True, result
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        self._results[key] = (time.monotonic() + self.ttl, result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    async def get_or_run(
+        self, key: Hashable, run: Callable[[], Awaitable[ResultType]]
+    ) -> ResultType:
+        """Return the result of the call identified by `key`.
+
+        The result is taken from the cache, or from an identical call which is
+        already running. Otherwise `run` is called and its result is cached.
+
+        A caller which is cancelled stops waiting for the shared call. The
+        shared call itself is only cancelled when no caller waits for it
+        anymore.
+
+        Args:
+            key: Identifies the call, see `ResponseCache.key`.
+            run: Runs the call.
+
+        Returns:
+            The result of the call.
+        """
+        found, result = self._cached_result(key)
+        if found:
+            self._hits += 1
+            logger.debug(f"Returning the cached result of the action call {key}.")
+            return result
+
+        call = self._in_flight.get(key)
+        if call is None:
+            self._misses += 1
+            call = _InFlightCall(asyncio.ensure_future(run()))
+            self._in_flight[key] = call
+            call.task.add_done_callback(lambda task: self._finish(key, call))
+        else:
+            self._shared += 1
+            logger.debug(f"Waiting for the identical running action call {key}.")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _finish(self, key: Hashable, call: _InFlightCall) -> None:
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+        if not call.task.cancelled() and call.task.exception() is None:
+            self._store(key, call.task.result())
@@ -0,0 +1,131 @@
+import asyncio
+import contextlib
+from typing import Any, Dict, Optional, Text
+
+from rasa_sdk.constants import (
+    DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+    DEFAULT_STREAM_COALESCE_MAX_SIZE,
+    DEFAULT_STREAM_HIGH_WATER_MARK,
+)
+
+
+def _is_text_chunk(event: Dict[Text, Any]) -> bool:
+    return (
+        event.get("event") == "stream_chunk"
+        and len(event) == 2
+        and isinstance(event.get("text"), str)
+    )
+
+
+class StreamSink(asyncio.Queue):
+    """Bounded queue of the events a streaming action call produces.
+
+    Streaming transports read the events of `ActionExecutor.run` from this
+    queue. Once `high_water_mark` events wait to be sent, putting a further
+    `stream_chunk` blocks, so an action which produces chunks faster than the
+    client receives them is slowed down instead of growing the queue. Other
+    events never block, so the terminal `stream_done` or `stream_error`
+    always arrives.
+
+    Adjacent chunks which only contain text are merged into one chunk of at
+    most `coalesce_max_size` characters while they wait to be sent. With a
+    `coalesce_max_delay`, a text chunk is additionally held back for up to
+    that many seconds to let following chunks join it. Chunks always belong
+    to the same streamed response, since `stream_start` and `stream_end`
+    events separate the chunks of different responses.
+    """
+
+    def __init__(
+        self,
+        high_water_mark: int = DEFAULT_STREAM_HIGH_WATER_MARK,
+        coalesce_max_delay: float = DEFAULT_STREAM_COALESCE_MAX_DELAY_SECONDS,
+        coalesce_max_size: int = DEFAULT_STREAM_COALESCE_MAX_SIZE,
+    ) -> None:
+        """Creates a `StreamSink`.
+
+        Args:
+            high_water_mark: Number of queued events above which putting a
+                chunk waits until events were taken from the queue.
+            coalesce_max_delay: Maximum number of seconds a text chunk is held
+                back to be merged with following chunks.
+            coalesce_max_size: Maximum number of characters of a merged text
+                chunk. `0` disables merging.
+        """
+        super().__init__()
+        self.high_water_mark = high_water_mark
+        self.coalesce_max_delay = coalesce_max_delay
+        self.coalesce_max_size = coalesce_max_size
+
+        self._drained = asyncio.Event()
+        self._arrived = asyncio.Event()
+        # Text chunk taken by `get` which still accepts following chunks.
+        self._held: Optional[Dict[Text, Any]] = None
+
+    async def put(self, event: Dict[Text, Any]) -> None:
+        """Queue an event, waiting while too many chunks wait to be sent."""
+        if self._merge(event):
+            return
+
+        if event.get("event") == "stream_chunk":
+            while self.qsize() >= self.high_water_mark:
+                self._drained.clear()
+                await self._drained.wait()
+            if self._merge(event):
+                return
+
+        self.put_nowait(event)
+
+    def put_nowait(self, event: Dict[Text, Any]) -> None:
+        """Queue an event without respecting the high-water mark."""
+        if not self._merge(event):
+            super().put_nowait(event)
+        self._arrived.set()
+
+    async def get(self) -> Dict[Text, Any]:
+        """Take the next event, holding text chunks back to merge them."""
+        event = await super().get()
+        self._drained.set()
+        if self.coalesce_max_delay <= 0 or not self._accepts_merge(event, ""):
+            return event
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.coalesce_max_delay
+        self._held = event
+        try:
+            while self.empty() and self._accepts_merge(event, ""):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._arrived.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._arrived.wait(), remaining)
+        finally:
+            self._held = None
+        return event
+
+    def get_nowait(self) -> Dict[Text, Any]:
+        """Take the next event without holding it back."""
+        event = super().get_nowait()
+        self._drained.set()
+        return event
+
+    def _accepts_merge(self, target: Dict[Text, Any], text: Text) -> bool:
+        return (
+            _is_text_chunk(target)
+            and len(target["text"]) + len(text) <= self.coalesce_max_size
+        )
+
+    def _merge(self, event: Dict[Text, Any]) -> bool:
+        """Append the text of `event` to the last chunk waiting to be sent."""
+        if not _is_text_chunk(event):
+            return False
+
+        # Only the most recent event may absorb the chunk, so the order of
+        # events doesn't change.
+        target = self._queue[-1] if self._queue else self._held
+        if target is None or not self._accepts_merge(target, event["text"]):
+            return False
+
+        target["text"] += event["text"]
+        self._arrived.set()
+        return True
@@ -0,0 +1,87 @@
+import asyncio
+import contextlib
+import contextvars
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Text
+
+from rasa_sdk import utils
+from rasa_sdk.constants import DEFAULT_SYNC_ACTION_THREADS
+
+# Thread pool of the action which is currently running, if its synchronous
+# code is run in threads.
+_active_thread_pool: contextvars.ContextVar[Optional["SyncThreadPool"]] = (
+    contextvars.ContextVar("rasa_sdk_active_thread_pool", default=None)
+)
+
+
+class SyncThreadPool:
+    """Bounded pool of threads which runs the synchronous code of actions.
+
+    A synchronous action, or a synchronous `validate_` or `extract_` method of
+    a form, which waits for a blocking client blocks the event loop and thus
+    every other call the process handles. Running such code in a thread keeps
+    the event loop responsive. At most `max_workers` calls run at the same
+    time, further calls wait for a free thread.
+
+    The code runs in a copy of the context of the calling task, so context
+    variables such as the current tracing span are visible to it. Threads
+    can't be interrupted: a call which is cancelled, e.g. after a timeout,
+    keeps its thread until the code returns.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SYNC_ACTION_THREADS) -> None:
+        """Creates a `SyncThreadPool`.
+
+        Args:
+            max_workers: Maximum number of threads.
+        """
+        self.max_workers = max_workers
+        # Created on first use, so that forked worker processes don't inherit
+        # the threads of the primary process.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop the threads of the current process."""
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    async def run(self, function: Callable, *args: Any) -> Any:
+        """Call `function` with `args` in a thread of the pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="rasa_sdk_action"
+            )
+
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(context.run, function, *args)
+        )
+
+
+@contextlib.contextmanager
+def use_thread_pool(thread_pool: Optional[SyncThreadPool]) -> Iterator[None]:
+    """Run the synchronous code called with `call_action_code` in `thread_pool`.
+
+    With `None`, synchronous code is called directly in the event loop.
+    """
+    token = _active_thread_pool.set(thread_pool)
+    try:
+        yield
+    finally:
+        _active_thread_pool.reset(token)
+
+
+async def call_action_code(function: Callable, *args: Any) -> Any:
+    """Call an action or one of its helpers and await the result if needed.
+
+    A synchronous `function` runs in the thread pool of `use_thread_pool`.
+    """
+    thread_pool = _active_thread_pool.get()
+    if thread_pool is None or inspect.iscoroutinefunction(function):
+        return await utils.call_potential_coroutine(function(*args))
+
+    return await utils.call_potential_coroutine(await thread_pool.run(function, *args))
@@ -1,3 +1,5 @@
+import contextlib
+
 from multidict import MultiDict
 
 from rasa_sdk.tracing import config
@@ -6,7 +8,7 @@ from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapProp
 
 from opentelemetry.sdk.trace import TracerProvider
 
-from typing import Optional, Tuple, Any
+from typing import Any, Callable, ContextManager, Optional, Tuple
 
 
 def get_tracer_provider(endpoints_file: str) -> Optional[TracerProvider]:
@@ -36,8 +38,39 @@ def get_tracer_and_context(
     return tracer, context
 
 
+def start_request_span(
+    span_name: str,
+    tracer_provider: Optional[TracerProvider],
+    tracing_carrier: Callable[[], Optional[MultiDict]],
+) -> ContextManager[Any]:
+    """Start the span of an incoming request.
+
+    Without a tracer provider no tracer is looked up and the tracing carrier
+    is never built, so requests don't pay for tracing when it is disabled.
+
+    Args:
+        span_name: Name of the span.
+        tracer_provider: The tracer provider, or `None` if tracing is disabled.
+        tracing_carrier: Builds the carrier of the incoming tracing context.
+
+    Returns:
+        Context manager yielding the span, which is a non-recording span
+        when tracing is disabled.
+    """
+    if tracer_provider is None:
+        return contextlib.nullcontext(trace.INVALID_SPAN)
+
+    tracer, context = get_tracer_and_context(
+        span_name, tracer_provider, tracing_carrier()
+    )
+    return tracer.start_as_current_span(span_name, context=context)
+
+
 def set_span_attributes(span: Any, action_call: dict) -> None:
     """Sets span attributes."""
+    if not span.is_recording():
+        return None
+
     tracker = action_call.get("tracker", {})
     span_attributes = {
         "next_action": action_call.get("next_action"),
@@ -46,8 +79,7 @@ def set_span_attributes(span: Any, action_call: dict) -> None:
         "message_id": tracker.get("latest_message", {}).get("message_id", "None"),
     }
 
-    if span.is_recording():
-        for key, value in span_attributes.items():
-            span.set_attribute(key, value)
+    for key, value in span_attributes.items():
+        span.set_attribute(key, value)
 
     return None
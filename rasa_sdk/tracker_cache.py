@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Text
+
+from rasa_sdk.constants import (
+    DEFAULT_TRACKER_CACHE_MAX_ENTRIES,
+    DEFAULT_TRACKER_CACHE_MAX_EVENTS,
+)
+
+
+class TrackerCache:
+    """Keep the events of recent conversations to accept incremental trackers.
+
+    Long conversations make every action call carry the whole event history.
+    With the cache, clients may send only the events appended since an event
+    count the server already holds for the conversation, together with that
+    `tracker_base_event_count`. The cache prepends the events it holds and the
+    action receives the complete tracker.
+
+    The cache is bounded by the number of conversations and by the total
+    number of events it holds. The least recently used conversations are
+    dropped first. Clients must send the full tracker again when the server
+    doesn't hold enough events, e.g. because the conversation was evicted or
+    the call reached another worker process.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_TRACKER_CACHE_MAX_ENTRIES,
+        max_events: int = DEFAULT_TRACKER_CACHE_MAX_EVENTS,
+    ) -> None:
+        """Creates a `TrackerCache`.
+
+        Args:
+            max_entries: Maximum number of conversations to keep.
+            max_events: Maximum number of events kept across all
+                conversations. Conversations with more events aren't kept.
+        """
+        self.max_entries = max_entries
+        self.max_events = max_events
+
+        self._events: "OrderedDict[Text, List[Any]]" = OrderedDict()
+        self._event_count = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Drop the conversations of the current process."""
+        state = self.__dict__.copy()
+        state["_events"] = OrderedDict()
+        state["_event_count"] = 0
+        return state
+
+    def events(
+        self,
+        sender_id: Text,
+        base_event_count: int,
+        new_events: Sequence[Any],
+    ) -> Optional[List[Any]]:
+        """Return the full events of a conversation.
+
+        Args:
+            sender_id: Id of the conversation.
+            base_event_count: Number of events of the conversation which
+                precede `new_events`.
+            new_events: Events appended after the first `base_event_count`
+                events.
+
+        Returns:
+            The first `base_event_count` cached events followed by
+            `new_events`, or `None` if the cache holds fewer events of the
+            conversation.
+        """
+        cached = self._events.get(sender_id)
+        if cached is None or not 0 <= base_event_count <= len(cached):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._events.move_to_end(sender_id)
+        return cached[:base_event_count] + list(new_events)
+
+    def store(self, sender_id: Text, events: Sequence[Any]) -> None:
+        """Keep the events of a conversation for its following calls.
+
+        Args:
+            sender_id: Id of the conversation.
+            events: All events of the conversation. Events of gRPC calls may
+                still be `Struct` messages, see `grpc_tracker.raw_events`.
+        """
+        self._discard(sender_id)
+        if len(events) > self.max_events:
+            return
+
+        # Copied, so that actions which modify their tracker don't change it.
+        self._events[sender_id] = list(events)
+        self._event_count += len(events)
+        while (
+            len(self._events) > self.max_entries or self._event_count > self.max_events
+        ):
+            _, evicted = self._events.popitem(last=False)
+            self._event_count -= len(evicted)
+            self._evictions += 1
+
+    def _discard(self, sender_id: Text) -> None:
+        events = self._events.pop(sender_id, None)
+        if events is not None:
+            self._event_count -= len(events)
+
+    def stats(self) -> Dict[Text, Any]:
+        """Return the current state of the cache."""
+        return {
+            "entries": len(self._events),
+            "events": self._event_count,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 import logging
 import logging.config
@@ -271,12 +272,14 @@ def number_of_sanic_workers() -> int:
     return env_value
 
 
+@functools.lru_cache(maxsize=32)
 def check_version_compatibility(rasa_version: Optional[Text]) -> None:
     """Check if the version of rasa and rasa_sdk are compatible.
 
     The version check relies on the version string being formatted as
     'x.y.z' and compares whether the numbers x and y are the same for both
-    rasa and rasa_sdk.
+    rasa and rasa_sdk. Every action call repeats the check, so it is only
+    done, and warned about, once per version string.
 
     Args:
         rasa_version: A string containing the version of rasa that
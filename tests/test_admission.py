@@ -0,0 +1,106 @@
+import asyncio
+import pickle
+
+import pytest
+
+from rasa_sdk.admission import AdmissionController
+from rasa_sdk.interfaces import ActionServerOverloadedException
+
+
+async def test_admit_within_limits():
+    controller = AdmissionController(max_concurrent_actions=2)
+
+    async with controller.admit("action_a"):
+        async with controller.admit("action_b"):
+            assert controller.in_flight == 2
+
+    assert controller.in_flight == 0
+    assert controller.stats()["actions"] == {}
+
+
+async def test_admit_queues_until_capacity_is_released():
+    controller = AdmissionController(max_concurrent_actions=1)
+    await controller.acquire("action_a")
+
+    waiting = asyncio.ensure_future(controller.acquire("action_b"))
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+    assert not waiting.done()
+
+    controller.release("action_a")
+    await waiting
+
+    assert controller.queue_depth == 0
+    assert controller.stats()["actions"]["action_b"]["in_flight"] == 1
+
+
+async def test_full_queue_sheds_calls():
+    controller = AdmissionController(
+        max_concurrent_actions=1, max_queue_size=0, retry_after=2.5
+    )
+    await controller.acquire("action_a")
+
+    with pytest.raises(ActionServerOverloadedException) as exc_info:
+        await controller.acquire("action_b")
+
+    assert exc_info.value.action_name == "action_b"
+    assert exc_info.value.retry_after == 2.5
+    assert controller.shed_count == 1
+    assert controller.stats()["actions"]["action_b"]["shed_count"] == 1
+
+
+async def test_queue_timeout_sheds_calls():
+    controller = AdmissionController(max_concurrent_actions=1, queue_timeout=0.01)
+    await controller.acquire("action_a")
+
+    with pytest.raises(ActionServerOverloadedException):
+        await controller.acquire("action_b")
+
+    assert controller.queue_depth == 0
+    assert controller.in_flight == 1
+
+
+async def test_action_limit_does_not_block_other_actions():
+    controller = AdmissionController(action_limits={"action_slow": 1})
+    await controller.acquire("action_slow")
+
+    waiting = asyncio.ensure_future(controller.acquire("action_slow"))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(controller.acquire("action_fast"), timeout=1)
+    assert controller.queue_depth == 1
+
+    controller.release("action_fast")
+    assert not waiting.done()
+
+    controller.release("action_slow")
+    await waiting
+    assert controller.stats()["actions"]["action_slow"]["in_flight"] == 1
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    controller = AdmissionController(max_concurrent_actions=1)
+    await controller.acquire("action_a")
+
+    waiting = asyncio.ensure_future(controller.acquire("action_b"))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert controller.queue_depth == 0
+    controller.release("action_a")
+    assert controller.in_flight == 0
+
+
+async def test_controller_is_picklable_with_waiters():
+    controller = AdmissionController(max_concurrent_actions=1)
+    await controller.acquire("action_a")
+    waiting = asyncio.ensure_future(controller.acquire("action_b"))
+    await asyncio.sleep(0)
+
+    restored = pickle.loads(pickle.dumps(controller))
+
+    assert restored.queue_depth == 0
+    assert restored.max_concurrent_actions == 1
+    waiting.cancel()
@@ -19,3 +19,72 @@ def test_arg_parser_endpoints(args, expected):
     help_text = parser.format_help()
     assert "--endpoints ENDPOINTS" in help_text
     assert " Configuration file for the assistant as a yml file." in help_text
+
+
+def test_arg_parser_action_concurrency_limits():
+    parser = ep.create_argument_parser()
+    cmdline_args = parser.parse_args(
+        [
+            "--max-concurrent-actions",
+            "8",
+            "--action-concurrency-limit",
+            "action_search=2",
+            "--action-concurrency-limit",
+            "action_book=1",
+        ]
+    )
+
+    assert cmdline_args.max_concurrent_actions == 8
+    assert dict(cmdline_args.action_concurrency_limit) == {
+        "action_search": 2,
+        "action_book": 1,
+    }
+
+
+@pytest.mark.parametrize("value", ["action_search", "action_search=0", "=2"])
+def test_arg_parser_invalid_action_concurrency_limit(value):
+    parser = ep.create_argument_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--action-concurrency-limit", value])
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [([], None), (["--socket", "/run/rasa/actions.sock"], "/run/rasa/actions.sock")],
+)
+def test_arg_parser_socket(args, expected):
+    parser = ep.create_argument_parser()
+    cmdline_args = parser.parse_args(args)
+
+    assert cmdline_args.socket == expected
+
+
+def test_arg_parser_grpc_options(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ACTION_SERVER_GRPC_MAX_RECEIVE_MESSAGE_SIZE", "16777216")
+    monkeypatch.setenv("ACTION_SERVER_GRPC_COMPRESSION", "threshold")
+    parser = ep.create_argument_parser()
+
+    cmdline_args = parser.parse_args(
+        ["--grpc-keepalive-time", "30", "--grpc-compression", "none"]
+    )
+
+    assert cmdline_args.grpc_max_receive_message_size == 16 * 1024 * 1024
+    assert cmdline_args.grpc_keepalive_time == 30.0
+    assert cmdline_args.grpc_compression == "none"
+    assert cmdline_args.grpc_max_concurrent_streams is None
+
+
+def test_arg_parser_invalid_grpc_option_from_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ACTION_SERVER_GRPC_MAX_CONCURRENT_STREAMS", "many")
+    parser = ep.create_argument_parser()
+
+    with pytest.raises(SystemExit):
+        parser.parse_args([])
+
+
+@pytest.mark.parametrize("args, expected", [([], False), (["--fast-event-loop"], True)])
+def test_arg_parser_fast_event_loop(args, expected):
+    parser = ep.create_argument_parser()
+    cmdline_args = parser.parse_args(args)
+
+    assert cmdline_args.fast_event_loop == expected
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Optional, Text
+from unittest.mock import patch
+
+import pytest
+
+from rasa_sdk import compression
+
+PAYLOAD = b'{"events": [' + b'{"event": "slot", "name": "a", "value": 1},' * 100 + b"]}"
+
+
+@pytest.mark.parametrize("encoding", compression.supported_encodings())
+def test_compress_round_trip(encoding: Text):
+    compressed = compression.compress(PAYLOAD, encoding)
+
+    assert len(compressed) < len(PAYLOAD)
+    assert compression.decompress(compressed, encoding) == PAYLOAD
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("GZIP", "gzip"),
+        ("compress, *;q=0.1", compression.supported_encodings()[0]),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: Optional[Text], expected: Optional[Text]):
+    assert compression.negotiate_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize(
+    "encoding, expected",
+    [("gzip", True), ("Deflate", True), ("compress", False), (None, False)],
+)
+def test_is_supported_encoding(encoding: Optional[Text], expected: bool):
+    assert compression.is_supported_encoding(encoding) is expected
+
+
+COMPRESSED_PAYLOAD = compression.compress(PAYLOAD, "gzip")
+
+
+@pytest.mark.parametrize(
+    "offload_threshold, expected_offloaded",
+    [
+        (None, False),
+        (len(COMPRESSED_PAYLOAD) + 1, False),
+        (len(COMPRESSED_PAYLOAD), True),
+    ],
+)
+async def test_decompress_async_offloads_large_bodies(
+    offload_threshold: Optional[int], expected_offloaded: bool
+):
+    loop = asyncio.get_running_loop()
+
+    with patch.object(
+        loop, "run_in_executor", wraps=loop.run_in_executor
+    ) as run_in_executor:
+        decompressed = await compression.decompress_async(
+            COMPRESSED_PAYLOAD, "gzip", offload_threshold
+        )
+
+    assert decompressed == PAYLOAD
+    assert run_in_executor.called is expected_offloaded
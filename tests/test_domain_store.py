@@ -0,0 +1,78 @@
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+from rasa_sdk.domain_store import DomainStore
+
+
+@pytest.fixture
+def domain_store(tmp_path: Path) -> DomainStore:
+    return DomainStore(str(tmp_path), max_entries=2)
+
+
+def test_put_and_get(domain_store: DomainStore):
+    domain = {"responses": {"utter_greet": [{"text": "Hi"}]}}
+
+    domain_store.put("digest", domain)
+
+    assert "digest" in domain_store
+    assert domain_store.get("digest") == domain
+    assert "other" not in domain_store
+    assert domain_store.get("other") is None
+
+
+async def test_store_and_load(domain_store: DomainStore):
+    domain = {"intents": ["greet"]}
+
+    await domain_store.store("digest", domain)
+    # A stored domain isn't written again.
+    await domain_store.store("digest", {"intents": []})
+
+    assert await domain_store.load("digest") == domain
+    assert await domain_store.load("other") is None
+
+
+def test_digest_is_not_used_as_file_name(domain_store: DomainStore):
+    domain_store.put("../../escape", {})
+
+    assert os.listdir(domain_store.directory) == [
+        os.path.basename(domain_store._path("../../escape"))
+    ]
+
+
+def test_put_evicts_oldest_domains(domain_store: DomainStore):
+    for index, digest in enumerate(["first", "second", "third"]):
+        domain_store.put(digest, {"index": index})
+        os.utime(domain_store._path(digest), times=(index, index))
+
+    domain_store.put("fourth", {"index": 3})
+
+    assert "first" not in domain_store
+    assert "second" not in domain_store
+    assert "third" in domain_store
+    assert "fourth" in domain_store
+
+
+def test_get_ignores_corrupt_domain(domain_store: DomainStore):
+    Path(domain_store._path("digest")).write_text("{not json")
+
+    assert domain_store.get("digest") is None
+
+
+def test_store_is_picklable_after_use(domain_store: DomainStore):
+    domain_store.put("digest", {"intents": ["greet"]})
+
+    restored = pickle.loads(pickle.dumps(domain_store))
+
+    assert restored.get("digest") == {"intents": ["greet"]}
+
+
+def test_create_temporary_and_remove():
+    domain_store = DomainStore.create_temporary()
+    assert os.path.isdir(domain_store.directory)
+
+    domain_store.remove()
+
+    assert not os.path.exists(domain_store.directory)
@@ -1,9 +1,13 @@
 from typing import Any, Dict, List, Optional, Text
+import asyncio
+import gzip
 import json
 import logging
+import os
 import pickle
 import zlib
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from pytest import MonkeyPatch
@@ -11,8 +15,11 @@ from sanic import Sanic
 from sanic.http.tls.context import SanicSSLContext
 
 import rasa_sdk.endpoint as ep
+from rasa_sdk.admission import AdmissionController
 from rasa_sdk.events import SlotSet
 from rasa_sdk.plugin import plugin_manager
+from rasa_sdk.readiness import ReadinessMonitor
+from rasa_sdk.tracker_cache import TrackerCache
 from tests.conftest import get_stack
 
 
@@ -128,6 +135,27 @@ def test_server_webhook_handles_action_exception(
     assert response.json.get("request_body") == data
 
 
+def test_server_ready_follows_readiness_monitor(
+    action_executor: ep.ActionExecutor,
+):
+    monitor = ReadinessMonitor(max_in_flight=1)
+    app = ep.create_app(action_executor, readiness_monitor=monitor)
+
+    _request, response = app.test_client.get("/ready")
+    assert response.status == 200
+    assert response.json["status"] == "ready"
+
+    action_executor.metrics.actions_in_flight.set("action", value=2)
+    monitor.check(action_executor)
+    _request, response = app.test_client.get("/ready")
+    assert response.status == 503
+    assert response.json["reasons"] == ["actions in flight 2 exceeds 1"]
+
+    # Liveness isn't affected by the load.
+    _request, response = app.test_client.get("/health")
+    assert response.status == 200
+
+
 def test_server_webhook_custom_action_returns_200(
     sanic_app: Sanic,
 ):
@@ -143,6 +171,63 @@ def test_server_webhook_custom_action_returns_200(
     assert response.status == 200
 
 
+def test_server_register_domain(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.get("/domain/digest")
+    assert response.json == {"domain_digest": "digest", "known": False}
+
+    _request, response = sanic_app.test_client.put(
+        "/domain/digest", data=json.dumps({"slots": {}})
+    )
+    assert response.status == 200
+    assert response.json == {"domain_digest": "digest", "known": False}
+
+    _request, response = sanic_app.test_client.put(
+        "/domain/digest", data=json.dumps({"slots": {}})
+    )
+    assert response.json == {"domain_digest": "digest", "known": True}
+
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain_digest": "digest",
+    }
+    _request, response = sanic_app.test_client.post("/webhook", data=json.dumps(data))
+    assert response.status == 200
+
+
+@pytest.mark.parametrize("body", ["", "[]", "not json"])
+def test_server_register_domain_rejects_invalid_body(sanic_app: Sanic, body: Text):
+    _request, response = sanic_app.test_client.put("/domain/digest", data=body)
+    assert response.status == 400
+
+
+def test_server_webhook_asks_for_full_tracker_on_cache_miss(
+    action_executor: ep.ActionExecutor,
+):
+    action_executor.tracker_cache = TrackerCache()
+    app = ep.create_app(action_executor)
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "events": [{"event": "user"}]},
+        "domain": {},
+        "tracker_base_event_count": 3,
+    }
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+    assert response.status == 449
+    assert response.json["action_name"] == "custom_action"
+
+    data["tracker"]["events"] = [{"event": "user"}] * 4
+    del data["tracker_base_event_count"]
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+    assert response.status == 200
+
+    data["tracker"]["events"] = [{"event": "bot"}]
+    data["tracker_base_event_count"] = 4
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+    assert response.status == 200
+    assert action_executor.tracker_cache.stats()["events"] == 5
+
+
 def test_server_webhook_custom_async_action_returns_200(sanic_app: Sanic):
     data = {
         "next_action": "custom_async_action",
@@ -156,6 +241,31 @@ def test_server_webhook_custom_async_action_returns_200(sanic_app: Sanic):
     assert response.status == 200
 
 
+@pytest.mark.parametrize("json_codec", ["json", "orjson", "msgspec"])
+def test_server_webhook_custom_action_with_json_codec_returns_200(
+    action_executor: ep.ActionExecutor, json_codec: Text
+):
+    pytest.importorskip(json_codec)
+    app = ep.create_app(action_executor, json_codec=json_codec)
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+
+    assert response.status == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json == {"events": [SlotSet("test", "bar")], "responses": []}
+
+
+def test_server_webhook_invalid_json_returns_400(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post("/webhook", data="{not json")
+
+    assert response.status == 400
+    assert response.json == {"error": "Invalid body request"}
+
+
 def test_arg_parser_actions_params_folder_style():
     parser = ep.create_argument_parser()
     args = ["--actions", "actions/act"]
@@ -240,6 +350,54 @@ def test_run_app_loader_factory_is_picklable(
     assert restored_app.name == "rasa_sdk"
 
 
+def test_run_with_multiple_workers_shares_domains(
+    monkeypatch: MonkeyPatch,
+    action_executor: ep.ActionExecutor,
+) -> None:
+    monkeypatch.setenv("ACTION_SERVER_SANIC_WORKERS", "2")
+    captured = _capture_sanic_serve(monkeypatch)
+
+    ep.run(action_executor, port=5099)
+
+    domain_store = action_executor.domain_store
+    assert domain_store is not None
+    restored_app = pickle.loads(pickle.dumps(captured["app_loader"])).load()
+    assert restored_app.name == "rasa_sdk"
+    # The store is removed once the server stopped.
+    assert not os.path.exists(domain_store.directory)
+
+
+def test_run_on_unix_socket(
+    monkeypatch: MonkeyPatch,
+    action_executor: ep.ActionExecutor,
+    tmp_path: Path,
+) -> None:
+    captured = _capture_sanic_serve(monkeypatch)
+    socket_path = str(tmp_path / "action_server.sock")
+
+    ep.run(action_executor, unix_socket=socket_path)
+
+    [server_info] = captured["primary"].state.server_info
+    assert server_info.settings["unix"] == socket_path
+
+
+def test_run_with_preload_forks_workers(
+    monkeypatch: MonkeyPatch,
+    action_executor: ep.ActionExecutor,
+) -> None:
+    captured = _capture_sanic_serve(monkeypatch)
+    monkeypatch.setattr(ep.Sanic, "start_method", ep.Sanic.start_method)
+    monkeypatch.setattr(ep.gc, "freeze", MagicMock())
+
+    ep.run(action_executor, port=5099, preload=True)
+
+    assert ep.Sanic.start_method == "fork"
+    ep.gc.freeze.assert_called_once()
+    # The forked workers serve the app of the primary process.
+    assert captured["app_loader"] is None
+    assert captured["primary"].name == "rasa_sdk"
+
+
 def test_run_ssl_config_is_picklable(
     monkeypatch: MonkeyPatch,
     action_executor: ep.ActionExecutor,
@@ -269,3 +427,373 @@ def test_run_ssl_config_is_picklable(
 
     ssl_payload = _ssl_payload_sanic_would_pickle(primary.state.ssl)
     pickle.loads(pickle.dumps(ssl_payload))
+
+
+def _streaming_action_call(action_name: Text) -> Dict[Text, Any]:
+    return {
+        "next_action": action_name,
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+
+def test_server_webhook_stream_sends_ndjson_events(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post(
+        "/webhook/stream", data=json.dumps(_streaming_action_call("action_streaming"))
+    )
+
+    assert response.status == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    messages = [json.loads(line) for line in response.text.splitlines()]
+    assert [next(iter(message)) for message in messages] == [
+        "chunk_start",
+        "chunk",
+        "chunk",
+        "chunk_end",
+        "final_result",
+    ]
+
+    response_id = messages[0]["chunk_start"]["response_id"]
+    assert response_id
+    # the text chunks waited to be sent together and were merged
+    assert messages[1]["chunk"] == {"text": "Hello world", "response_id": response_id}
+    assert messages[2]["chunk"]["buttons"] == [
+        {"title": "A", "payload": "/a"},
+        {"title": "B", "payload": "/b"},
+    ]
+    assert messages[3]["chunk_end"] == {"response_id": response_id}
+    # chunks were delivered in-band, so they are not replayed as responses
+    assert messages[4]["final_result"] == {"events": [], "responses": []}
+
+
+def test_server_webhook_stream_sends_server_sent_events(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post(
+        "/webhook/stream",
+        data=json.dumps(_streaming_action_call("custom_action")),
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert response.status == 200
+    assert response.headers["content-type"] == "text/event-stream"
+    assert response.text == (
+        'data: {"final_result":{"events":'
+        '[{"event":"slot","timestamp":null,"name":"test","value":"bar"}],'
+        '"responses":[]}}\n\n'
+    )
+
+
+def test_server_webhook_stream_unknown_action_returns_404(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post(
+        "/webhook/stream",
+        data=json.dumps(_streaming_action_call("non_existing_action")),
+    )
+
+    assert response.status == 404
+    assert response.json["action_name"] == "non_existing_action"
+
+
+def test_server_webhook_stream_action_exception_returns_500(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post(
+        "/webhook/stream",
+        data=json.dumps(_streaming_action_call("custom_action_exception")),
+    )
+
+    assert response.status == 500
+    assert response.json.get("error") == "test exception"
+
+
+def test_server_webhook_gzip_encoded_data_returns_200(sanic_app: Sanic):
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {"intents": ["greet", "goodbye"]},
+    }
+
+    _request, response = sanic_app.test_client.post(
+        "/webhook",
+        data=gzip.compress(json.dumps(data).encode()),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert response.status == 200
+    assert response.json.get("events") == [SlotSet("test", "bar")]
+
+
+@pytest.mark.parametrize(
+    "min_size, accept_encoding, expected_encoding",
+    [
+        (0, "gzip", "gzip"),
+        (0, "deflate", "deflate"),
+        (0, "identity", None),
+        (100_000, "gzip", None),
+        (None, "gzip", None),
+    ],
+)
+def test_server_webhook_compresses_response(
+    action_executor: ep.ActionExecutor,
+    min_size: Optional[int],
+    accept_encoding: Text,
+    expected_encoding: Optional[Text],
+):
+    app = ep.create_app(action_executor, response_compression_min_size=min_size)
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    _request, response = app.test_client.post(
+        "/webhook",
+        data=json.dumps(data),
+        headers={"Accept-Encoding": accept_encoding},
+    )
+
+    assert response.status == 200
+    assert response.headers.get("content-encoding") == expected_encoding
+    assert response.json.get("events") == [SlotSet("test", "bar")]
+
+
+def test_server_webhook_batch_returns_results_in_order(sanic_app: Sanic):
+    data = [
+        {
+            "next_action": "custom_action",
+            "tracker": {"sender_id": "1", "conversation_id": "default"},
+            "domain": {},
+        },
+        {
+            "next_action": "non_existing_action",
+            "tracker": {"sender_id": "2", "conversation_id": "default"},
+        },
+        {
+            "next_action": "custom_async_action",
+            "tracker": {"sender_id": "3", "conversation_id": "default"},
+            "domain": {},
+        },
+        {
+            "next_action": "custom_action_exception",
+            "tracker": {"sender_id": "4", "conversation_id": "default"},
+            "domain": {},
+        },
+        "not an action call",
+    ]
+
+    _request, response = sanic_app.test_client.post(
+        "/webhook/batch", data=json.dumps(data)
+    )
+
+    assert response.status == 200
+    results = response.json
+    assert [result["status"] for result in results] == [200, 404, 200, 500, 400]
+    assert results[0]["result"] == {"events": [SlotSet("test", "bar")], "responses": []}
+    assert results[1]["action_name"] == "non_existing_action"
+    assert results[2]["result"]["events"] == [
+        SlotSet("test", "foo"),
+        SlotSet("test2", "boo"),
+    ]
+    assert results[3]["error"] == "test exception"
+
+
+def test_server_webhook_batch_with_invalid_body_returns_400(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.post(
+        "/webhook/batch", data=json.dumps({"next_action": "custom_action"})
+    )
+
+    assert response.status == 400
+
+
+async def test_run_action_batch_respects_concurrency():
+    running = 0
+    max_running = 0
+
+    async def _run(action_call: Dict[Text, Any], **kwargs: Any) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    executor = ep.ActionExecutor()
+    executor.run = _run  # type: ignore[method-assign]
+
+    results = await ep.run_action_batch(executor, [{}] * 10, concurrency=3)
+
+    assert max_running == 3
+    assert results == [{"status": 200, "result": None}] * 10
+
+
+def test_server_webhook_overloaded_returns_503(action_executor: ep.ActionExecutor):
+    action_executor.admission_controller = AdmissionController(
+        max_concurrent_actions=0, max_queue_size=0, retry_after=1.5
+    )
+    app = ep.create_app(action_executor)
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+
+    assert response.status == 503
+    assert response.headers.get("retry-after") == "2"
+    assert response.json["action_name"] == "custom_action"
+
+    _request, response = app.test_client.get("/admission")
+
+    assert response.status == 200
+    assert response.json["shed_count"] == 1
+
+
+async def _slow_action(
+    dispatcher: Any, tracker: Any, domain: Any
+) -> List[Dict[Text, Any]]:
+    await asyncio.sleep(10)
+    return []
+
+
+@pytest.mark.parametrize(
+    "request_timeout, headers",
+    [
+        (None, {"X-Request-Timeout": "0.05"}),
+        (0.05, {}),
+        (0.05, {"X-Request-Timeout": "60"}),
+    ],
+)
+def test_server_webhook_timeout_returns_504(
+    action_executor: ep.ActionExecutor,
+    request_timeout: Optional[float],
+    headers: Dict[Text, Text],
+):
+    action_executor.register_function("slow_action", _slow_action)
+    app = ep.create_app(action_executor, request_timeout=request_timeout)
+    data = {
+        "next_action": "slow_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    _request, response = app.test_client.post(
+        "/webhook", data=json.dumps(data), headers=headers
+    )
+
+    assert response.status == 504
+    assert response.json["action_name"] == "slow_action"
+
+
+def test_server_webhook_action_timeout_returns_504(
+    action_executor: ep.ActionExecutor,
+):
+    action_executor.register_function("slow_action", _slow_action, timeout=0.05)
+    app = ep.create_app(action_executor)
+    data = {
+        "next_action": "slow_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+
+    assert response.status == 504
+    assert response.json["action_name"] == "slow_action"
+
+
+def test_server_webhook_batch_timeout_returns_504_per_call(
+    action_executor: ep.ActionExecutor,
+):
+    action_executor.register_function("slow_action", _slow_action)
+    app = ep.create_app(action_executor)
+    tracker = {"sender_id": "1", "conversation_id": "default"}
+    data = [
+        {"next_action": "custom_action", "tracker": tracker, "domain": {}},
+        {"next_action": "slow_action", "tracker": tracker, "domain": {}},
+    ]
+
+    _request, response = app.test_client.post(
+        "/webhook/batch",
+        data=json.dumps(data),
+        headers={"X-Request-Timeout": "0.5"},
+    )
+
+    assert response.status == 200
+    assert [item["status"] for item in response.json] == [200, 504]
+
+
+@pytest.mark.parametrize(
+    "header, default_timeout, expected",
+    [
+        (None, None, None),
+        (None, 5.0, 5.0),
+        ("2.5", None, 2.5),
+        ("2.5", 1.0, 1.0),
+        ("invalid", 5.0, 5.0),
+        ("nan", None, None),
+    ],
+)
+def test_read_request_timeout(
+    header: Optional[Text],
+    default_timeout: Optional[float],
+    expected: Optional[float],
+):
+    request = MagicMock()
+    request.headers = {"X-Request-Timeout": header} if header else {}
+
+    assert ep.read_request_timeout(request, default_timeout) == expected
+
+
+def test_server_admission_without_limits_returns_404(sanic_app: Sanic):
+    _request, response = sanic_app.test_client.get("/admission")
+
+    assert response.status == 404
+
+
+def test_server_auto_reload_does_not_reload_per_request(
+    action_executor: ep.ActionExecutor, monkeypatch: MonkeyPatch
+):
+    reload = MagicMock(return_value=False)
+    monkeypatch.setattr(action_executor, "reload", reload)
+    app = ep.create_app(action_executor, auto_reload=True)
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    _request, response = app.test_client.post("/webhook", data=json.dumps(data))
+
+    assert response.status == 200
+    # Only the worker start records the modules; requests don't reload.
+    reload.assert_called_once_with()
+
+
+def test_server_metrics_records_action_calls(sanic_app: Sanic):
+    data = {
+        "next_action": "custom_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+    sanic_app.test_client.post("/webhook", data=json.dumps(data))
+    sanic_app.test_client.post(
+        "/webhook", data=json.dumps({**data, "next_action": "random_action"})
+    )
+
+    _request, response = sanic_app.test_client.get("/metrics")
+
+    assert response.status == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'rasa_sdk_action_duration_seconds_count{action_name="custom_action"} 1'
+        in response.text
+    )
+    assert (
+        'rasa_sdk_action_errors_total{action_name="unknown",'
+        'exception="ActionNotFoundException"} 1' in response.text
+    )
+    assert (
+        'rasa_sdk_request_size_bytes_count{transport="http",endpoint="/webhook"} 2'
+        in response.text
+    )
+    assert (
+        'rasa_sdk_response_size_bytes_count{transport="http",endpoint="/webhook"} 1'
+        in response.text
+    )
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+from typing import Any, Iterator, List
+
+import pytest
+
+from rasa_sdk.event_loop import create_event_loop_policy, use_fast_event_loop
+
+
+@pytest.fixture
+def restore_event_loop_policy() -> Iterator[None]:
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+@pytest.fixture
+def uvloop() -> Any:
+    return pytest.importorskip("uvloop")
+
+
+def test_event_loop_policy_uses_uvloop(uvloop: Any, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delattr(asyncio, "eager_task_factory", raising=False)
+
+    policy = create_event_loop_policy()
+    loop = policy.new_event_loop()
+    try:
+        assert isinstance(policy, uvloop.EventLoopPolicy)
+        assert isinstance(loop, uvloop.Loop)
+        assert loop.get_task_factory() is None
+    finally:
+        loop.close()
+
+
+def test_event_loop_policy_without_uvloop(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delattr(asyncio, "eager_task_factory", raising=False)
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    policy = create_event_loop_policy()
+
+    assert type(policy) is asyncio.DefaultEventLoopPolicy
+
+
+def test_event_loop_policy_runs_tasks_eagerly(
+    uvloop: Any, monkeypatch: pytest.MonkeyPatch
+):
+    created: List[asyncio.Task] = []
+
+    def eager_task_factory(loop, coro, **kwargs):
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        created.append(task)
+        return task
+
+    monkeypatch.setattr(
+        asyncio, "eager_task_factory", eager_task_factory, raising=False
+    )
+
+    policy = create_event_loop_policy()
+    loop = policy.new_event_loop()
+    try:
+        assert isinstance(policy, uvloop.EventLoopPolicy)
+        assert loop.get_task_factory() is eager_task_factory
+        loop.run_until_complete(loop.create_task(asyncio.sleep(0)))
+    finally:
+        loop.close()
+
+    assert len(created) == 1
+
+
+def test_use_fast_event_loop(uvloop: Any, restore_event_loop_policy: None):
+    use_fast_event_loop()
+
+    async def loop_type() -> type:
+        return type(asyncio.get_running_loop())
+
+    assert asyncio.run(loop_type()) is uvloop.Loop
+
+
+def test_use_fast_event_loop_without_uvloop(
+    monkeypatch: pytest.MonkeyPatch, restore_event_loop_policy: None
+):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    use_fast_event_loop()
+
+    async def task_count() -> int:
+        return len(asyncio.all_tasks())
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert isinstance(loop, asyncio.BaseEventLoop)
+        assert loop.run_until_complete(task_count()) == 1
+    finally:
+        loop.close()
@@ -1,9 +1,11 @@
 import asyncio
 import os
+import pickle
 import shutil
 import random
 import string
 import sys
+import threading
 import time
 
 from pathlib import Path
@@ -11,9 +13,21 @@ from typing import Any, Dict, List, Text, Optional, Generator
 
 import pytest
 from rasa_sdk import Action
+from rasa_sdk.admission import AdmissionController
+from rasa_sdk.domain_store import DomainStore
 from rasa_sdk.executor import ActionExecutor, CollectingDispatcher
+from rasa_sdk.grpc_py import action_webhook_pb2
+from rasa_sdk.grpc_tracker import ProtoTrackerState
+from rasa_sdk.response_cache import ResponseCache
+from rasa_sdk.thread_pool import SyncThreadPool
+from rasa_sdk.tracker_cache import TrackerCache
 from rasa_sdk.types import DomainDict
-from rasa_sdk.interfaces import Tracker
+from rasa_sdk.interfaces import (
+    ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionTimeoutException,
+    Tracker,
+)
 from tests.conftest import SubclassTestActionA, SubclassTestActionB
 
 TEST_PACKAGE_BASE = "tests/executor_test_packages"
@@ -1011,3 +1025,445 @@ async def test_stream_start_resets_cancellation_state():
 
     await dispatcher.stream_start()  # second sequence begins
     assert not dispatcher.is_streaming_cancelled
+
+
+async def test_run_releases_admission_slot_when_action_fails():
+    controller = AdmissionController(max_concurrent_actions=1)
+    executor = ActionExecutor(admission_controller=controller)
+    executor.register_package("tests")
+    action_call = {
+        "next_action": "custom_action_exception",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    with pytest.raises(Exception, match="test exception"):
+        await executor.run(action_call)
+
+    assert controller.in_flight == 0
+
+
+async def test_run_cancels_action_after_timeout():
+    controller = AdmissionController(max_concurrent_actions=1)
+    executor = ActionExecutor(admission_controller=controller)
+    cancelled = asyncio.Event()
+
+    async def slow_action(
+        dispatcher: Any, tracker: Any, domain: Any
+    ) -> List[Dict[Text, Any]]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    executor.register_function("slow_action", slow_action)
+    action_call = {
+        "next_action": "slow_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    with pytest.raises(ActionTimeoutException) as exc_info:
+        await executor.run(action_call, timeout=0.01)
+
+    assert exc_info.value.action_name == "slow_action"
+    assert exc_info.value.timeout == 0.01
+    assert cancelled.is_set()
+    assert controller.in_flight == 0
+    snapshot = executor.collect_metrics()
+    assert snapshot["rasa_sdk_action_errors_total"]["samples"] == [
+        [["slow_action", "ActionTimeoutException"], 1.0]
+    ]
+
+
+async def test_run_cancels_action_after_its_own_timeout():
+    class SlowAction(Action):
+        timeout = 0.01
+
+        def name(self) -> Text:
+            return "slow_action"
+
+        async def run(
+            self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Any
+        ) -> List[Dict[Text, Any]]:
+            await dispatcher.stream_start()
+            await dispatcher.stream_chunk(text="Looking")
+            await asyncio.sleep(10)
+            return []
+
+    executor = ActionExecutor(default_action_timeout=10)
+    executor.register_action(SlowAction)
+    action_call = {
+        "next_action": "slow_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+    sink: asyncio.Queue = asyncio.Queue()
+
+    with pytest.raises(ActionTimeoutException) as exc_info:
+        await executor.run(action_call, sink=sink)
+
+    assert exc_info.value.action_name == "slow_action"
+    assert exc_info.value.timeout == 0.01
+    events = [sink.get_nowait() for _ in range(sink.qsize())]
+    assert [event["event"] for event in events] == [
+        "stream_start",
+        "stream_chunk",
+        "stream_error",
+    ]
+    assert events[-1]["exception"] is exc_info.value
+    snapshot = executor.collect_metrics()
+    assert snapshot["rasa_sdk_action_errors_total"]["samples"] == [
+        [["slow_action", "ActionTimeoutException"], 1.0]
+    ]
+
+
+@pytest.mark.parametrize(
+    "default_timeout, registered_timeout, expected_timeout",
+    [(0.01, None, 0.01), (10, 0.01, 0.01), (0.01, 10, None)],
+)
+async def test_run_applies_registered_or_default_action_timeout(
+    default_timeout: float,
+    registered_timeout: Optional[float],
+    expected_timeout: Optional[float],
+):
+    executor = ActionExecutor(default_action_timeout=default_timeout)
+
+    async def slow_action(
+        dispatcher: Any, tracker: Any, domain: Any
+    ) -> List[Dict[Text, Any]]:
+        await asyncio.sleep(0.05)
+        return []
+
+    executor.register_function("slow_action", slow_action, timeout=registered_timeout)
+    action_call = {
+        "next_action": "slow_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    if expected_timeout is None:
+        result = await executor.run(action_call)
+        assert result.events == []
+    else:
+        with pytest.raises(ActionTimeoutException) as exc_info:
+            await executor.run(action_call)
+        assert exc_info.value.timeout == expected_timeout
+
+
+def test_re_registering_function_without_timeout_drops_its_timeout():
+    executor = ActionExecutor()
+    executor.register_function("my_action", lambda d, t, dom: [], timeout=5)
+    assert executor.action_timeouts == {"my_action": 5}
+
+    executor.register_function("my_action", lambda d, t, dom: [])
+
+    assert executor.action_timeouts == {}
+
+
+@pytest.mark.parametrize("run_in_thread", [True, False])
+async def test_run_sync_action_in_thread_pool(run_in_thread: bool):
+    executor = ActionExecutor(sync_thread_pool=SyncThreadPool(max_workers=1))
+
+    def sync_action(
+        dispatcher: CollectingDispatcher, tracker: Tracker, domain: Any
+    ) -> List[Dict[Text, Any]]:
+        dispatcher.utter_message(text=threading.current_thread().name)
+        return []
+
+    executor.register_function("sync_action", sync_action, run_in_thread=run_in_thread)
+    action_call = {
+        "next_action": "sync_action",
+        "tracker": {"sender_id": "1", "conversation_id": "default"},
+        "domain": {},
+    }
+
+    result = await executor.run(action_call)
+
+    in_event_loop = result.responses[0]["text"] == threading.current_thread().name
+    assert in_event_loop is not run_in_thread
+
+
+async def test_run_shares_identical_calls_through_response_cache():
+    executor = ActionExecutor(response_cache=ResponseCache())
+    runs = 0
+
+    async def counting_action(
+        dispatcher: CollectingDispatcher, tracker: Tracker, domain: Any
+    ) -> List[Dict[Text, Any]]:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        dispatcher.utter_message(text=f"run {runs}")
+        return []
+
+    executor.register_function("counting_action", counting_action)
+    action_call = {
+        "next_action": "counting_action",
+        "tracker": {
+            "sender_id": "1",
+            "conversation_id": "default",
+            "latest_message": {"message_id": "m1"},
+            "events": [],
+        },
+        "domain": {},
+    }
+
+    results = await asyncio.gather(executor.run(action_call), executor.run(action_call))
+    retried = await executor.run(action_call)
+    streamed = await executor.run(action_call, sink=asyncio.Queue())
+
+    assert [result.responses[0]["text"] for result in results] == ["run 1"] * 2
+    assert retried.responses[0]["text"] == "run 1"
+    # Streamed calls always run the action.
+    assert streamed.responses[0]["text"] == "run 2"
+
+
+def _counting_events_action(
+    dispatcher: CollectingDispatcher, tracker: Tracker, domain: Any
+) -> List[Dict[Text, Any]]:
+    dispatcher.utter_message(text=" ".join(event["text"] for event in tracker.events))
+    return []
+
+
+def _incremental_call(
+    events: List[Dict[Text, Any]], base_event_count: Optional[int] = None
+) -> Dict[Text, Any]:
+    action_call: Dict[Text, Any] = {
+        "next_action": "count_events",
+        "tracker": {"sender_id": "1", "events": events},
+        "domain": {},
+    }
+    if base_event_count is not None:
+        action_call["tracker_base_event_count"] = base_event_count
+    return action_call
+
+
+async def test_run_completes_incremental_tracker():
+    executor = ActionExecutor(tracker_cache=TrackerCache())
+    executor.register_function("count_events", _counting_events_action)
+
+    await executor.run(_incremental_call([{"text": "a"}, {"text": "b"}]))
+    result = await executor.run(_incremental_call([{"text": "c"}], 2))
+    retried = await executor.run(_incremental_call([{"text": "d"}], 3))
+
+    assert result.responses[0]["text"] == "a b c"
+    assert retried.responses[0]["text"] == "a b c d"
+
+
+async def test_run_completes_incremental_proto_tracker():
+    executor = ActionExecutor(tracker_cache=TrackerCache())
+    executor.register_function("count_events", _counting_events_action)
+    await executor.run(_incremental_call([{"text": "a"}]))
+
+    message = action_webhook_pb2.Tracker(sender_id="1")
+    message.events.add().update({"text": "b"})
+    result = await executor.run(
+        {
+            "next_action": "count_events",
+            "tracker": ProtoTrackerState(message),
+            "domain": {},
+            "tracker_base_event_count": 1,
+        }
+    )
+
+    assert result.responses[0]["text"] == "a b"
+
+
+async def test_run_caches_full_proto_tracker_without_converting_events():
+    executor = ActionExecutor(tracker_cache=TrackerCache())
+    executor.register_function("count_events", _counting_events_action)
+    executor.register_function("ignore_events", lambda d, t, dom: [])
+
+    message = action_webhook_pb2.Tracker(sender_id="1")
+    message.events.add().update({"text": "a"})
+    message.events.add().update({"text": "b"})
+    tracker_state = ProtoTrackerState(message)
+    await executor.run(
+        {"next_action": "ignore_events", "tracker": tracker_state, "domain": {}}
+    )
+
+    assert "events" not in tracker_state._values
+    result = await executor.run(_incremental_call([{"text": "c"}], 2))
+    assert result.responses[0]["text"] == "a b c"
+
+
+@pytest.mark.parametrize("tracker_cache", [TrackerCache(), None])
+async def test_run_rejects_incremental_tracker_without_cached_events(
+    tracker_cache: Optional[TrackerCache],
+):
+    executor = ActionExecutor(tracker_cache=tracker_cache)
+    executor.register_function("count_events", _counting_events_action)
+
+    with pytest.raises(ActionMissingTrackerException) as exc_info:
+        await executor.run(_incremental_call([{"text": "b"}], 1))
+
+    assert exc_info.value.sender_id == "1"
+    snapshot = executor.collect_metrics()
+    assert snapshot["rasa_sdk_action_errors_total"]["samples"] == [
+        [["count_events", "ActionMissingTrackerException"], 1.0]
+    ]
+
+
+def test_reload_publishes_new_registry(executor: ActionExecutor, package_path: Text):
+    _write_action_file(package_path, "swap_action.py", "SwapAction", "swap_action")
+    executor.register_package(package_path.replace("/", "."))
+    registry_v1 = executor.actions
+
+    assert not executor.reload()
+    assert executor.actions is registry_v1
+    assert executor.registry_version == 0
+
+    _write_action_file(
+        package_path, "swap_action.py", "SwapAction", "swap_action", message="new"
+    )
+    mod_time = time.time() + 10
+    os.utime(os.path.join(package_path, "swap_action.py"), times=(mod_time, mod_time))
+
+    assert executor.reload()
+    assert executor.actions is not registry_v1
+    assert executor.registry_version == 1
+    assert executor.actions["swap_action"] is not registry_v1["swap_action"]
+
+
+def test_reload_keeps_published_registry_unchanged_while_registering(
+    executor: ActionExecutor, package_path: Text, monkeypatch: pytest.MonkeyPatch
+):
+    _write_action_file(package_path, "first.py", "FirstAction", "first_action")
+    executor.register_package(package_path.replace("/", "."))
+    published = executor.actions
+    published_names = set(published)
+    seen_during_reload = []
+    register_action = executor._register_action
+
+    def observing_register_action(action: Any, registry: Any) -> None:
+        register_action(action, registry)
+        # Requests read the published registry while the reload registers.
+        seen_during_reload.append(
+            (executor.actions is published, set(executor.actions))
+        )
+
+    monkeypatch.setattr(executor, "_register_action", observing_register_action)
+    _write_action_file(package_path, "second.py", "SecondAction", "second_action")
+
+    assert executor.reload()
+
+    assert seen_during_reload
+    assert all(
+        is_published and names == published_names
+        for is_published, names in seen_during_reload
+    )
+    assert set(published) == published_names
+    assert "second_action" in executor.actions
+    assert executor.actions is not published
+
+
+def test_watched_paths_include_package_directories(
+    executor: ActionExecutor, package_path: Text
+):
+    _write_action_file(package_path, "watched.py", "WatchedAction", "watched")
+    executor.register_package(package_path.replace("/", "."))
+
+    watched_paths = executor.watched_paths()
+
+    assert os.path.abspath(package_path) in map(os.path.abspath, watched_paths)
+    assert any(path.endswith("watched.py") for path in watched_paths)
+
+
+async def test_run_records_metrics(streaming_executor: ActionExecutor):
+    await streaming_executor.run(MINIMAL_ACTION_CALL, sink=asyncio.Queue())
+    await streaming_executor.run(MINIMAL_ACTION_CALL)
+
+    snapshot = streaming_executor.collect_metrics()
+
+    assert snapshot["rasa_sdk_stream_chunks_total"]["samples"] == [
+        [["action_streaming"], 3.0]
+    ]
+    assert snapshot["rasa_sdk_actions_in_flight"]["samples"] == [
+        [["action_streaming"], 0.0]
+    ]
+    [[_, duration]] = snapshot["rasa_sdk_action_duration_seconds"]["samples"]
+    assert duration["count"] == 2
+
+
+def test_domain_is_shared_through_domain_store(tmp_path: Path):
+    domain_store = DomainStore(str(tmp_path))
+    first_worker = ActionExecutor(domain_store=domain_store)
+    second_worker = pickle.loads(pickle.dumps(first_worker))
+    domain = {"intents": ["greet"]}
+
+    first_worker.update_and_return_domain(
+        {"domain": domain, "domain_digest": "digest"}, "action"
+    )
+
+    assert (
+        second_worker.update_and_return_domain({"domain_digest": "digest"}, "action")
+        == domain
+    )
+    assert second_worker.domain_digest == "digest"
+    with pytest.raises(ActionMissingDomainException):
+        second_worker.update_and_return_domain({"domain_digest": "other"}, "action")
+
+
+async def test_run_reads_and_writes_domain_store_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    domain_store = DomainStore(str(tmp_path))
+    first_worker = ActionExecutor(domain_store=domain_store)
+    second_worker = pickle.loads(pickle.dumps(first_worker))
+    for worker in (first_worker, second_worker):
+        worker.register_function("action", lambda d, t, dom: [])
+    loop_thread = threading.current_thread()
+    store_threads = []
+    put, get = DomainStore.put, DomainStore.get
+
+    def recording_put(store: DomainStore, *args: Any) -> None:
+        store_threads.append(threading.current_thread())
+        put(store, *args)
+
+    def recording_get(store: DomainStore, *args: Any) -> Any:
+        store_threads.append(threading.current_thread())
+        return get(store, *args)
+
+    tracker = {"sender_id": "1", "conversation_id": "default"}
+    domain = {"intents": ["greet"]}
+    monkeypatch.setattr(DomainStore, "put", recording_put)
+    monkeypatch.setattr(DomainStore, "get", recording_get)
+
+    await first_worker.run(
+        {
+            "next_action": "action",
+            "tracker": tracker,
+            "domain": domain,
+            "domain_digest": "digest",
+        }
+    )
+    await second_worker.run(
+        {"next_action": "action", "tracker": tracker, "domain_digest": "digest"}
+    )
+
+    assert second_worker.domain == domain
+    assert len(store_threads) == 2
+    assert loop_thread not in store_threads
+
+
+async def test_register_domain(tmp_path: Path):
+    domain_store = DomainStore(str(tmp_path))
+    executor = ActionExecutor(domain_store=domain_store)
+    other_worker = pickle.loads(pickle.dumps(executor))
+    domain = {"intents": ["greet"]}
+
+    assert not await executor.register_domain("digest")
+    assert executor.domain is None
+
+    assert not await executor.register_domain("digest", domain)
+    assert await executor.register_domain("digest", domain)
+    assert executor.update_and_return_domain({"domain_digest": "digest"}, "action") == (
+        domain
+    )
+
+    # The domain reaches other workers through the domain store.
+    assert await other_worker.register_domain("digest")
+    assert other_worker.domain == domain
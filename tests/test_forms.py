@@ -1,4 +1,5 @@
 import logging
+import threading
 
 import pytest
 from pytest import LogCaptureFixture
@@ -14,6 +15,7 @@ from rasa_sdk.forms import (
     REQUESTED_SLOT,
 )
 from rasa_sdk.slots import SlotMapping
+from rasa_sdk.thread_pool import SyncThreadPool, use_thread_pool
 
 
 DEFAULT_DOMAIN = {
@@ -334,6 +336,56 @@ async def test_form_validation_action():
     ]
 
 
+async def test_form_validation_action_runs_sync_methods_in_thread_pool():
+    form_name = "test_form_validation_action_threads"
+    threads = []
+
+    class TestForm(FormValidationAction):
+        def name(self) -> Text:
+            return form_name
+
+        def extract_slot1(
+            self,
+            dispatcher: "CollectingDispatcher",
+            tracker: "Tracker",
+            domain: "DomainDict",
+        ) -> Dict[Text, Any]:
+            threads.append(threading.current_thread())
+            return {"slot1": "extracted_value"}
+
+        def validate_slot1(
+            self,
+            slot_value: Any,
+            dispatcher: "CollectingDispatcher",
+            tracker: "Tracker",
+            domain: "DomainDict",
+        ) -> Dict[Text, Any]:
+            threads.append(threading.current_thread())
+            return {"slot1": slot_value.upper()}
+
+    tracker = Tracker(
+        "default",
+        {},
+        {},
+        [],
+        False,
+        None,
+        {"name": form_name, "is_interrupted": False, "rejected": False},
+        "action_listen",
+    )
+    domain = {
+        "slots": {"slot1": {"type": "any", "mappings": []}},
+        "forms": {form_name: {"required_slots": ["slot1"]}},
+    }
+
+    with use_thread_pool(SyncThreadPool()):
+        events = await TestForm().run(CollectingDispatcher(), tracker, domain)
+
+    assert events == [SlotSet("slot1", "EXTRACTED_VALUE")]
+    assert len(threads) == 2
+    assert threading.current_thread() not in threads
+
+
 async def test_form_validation_action_async():
     form_name = "some_form"
     form = TestFormValidationAction()
@@ -0,0 +1,72 @@
+import grpc
+import pytest
+
+from rasa_sdk.grpc_options import GRPCServerOptions
+
+
+def test_default_options_keep_grpc_defaults():
+    options = GRPCServerOptions()
+
+    assert options.channel_options() == []
+    assert options.server_compression == grpc.Compression.Gzip
+    assert options.message_compression_min_size is None
+
+
+def test_channel_options():
+    options = GRPCServerOptions(
+        max_concurrent_streams=100,
+        max_receive_message_size=16 * 1024 * 1024,
+        max_send_message_size=8 * 1024 * 1024,
+        keepalive_time=30,
+        keepalive_timeout=5.5,
+        max_connection_age=300,
+        max_connection_age_grace=10,
+    )
+
+    assert options.channel_options() == [
+        ("grpc.max_concurrent_streams", 100),
+        ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+        ("grpc.max_send_message_length", 8 * 1024 * 1024),
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 5500),
+        ("grpc.max_connection_age_ms", 300000),
+        ("grpc.max_connection_age_grace_ms", 10000),
+    ]
+
+
+@pytest.mark.parametrize(
+    "compression, server_compression, message_compression_min_size",
+    [
+        ("none", grpc.Compression.NoCompression, None),
+        ("gzip", grpc.Compression.Gzip, None),
+        ("threshold", grpc.Compression.Gzip, 512),
+    ],
+)
+def test_compression_policy(
+    compression: str,
+    server_compression: grpc.Compression,
+    message_compression_min_size: int,
+):
+    options = GRPCServerOptions(compression=compression, compression_min_size=512)
+
+    assert options.server_compression == server_compression
+    assert options.message_compression_min_size == message_compression_min_size
+
+
+def test_unknown_compression_policy():
+    with pytest.raises(ValueError):
+        GRPCServerOptions(compression="brotli")
+
+
+def test_stream_sink_factory():
+    options = GRPCServerOptions(
+        stream_high_water_mark=8,
+        stream_coalesce_max_delay=0.05,
+        stream_coalesce_max_size=32,
+    )
+
+    sink = options.stream_sink_factory()
+
+    assert sink.high_water_mark == 8
+    assert sink.coalesce_max_delay == 0.05
+    assert sink.coalesce_max_size == 32
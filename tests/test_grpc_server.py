@@ -1,22 +1,43 @@
 import asyncio
 import time
+from functools import partial
 from typing import Any, AsyncIterator, Callable, Dict, List, Union, Optional
 from unittest.mock import MagicMock, AsyncMock
 
 import grpc
 import pytest
+from grpc_health.v1 import health_pb2, health_pb2_grpc
 from google.protobuf.json_format import MessageToDict, ParseDict
+from google.protobuf.struct_pb2 import Struct
 
 from rasa_sdk import ActionExecutionRejection
 from rasa_sdk.executor import ActionName, ActionExecutor, ActionExecutorRunResult
+from rasa_sdk.grpc_options import GRPCServerOptions
 from rasa_sdk.grpc_errors import (
     ActionExecutionFailed,
     ResourceNotFound,
     ResourceNotFoundType,
 )
-from rasa_sdk.grpc_py import action_webhook_pb2
-from rasa_sdk.grpc_server import GRPCActionServerWebhook
-from rasa_sdk.interfaces import ActionMissingDomainException, ActionNotFoundException
+from rasa_sdk.grpc_py import action_webhook_pb2, action_webhook_pb2_grpc
+from rasa_sdk.grpc_server import (
+    GRPC_ACTION_SERVER_NAME,
+    GRPCActionServerWebhook,
+    _build_chunk_event,
+    _build_webhook_response,
+    _initialise_grpc_server,
+)
+from rasa_sdk.grpc_tracker import ProtoTrackerState
+from rasa_sdk.metrics import ActionServerMetrics
+from rasa_sdk.readiness import ReadinessMonitor
+from rasa_sdk.response_cache import ResponseCache
+from rasa_sdk.stream_sink import StreamSink
+from rasa_sdk.interfaces import (
+    ActionMissingDomainException,
+    ActionMissingTrackerException,
+    ActionNotFoundException,
+    ActionServerOverloadedException,
+    ActionTimeoutException,
+)
 
 
 @pytest.fixture
@@ -71,7 +92,12 @@ def grpc_webhook_request(
 @pytest.fixture
 def mock_executor() -> AsyncMock:
     """Create a mock action executor."""
-    return AsyncMock(spec=ActionExecutor)
+    executor = AsyncMock(spec=ActionExecutor)
+    executor.metrics = ActionServerMetrics()
+    executor.is_domain_digest_valid = MagicMock(return_value=False)
+    executor.registry_version = 0
+    executor.actions = {}
+    return executor
 
 
 @pytest.fixture
@@ -82,6 +108,8 @@ def mock_grpc_service_context() -> MagicMock:
     # not accidentally trigger the barge-in path.  MagicMock would otherwise
     # return a truthy Mock object, which would look like a cancellation.
     ctx.cancelled = MagicMock(return_value=False)
+    # No deadline unless a test sets one.
+    ctx.time_remaining = MagicMock(return_value=None)
     return ctx
 
 
@@ -148,12 +176,9 @@ def expected_grpc_actions_response() -> action_webhook_pb2.ActionsResponse:
     )
 
 
-@pytest.mark.parametrize(
-    "auto_reload, expected_reload_call_count", [(True, 1), (False, 0)]
-)
+@pytest.mark.parametrize("auto_reload", [True, False])
 async def test_grpc_action_server_webhook_no_errors(
     auto_reload: bool,
-    expected_reload_call_count: int,
     grpc_action_server_webhook: GRPCActionServerWebhook,
     grpc_webhook_request: action_webhook_pb2.WebhookRequest,
     mock_executor: AsyncMock,
@@ -174,13 +199,19 @@ async def test_grpc_action_server_webhook_no_errors(
     mock_grpc_service_context.set_code.assert_not_called()
     mock_grpc_service_context.set_details.assert_not_called()
 
-    assert mock_executor.reload.call_count == expected_reload_call_count
+    # Modules are reloaded by a background watcher, never on the request path.
+    mock_executor.reload.assert_not_called()
+
+    snapshot = mock_executor.metrics.registry.snapshot()
+    [[labels, request_size]] = snapshot["rasa_sdk_request_size_bytes"]["samples"]
+    assert labels == ["grpc", "Webhook"]
+    assert request_size["sum"] == grpc_webhook_request.ByteSize()
 
     expected_action_call = MessageToDict(
         grpc_webhook_request,
         preserving_proto_field_name=True,
     )
-    mock_executor.run.assert_called_once_with(expected_action_call)
+    mock_executor.run.assert_called_once_with(expected_action_call, timeout=None)
 
 
 @pytest.mark.parametrize(
@@ -211,11 +242,23 @@ async def test_grpc_action_server_webhook_no_errors(
                 resource_type=ResourceNotFoundType.DOMAIN,
             ).model_dump_json(),
         ),
+        (
+            ActionMissingTrackerException("action_name", "1", "message"),
+            grpc.StatusCode.NOT_FOUND,
+            ResourceNotFound(
+                action_name="action_name",
+                message="message",
+                resource_type=ResourceNotFoundType.TRACKER,
+            ).model_dump_json(),
+        ),
     ],
 )
 async def test_grpc_action_server_webhook_action_execution_rejected(
     exception: Union[
-        ActionExecutionRejection, ActionNotFoundException, ActionMissingDomainException
+        ActionExecutionRejection,
+        ActionNotFoundException,
+        ActionMissingDomainException,
+        ActionMissingTrackerException,
     ],
     expected_status_code: grpc.StatusCode,
     expected_body: str,
@@ -237,6 +280,118 @@ async def test_grpc_action_server_webhook_action_execution_rejected(
     mock_grpc_service_context.set_details.assert_called_once_with(expected_body)
 
 
+async def test_grpc_action_server_webhook_overloaded(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_executor: AsyncMock,
+    mock_grpc_service_context: MagicMock,
+) -> None:
+    """Test that overloaded calls are rejected with RESOURCE_EXHAUSTED."""
+    mock_executor.run.side_effect = ActionServerOverloadedException(
+        "action_listen", retry_after=1.5
+    )
+    response = await grpc_action_server_webhook.Webhook(
+        grpc_webhook_request,
+        mock_grpc_service_context,
+    )
+
+    assert response == action_webhook_pb2.WebhookResponse()
+    mock_grpc_service_context.set_code.assert_called_once_with(
+        grpc.StatusCode.RESOURCE_EXHAUSTED
+    )
+    mock_grpc_service_context.set_trailing_metadata.assert_called_once_with(
+        (("grpc-retry-pushback-ms", "1500"),)
+    )
+
+
+async def test_grpc_action_server_webhook_skips_known_domain(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_executor: AsyncMock,
+    mock_grpc_service_context: MagicMock,
+) -> None:
+    """Test that the domain is not converted if the executor already has it."""
+    mock_executor.is_domain_digest_valid.return_value = True
+    mock_executor.run.return_value = None
+
+    await grpc_action_server_webhook.Webhook(
+        grpc_webhook_request,
+        mock_grpc_service_context,
+    )
+
+    action_call = mock_executor.run.call_args.args[0]
+    assert "domain" not in action_call
+    assert action_call["domain_digest"] == ""
+    assert isinstance(action_call["tracker"], ProtoTrackerState)
+
+
+async def test_grpc_action_server_webhook_passes_deadline(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_executor: AsyncMock,
+    mock_grpc_service_context: MagicMock,
+) -> None:
+    """Test that the remaining time of the call limits the action."""
+    mock_grpc_service_context.time_remaining.return_value = 2.5
+    mock_executor.run.return_value = None
+
+    await grpc_action_server_webhook.Webhook(
+        grpc_webhook_request,
+        mock_grpc_service_context,
+    )
+
+    assert mock_executor.run.call_args.kwargs["timeout"] == 2.5
+
+
+async def test_grpc_action_server_webhook_deadline_exceeded(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_executor: AsyncMock,
+    mock_grpc_service_context: MagicMock,
+) -> None:
+    """Test that timed out calls are answered with DEADLINE_EXCEEDED."""
+    mock_executor.run.side_effect = ActionTimeoutException("action_listen", timeout=2.5)
+    response = await grpc_action_server_webhook.Webhook(
+        grpc_webhook_request,
+        mock_grpc_service_context,
+    )
+
+    assert response == action_webhook_pb2.WebhookResponse()
+    mock_grpc_service_context.set_code.assert_called_once_with(
+        grpc.StatusCode.DEADLINE_EXCEEDED
+    )
+
+
+async def test_grpc_action_server_webhook_stream_deadline_exceeded(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_executor: AsyncMock,
+    mock_grpc_service_context: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that timed out streaming calls end with DEADLINE_EXCEEDED."""
+    exception = ActionTimeoutException("action_listen", timeout=2.5)
+    mock_executor.run.side_effect = _make_error_run(exception)
+
+    events = await _collect_stream(
+        grpc_action_server_webhook.WebhookStream(
+            grpc_webhook_request, mock_grpc_service_context
+        )
+    )
+
+    assert [event.WhichOneof("event") for event in events] == ["error"]
+    assert events[0].error.message == exception.message
+    mock_grpc_service_context.set_code.assert_called_once_with(
+        grpc.StatusCode.DEADLINE_EXCEEDED
+    )
+    mock_grpc_service_context.set_details.assert_called_once_with(
+        ActionExecutionFailed(
+            action_name="action_listen", message=exception.message
+        ).model_dump_json()
+    )
+    assert "Unexpected error" not in caplog.text
+
+
 @pytest.mark.parametrize(
     "given_action_names, expected_grpc_actions_response",
     [
@@ -270,6 +425,92 @@ async def test_grpc_action_server_actions(
     mock_grpc_service_context.set_details.assert_not_called()
 
 
+async def test_grpc_action_server_actions_is_cached_until_registry_changes(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    mock_grpc_service_context: MagicMock,
+    mock_executor: AsyncMock,
+) -> None:
+    mock_executor.list_actions.return_value = action_names()
+
+    first = await grpc_action_server_webhook.Actions(
+        action_webhook_pb2.ActionsRequest(), mock_grpc_service_context
+    )
+    second = await grpc_action_server_webhook.Actions(
+        action_webhook_pb2.ActionsRequest(), mock_grpc_service_context
+    )
+
+    assert second is first
+    mock_executor.list_actions.assert_called_once()
+
+    mock_executor.actions = {"action_new": MagicMock()}
+    registered = await grpc_action_server_webhook.Actions(
+        action_webhook_pb2.ActionsRequest(), mock_grpc_service_context
+    )
+    mock_executor.registry_version = 1
+    reloaded = await grpc_action_server_webhook.Actions(
+        action_webhook_pb2.ActionsRequest(), mock_grpc_service_context
+    )
+
+    assert registered is not first
+    assert reloaded is not registered
+    assert mock_executor.list_actions.call_count == 3
+
+
+def test_build_webhook_response_matches_parse_dict() -> None:
+    result = ActionExecutorRunResult(
+        events=[
+            {"event": "slot", "name": "count", "value": 3, "timestamp": None},
+            {"event": "slot", "name": "items", "value": [1, "a", {"b": True}]},
+        ],
+        responses=[
+            {
+                "text": "hi",
+                "buttons": [{"title": "yes", "payload": "/affirm"}],
+                "custom": {},
+                "template": None,
+            }
+        ],
+    )
+
+    assert _build_webhook_response(result) == ParseDict(
+        result.model_dump(), action_webhook_pb2.WebhookResponse()
+    )
+
+
+@pytest.mark.parametrize(
+    "chunk_payload",
+    [
+        {"text": "Hello"},
+        {"text": "", "custom": {}},
+        {"text": None, "image": None, "custom": None, "buttons": None},
+        {
+            "text": "Pick one",
+            "image": "https://example.com/a.png",
+            "attachment": "report.pdf",
+            "custom": {"nested": {"values": [1, 2.5, None]}},
+            "buttons": [{"title": "yes", "payload": "/affirm"}],
+            "elements": [{"title": "card"}],
+            "unknown_kwarg": "dropped",
+        },
+    ],
+)
+def test_build_chunk_event_matches_parse_dict(chunk_payload: Dict[str, Any]) -> None:
+    expected = ParseDict(
+        {
+            key: value
+            for key, value in chunk_payload.items()
+            if key in action_webhook_pb2.Chunk.DESCRIPTOR.fields_by_name
+        },
+        action_webhook_pb2.Chunk(response_id="r1"),
+    )
+
+    event = _build_chunk_event(chunk_payload, "r1")
+
+    assert event.WhichOneof("event") == "chunk"
+    assert event.chunk == expected
+    assert event.chunk.HasField("custom") == expected.HasField("custom")
+
+
 # ---------------------------------------------------------------------------
 # Helpers for WebhookStream tests
 # ---------------------------------------------------------------------------
@@ -353,10 +594,10 @@ async def test_webhook_stream_yields_chunk_start_chunks_chunk_end_final_result(
     )
 
     event_types = [e.WhichOneof("event") for e in events]
-    assert event_types == ["chunk_start", "chunk", "chunk", "chunk_end", "final_result"]
+    assert event_types == ["chunk_start", "chunk", "chunk_end", "final_result"]
 
-    assert events[1].chunk.text == "Hello "
-    assert events[2].chunk.text == "world"
+    # Both text chunks were queued before the first was sent, so they're merged.
+    assert events[1].chunk.text == "Hello world"
 
     mock_grpc_service_context.set_code.assert_not_called()
     mock_grpc_service_context.set_details.assert_not_called()
@@ -897,6 +1138,10 @@ async def test_webhook_stream_context_cancel_breaks_promptly_without_final_resul
 
     mock_executor.run.side_effect = _slow_run
     mock_grpc_service_context.invocation_metadata.return_value = []
+    # Keep the queued chunks apart, so that the second one waits in the queue.
+    grpc_action_server_webhook.stream_sink_factory = partial(
+        StreamSink, coalesce_max_size=0
+    )
     # Simulate a client disconnect that arrives while a stream_chunk is
     # already waiting in the queue:
     #   call 1 — pre-yield guard on stream_start  → False (still connected)
@@ -968,3 +1213,307 @@ async def test_webhook_stream_context_cancel_at_stream_done_skips_final_result(
     assert "final_result" not in event_types, (
         "final_result must not be sent to a disconnected client"
     )
+
+
+async def test_grpc_server_listens_on_unix_socket(tmp_path: Any) -> None:
+    """Test that the gRPC server can be reached through a Unix domain socket."""
+    socket_path = str(tmp_path / "action_server.sock")
+    server = _initialise_grpc_server(
+        ActionExecutor(), max_number_of_workers=1, unix_socket=socket_path
+    )
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"unix:{socket_path}") as channel:
+            stub = action_webhook_pb2_grpc.ActionServiceStub(channel)
+            response = await stub.Actions(action_webhook_pb2.ActionsRequest())
+    finally:
+        await server.stop(None)
+
+    assert response == action_webhook_pb2.ActionsResponse()
+
+
+async def test_grpc_health_follows_readiness(tmp_path: Any) -> None:
+    socket_path = str(tmp_path / "action_server.sock")
+    executor = ActionExecutor()
+    monitor = ReadinessMonitor(max_in_flight=1)
+    server = _initialise_grpc_server(
+        executor,
+        max_number_of_workers=1,
+        unix_socket=socket_path,
+        readiness_monitor=monitor,
+    )
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"unix:{socket_path}") as channel:
+            stub = health_pb2_grpc.HealthStub(channel)
+            request = health_pb2.HealthCheckRequest(service=GRPC_ACTION_SERVER_NAME)
+
+            executor.metrics.actions_in_flight.inc("action", amount=2)
+            monitor.check(executor)
+            overloaded = await stub.Check(request)
+
+            executor.metrics.actions_in_flight.dec("action", amount=2)
+            monitor.check(executor)
+            recovered = await stub.Check(request)
+    finally:
+        await server.stop(None)
+
+    assert overloaded.status == health_pb2.HealthCheckResponse.NOT_SERVING
+    assert recovered.status == health_pb2.HealthCheckResponse.SERVING
+
+
+@pytest.mark.parametrize(
+    "compression_min_size, expect_uncompressed", [(None, False), (10**6, True)]
+)
+async def test_grpc_action_server_webhook_compression_policy(
+    mock_executor: AsyncMock,
+    grpc_webhook_request: action_webhook_pb2.WebhookRequest,
+    mock_grpc_service_context: MagicMock,
+    compression_min_size: Optional[int],
+    expect_uncompressed: bool,
+) -> None:
+    mock_executor.run.return_value = ActionExecutorRunResult(
+        events=[{"event": "slot", "name": "a", "value": "b"}], responses=[]
+    )
+    webhook = GRPCActionServerWebhook(
+        mock_executor, compression_min_size=compression_min_size
+    )
+
+    await webhook.Webhook(grpc_webhook_request, mock_grpc_service_context)
+
+    assert (
+        mock_grpc_service_context.disable_next_message_compression.called
+        == expect_uncompressed
+    )
+
+
+async def test_grpc_server_applies_message_size_option(tmp_path: Any) -> None:
+    socket_path = str(tmp_path / "action_server.sock")
+    server = _initialise_grpc_server(
+        ActionExecutor(),
+        max_number_of_workers=1,
+        unix_socket=socket_path,
+        options=GRPCServerOptions(max_receive_message_size=1024),
+    )
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"unix:{socket_path}") as channel:
+            stub = action_webhook_pb2_grpc.ActionServiceStub(channel)
+            with pytest.raises(grpc.aio.AioRpcError) as error:
+                await stub.Webhook(
+                    action_webhook_pb2.WebhookRequest(next_action="a" * 2048)
+                )
+    finally:
+        await server.stop(None)
+
+    assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def _multiplexed_request(
+    correlation_id: str, action_name: str
+) -> action_webhook_pb2.MultiplexedWebhookRequest:
+    return action_webhook_pb2.MultiplexedWebhookRequest(
+        correlation_id=correlation_id,
+        request=action_webhook_pb2.WebhookRequest(
+            next_action=action_name,
+            tracker=action_webhook_pb2.Tracker(sender_id="1"),
+            domain=action_webhook_pb2.Domain(),
+        ),
+    )
+
+
+async def test_webhook_multiplex_returns_responses_as_they_finish(
+    tmp_path: Any,
+) -> None:
+    executor = ActionExecutor()
+    release_slow = asyncio.Event()
+
+    async def slow(dispatcher: Any, tracker: Any, domain: Any) -> List[Any]:
+        await release_slow.wait()
+        dispatcher.utter_message(text="slow")
+        return []
+
+    async def fast(dispatcher: Any, tracker: Any, domain: Any) -> List[Any]:
+        dispatcher.utter_message(text="fast")
+        return []
+
+    executor.register_function("action_slow", slow)
+    executor.register_function("action_fast", fast)
+    socket_path = str(tmp_path / "action_server.sock")
+    server = _initialise_grpc_server(
+        executor, max_number_of_workers=1, unix_socket=socket_path
+    )
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"unix:{socket_path}") as channel:
+            call = action_webhook_pb2_grpc.ActionServiceStub(channel).WebhookMultiplex()
+            await call.write(_multiplexed_request("1", "action_slow"))
+            await call.write(_multiplexed_request("2", "action_fast"))
+            await call.write(_multiplexed_request("3", "action_unknown"))
+            first = await call.read()
+            second = await call.read()
+            release_slow.set()
+            await call.done_writing()
+            responses = [first, second, await call.read()]
+            assert await call.read() == grpc.aio.EOF
+    finally:
+        await server.stop(None)
+
+    assert sorted([response.correlation_id for response in responses[:2]]) == ["2", "3"]
+    assert responses[2].correlation_id == "1"
+    by_id = {response.correlation_id: response for response in responses}
+    assert by_id["1"].response.responses[0]["text"] == "slow"
+    assert by_id["2"].response.responses[0]["text"] == "fast"
+    assert by_id["3"].WhichOneof("result") == "error"
+    assert by_id["3"].error.code == grpc.StatusCode.NOT_FOUND.value[0]
+
+
+async def test_grpc_webhook_runs_retried_request_once_with_response_cache(
+    tmp_path: Any,
+) -> None:
+    executor = ActionExecutor(response_cache=ResponseCache())
+    runs = 0
+
+    async def counting(dispatcher: Any, tracker: Any, domain: Any) -> List[Any]:
+        nonlocal runs
+        runs += 1
+        dispatcher.utter_message(text=f"run {runs}")
+        return []
+
+    executor.register_function("action_count", counting)
+    request = action_webhook_pb2.WebhookRequest(
+        next_action="action_count",
+        tracker=action_webhook_pb2.Tracker(
+            sender_id="1",
+            latest_message=ParseDict({"message_id": "m1"}, Struct()),
+        ),
+        domain=action_webhook_pb2.Domain(),
+    )
+    socket_path = str(tmp_path / "action_server.sock")
+    server = _initialise_grpc_server(
+        executor, max_number_of_workers=1, unix_socket=socket_path
+    )
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"unix:{socket_path}") as channel:
+            stub = action_webhook_pb2_grpc.ActionServiceStub(channel)
+            first = await stub.Webhook(request)
+            retried = await stub.Webhook(request)
+    finally:
+        await server.stop(None)
+
+    assert runs == 1
+    assert first.responses[0]["text"] == "run 1"
+    assert retried.responses[0]["text"] == "run 1"
+
+
+async def test_webhook_multiplex_limits_requests_in_flight(
+    mock_executor: AsyncMock, mock_grpc_service_context: MagicMock
+) -> None:
+    running = 0
+    max_running = 0
+
+    async def run(*args: Any, **kwargs: Any) -> ActionExecutorRunResult:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ActionExecutorRunResult(events=[], responses=[])
+
+    mock_executor.run.side_effect = run
+    webhook = GRPCActionServerWebhook(mock_executor, multiplex_max_in_flight=2)
+
+    async def requests() -> AsyncIterator[action_webhook_pb2.MultiplexedWebhookRequest]:
+        for index in range(6):
+            yield _multiplexed_request(str(index), "action_listen")
+
+    responses = [
+        response
+        async for response in webhook.WebhookMultiplex(
+            requests(), mock_grpc_service_context
+        )
+    ]
+
+    assert sorted(response.correlation_id for response in responses) == [
+        str(index) for index in range(6)
+    ]
+    assert all(response.HasField("response") for response in responses)
+    assert max_running == 2
+
+
+async def test_webhook_multiplex_reports_errors_per_request(
+    mock_executor: AsyncMock, mock_grpc_service_context: MagicMock
+) -> None:
+    mock_executor.run.side_effect = ActionServerOverloadedException(
+        "action_listen", retry_after=2.5
+    )
+    webhook = GRPCActionServerWebhook(mock_executor)
+
+    async def requests() -> AsyncIterator[action_webhook_pb2.MultiplexedWebhookRequest]:
+        yield _multiplexed_request("1", "action_listen")
+
+    responses = [
+        response
+        async for response in webhook.WebhookMultiplex(
+            requests(), mock_grpc_service_context
+        )
+    ]
+
+    assert len(responses) == 1
+    error = responses[0].error
+    assert error.code == grpc.StatusCode.RESOURCE_EXHAUSTED.value[0]
+    assert error.retry_after == 2.5
+    mock_grpc_service_context.set_code.assert_not_called()
+
+
+async def test_grpc_register_domain(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    mock_grpc_service_context: MagicMock,
+    mock_executor: AsyncMock,
+) -> None:
+    mock_executor.register_domain = AsyncMock(return_value=False)
+    request = action_webhook_pb2.RegisterDomainRequest(
+        domain_digest="digest",
+        domain=action_webhook_pb2.Domain(
+            intents=[action_webhook_pb2.Intent(string_value="greet")]
+        ),
+    )
+
+    response = await grpc_action_server_webhook.RegisterDomain(
+        request, mock_grpc_service_context
+    )
+
+    assert not response.known
+    mock_executor.register_domain.assert_awaited_once_with(
+        "digest", {"intents": [{"string_value": "greet"}]}
+    )
+
+
+async def test_grpc_register_domain_only_checks_without_domain(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    mock_grpc_service_context: MagicMock,
+    mock_executor: AsyncMock,
+) -> None:
+    mock_executor.register_domain = AsyncMock(return_value=True)
+
+    response = await grpc_action_server_webhook.RegisterDomain(
+        action_webhook_pb2.RegisterDomainRequest(domain_digest="digest"),
+        mock_grpc_service_context,
+    )
+
+    assert response.known
+    mock_executor.register_domain.assert_awaited_once_with("digest", None)
+
+
+async def test_grpc_register_domain_requires_digest(
+    grpc_action_server_webhook: GRPCActionServerWebhook,
+    mock_grpc_service_context: MagicMock,
+) -> None:
+    await grpc_action_server_webhook.RegisterDomain(
+        action_webhook_pb2.RegisterDomainRequest(), mock_grpc_service_context
+    )
+
+    mock_grpc_service_context.set_code.assert_called_once_with(
+        grpc.StatusCode.INVALID_ARGUMENT
+    )
@@ -0,0 +1,149 @@
+from typing import Any, Dict, Text
+
+import pytest
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from rasa_sdk.grpc_py import action_webhook_pb2
+from rasa_sdk.grpc_tracker import (
+    ProtoTracker,
+    ProtoTrackerState,
+    count_events,
+    events_to_dicts,
+    raw_events,
+)
+from rasa_sdk.interfaces import Tracker
+
+
+@pytest.fixture
+def tracker_message() -> action_webhook_pb2.Tracker:
+    return ParseDict(
+        {
+            "sender_id": "1",
+            "slots": {"location": "Berlin", "guests": 2},
+            "latest_message": {
+                "message_id": "m1",
+                "entities": [{"entity": "city", "value": "Berlin"}],
+            },
+            "events": [
+                {"event": "action", "name": "action_listen"},
+                {"event": "user", "text": "hi", "input_channel": "rest"},
+            ],
+            "paused": True,
+            "followup_action": "action_search",
+            "active_loop": {"name": "booking_form"},
+            "latest_action_name": "action_listen",
+            "stack": [{"frame_id": "f1"}],
+        },
+        action_webhook_pb2.Tracker(),
+    )
+
+
+def test_state_matches_message_to_dict(tracker_message: action_webhook_pb2.Tracker):
+    state = ProtoTrackerState(tracker_message)
+
+    assert dict(state) == MessageToDict(
+        tracker_message, preserving_proto_field_name=True
+    )
+    assert "user_id" not in state
+    assert state.get("user_id") is None
+
+
+def test_state_converts_fields_on_first_access(
+    tracker_message: action_webhook_pb2.Tracker,
+):
+    state = ProtoTrackerState(tracker_message)
+
+    assert state["slots"]["location"] == "Berlin"
+
+    assert set(state._values) == {"slots"}
+    assert state["slots"] is state["slots"]
+
+
+def test_tracker_matches_tracker_from_dict(
+    tracker_message: action_webhook_pb2.Tracker,
+):
+    tracker = ProtoTrackerState(tracker_message).to_tracker()
+    expected = Tracker.from_dict(
+        MessageToDict(tracker_message, preserving_proto_field_name=True)
+    )
+
+    assert isinstance(tracker, ProtoTracker)
+    assert tracker.current_state() == expected.current_state()
+    assert tracker == expected
+    assert tracker.get_slot("guests") == 2
+    assert list(tracker.get_latest_entity_values("city")) == ["Berlin"]
+    assert tracker.active_loop_name == "booking_form"
+
+
+def test_tracker_only_converts_read_fields(
+    tracker_message: action_webhook_pb2.Tracker,
+):
+    state = ProtoTrackerState(tracker_message)
+    tracker = state.to_tracker()
+
+    assert tracker.get_slot("location") == "Berlin"
+
+    assert "events" not in state._values
+    assert "latest_message" not in state._values
+
+
+@pytest.mark.parametrize(
+    "field, expected",
+    [
+        ("slots", {}),
+        ("latest_message", {}),
+        ("events", []),
+        ("active_loop", {}),
+        ("stack", []),
+    ],
+)
+def test_tracker_defaults_for_unset_fields(field: Text, expected: Any):
+    tracker = ProtoTracker(ProtoTrackerState(action_webhook_pb2.Tracker()))
+
+    assert getattr(tracker, field) == expected
+    assert not tracker.is_paused()
+    assert tracker.followup_action is None
+
+
+def test_tracker_fields_can_be_replaced(tracker_message: action_webhook_pb2.Tracker):
+    tracker = ProtoTrackerState(tracker_message).to_tracker()
+    slots: Dict[Text, Any] = {"location": "Paris"}
+
+    tracker.slots = slots
+
+    assert tracker.get_slot("location") == "Paris"
+
+
+def test_replace_overrides_field(tracker_message: action_webhook_pb2.Tracker):
+    state = ProtoTrackerState(tracker_message)
+    events = [{"event": "user", "text": "hello"}]
+
+    replaced = state.replace("events", events)
+
+    assert replaced["events"] is events
+    assert replaced.to_tracker().events is events
+    assert replaced["sender_id"] == "1"
+    assert len(state["events"]) == 2
+
+
+def test_count_events_doesnt_convert_events(
+    tracker_message: action_webhook_pb2.Tracker,
+):
+    state = ProtoTrackerState(tracker_message)
+
+    assert count_events(state) == 2
+    assert "events" not in state._values
+    assert count_events(MessageToDict(tracker_message)) == 2
+    assert count_events({}) == 0
+
+
+def test_raw_events_are_converted_by_events_to_dicts(
+    tracker_message: action_webhook_pb2.Tracker,
+):
+    state = ProtoTrackerState(tracker_message)
+
+    events = raw_events(state)
+
+    assert "events" not in state._values
+    assert events_to_dicts(events) == MessageToDict(tracker_message)["events"]
+    assert events_to_dicts([{"event": "action"}]) == [{"event": "action"}]
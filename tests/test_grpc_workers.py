@@ -0,0 +1,72 @@
+import os
+import sys
+from typing import Any
+from unittest.mock import MagicMock
+
+import grpc
+import pytest
+
+from rasa_sdk.executor import ActionExecutor
+from rasa_sdk.grpc_py import action_webhook_pb2, action_webhook_pb2_grpc
+from rasa_sdk.grpc_server import GRPCActionServerWebhook
+from rasa_sdk.grpc_workers import GRPCWorker, supervise_workers
+
+
+def test_response_id_identifies_owner(tmp_path: Any):
+    worker = GRPCWorker(3, str(tmp_path))
+
+    assert GRPCWorker.owner(worker.new_response_id()) == 3
+
+
+@pytest.mark.parametrize("response_id", ["", "abc", "x-abc", "-abc"])
+def test_owner_of_foreign_response_id_is_none(response_id: str):
+    assert GRPCWorker.owner(response_id) is None
+
+
+async def test_ack_is_forwarded_to_owning_worker(tmp_path: Any):
+    owner = GRPCWorker(1, str(tmp_path))
+    owner_webhook = GRPCActionServerWebhook(ActionExecutor(), worker=owner)
+    dispatcher = MagicMock()
+    response_id = owner.new_response_id()
+    owner_webhook._dispatcher_registry[response_id] = dispatcher
+
+    server = grpc.aio.server()
+    action_webhook_pb2_grpc.add_ActionServiceServicer_to_server(owner_webhook, server)
+    server.add_insecure_port(f"unix:{owner.socket_path}")
+    await server.start()
+
+    receiver = GRPCWorker(0, str(tmp_path))
+    receiver_webhook = GRPCActionServerWebhook(ActionExecutor(), worker=receiver)
+    context = MagicMock(spec=grpc.aio.ServicerContext)
+    context.time_remaining.return_value = 5
+    try:
+        await receiver_webhook.AckStreamChunks(
+            action_webhook_pb2.StreamChunkAck(response_id=response_id), context
+        )
+    finally:
+        await receiver.close()
+        await server.stop(None)
+
+    dispatcher.cancel_stream.assert_called_once()
+
+
+def _run_flaky_worker(directory: str, index: int) -> None:
+    # Crash on the first start, exit cleanly once restarted.
+    marker = os.path.join(directory, f"started-{index}")
+    restarted = os.path.exists(marker)
+    with open(marker, "a") as file:
+        file.write("started\n")
+    if not restarted:
+        os._exit(1)
+    sys.exit(0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Workers are forked.")
+def test_crashed_workers_are_restarted(tmp_path: Any):
+    supervise_workers(
+        2, lambda index: _run_flaky_worker(str(tmp_path), index), restart_delay=0
+    )
+
+    for index in range(2):
+        with open(tmp_path / f"started-{index}") as file:
+            assert file.read().splitlines() == ["started", "started"]
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+
+from rasa_sdk import json_codec
+from rasa_sdk.json_codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+)
+
+
+def _installed_codecs() -> Any:
+    codecs = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda c: c.name)
+def test_codec_round_trip(codec: JSONCodec):
+    data = {
+        "events": [{"event": "slot", "name": "ä", "value": [1, 2.5, None, True]}],
+        "responses": [],
+    }
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode("utf-8")) == data
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda c: c.name)
+def test_codec_loads_invalid_json_raises_value_error(codec: JSONCodec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda c: c.name)
+def test_codec_dumps_falls_back_for_big_integers(codec: JSONCodec):
+    assert codec.loads(codec.dumps({"value": 2**70})) == {"value": 2**70}
+
+
+def test_get_json_codec_by_name():
+    assert get_json_codec("json").name == "json"
+
+
+def test_get_json_codec_auto_returns_installed_codec():
+    assert get_json_codec("auto").name in ("json", "orjson", "msgspec")
+
+
+def test_get_json_codec_unknown_name_raises():
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
+
+
+def test_get_json_codec_falls_back_when_not_installed(monkeypatch: pytest.MonkeyPatch):
+    def _not_installed() -> None:
+        raise ImportError()
+
+    monkeypatch.setitem(json_codec.JSON_CODECS, "orjson", _not_installed)
+
+    assert get_json_codec("orjson").name == "json"
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from rasa_sdk.metrics import (
+    ActionServerMetrics,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    collect_snapshots,
+    load_snapshots,
+    merge_snapshots,
+    render_snapshot,
+    start_metrics_server,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+def test_render_counter_and_gauge(registry: MetricsRegistry):
+    counter = registry.register(Counter("calls_total", "Calls.", ["action_name"]))
+    gauge = registry.register(Gauge("in_flight", "Running."))
+    counter.inc("action_a")
+    counter.inc("action_a", amount=2)
+    counter.inc('quote"d')
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert render_snapshot(registry.snapshot()) == (
+        "# HELP calls_total Calls.\n"
+        "# TYPE calls_total counter\n"
+        'calls_total{action_name="action_a"} 3\n'
+        'calls_total{action_name="quote\\"d"} 1\n'
+        "# HELP in_flight Running.\n"
+        "# TYPE in_flight gauge\n"
+        "in_flight 1\n"
+    )
+
+
+def test_render_histogram(registry: MetricsRegistry):
+    histogram = registry.register(
+        Histogram("duration_seconds", "Duration.", ["action_name"], buckets=[0.1, 1])
+    )
+    histogram.observe(0.05, "action_a")
+    histogram.observe(0.5, "action_a")
+    histogram.observe(5, "action_a")
+
+    assert render_snapshot(registry.snapshot()) == (
+        "# HELP duration_seconds Duration.\n"
+        "# TYPE duration_seconds histogram\n"
+        'duration_seconds_bucket{action_name="action_a",le="0.1"} 1\n'
+        'duration_seconds_bucket{action_name="action_a",le="1"} 2\n'
+        'duration_seconds_bucket{action_name="action_a",le="+Inf"} 3\n'
+        'duration_seconds_sum{action_name="action_a"} 5.55\n'
+        'duration_seconds_count{action_name="action_a"} 3\n'
+    )
+
+
+def test_register_duplicate_metric_raises(registry: MetricsRegistry):
+    registry.register(Counter("calls_total", "Calls."))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("calls_total", "Calls."))
+
+
+def test_merge_snapshots_ignores_gauges_of_stopped_processes():
+    stopped, live = ActionServerMetrics(), ActionServerMetrics()
+    for metrics in (stopped, live):
+        metrics.action_errors.inc("action_a", "ActionNotFoundException")
+        metrics.actions_in_flight.inc("action_a")
+        metrics.action_duration.observe(0.2, "action_a")
+
+    merged = merge_snapshots([stopped.registry.snapshot()], [live.registry.snapshot()])
+
+    assert merged["rasa_sdk_action_errors_total"]["samples"] == [
+        [["action_a", "ActionNotFoundException"], 2.0]
+    ]
+    assert merged["rasa_sdk_actions_in_flight"]["samples"] == [[["action_a"], 1.0]]
+    [[_, duration]] = merged["rasa_sdk_action_duration_seconds"]["samples"]
+    assert duration["count"] == 2
+    assert sum(duration["buckets"]) == 2
+
+
+def test_collect_snapshots_merges_other_processes(tmp_path: Path):
+    other = ActionServerMetrics()
+    other.stream_chunks.inc("action_a", amount=3)
+    other.actions_in_flight.inc("action_a")
+    # A PID which doesn't exist, i.e. a worker which stopped.
+    (tmp_path / "999999999.json").write_text(json.dumps(other.registry.snapshot()))
+    (tmp_path / "not-a-snapshot.txt").write_text("ignored")
+
+    current = ActionServerMetrics()
+    current.stream_chunks.inc("action_a")
+    write_snapshot(str(tmp_path), {"stale": {}})
+
+    merged = collect_snapshots(str(tmp_path), current.registry.snapshot())
+
+    assert os.path.exists(tmp_path / f"{os.getpid()}.json")
+    assert "stale" not in merged
+    assert merged["rasa_sdk_stream_chunks_total"]["samples"] == [[["action_a"], 4.0]]
+    assert merged["rasa_sdk_actions_in_flight"]["samples"] == []
+
+
+async def test_load_snapshots_merges_other_processes(tmp_path: Path):
+    other = ActionServerMetrics()
+    other.action_errors.inc("action_a", "ValueError")
+    (tmp_path / "1.json").write_text(json.dumps(other.registry.snapshot()))
+
+    current = ActionServerMetrics()
+    current.action_errors.inc("action_a", "ValueError")
+
+    merged = await load_snapshots(str(tmp_path), current.registry.snapshot())
+
+    assert merged["rasa_sdk_action_errors_total"]["samples"] == [
+        [["action_a", "ValueError"], 2.0]
+    ]
+
+
+async def test_metrics_server_exposes_metrics():
+    metrics = ActionServerMetrics()
+    metrics.action_errors.inc("action_a", "ActionExecutionRejection")
+
+    async def collect() -> dict:
+        return metrics.registry.snapshot()
+
+    server = await start_metrics_server(collect, 0, "127.0.0.1")
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data
+
+    try:
+        response = await get("/metrics")
+        not_found = await get("/")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert (
+        b'rasa_sdk_action_errors_total{action_name="action_a",'
+        b'exception="ActionExecutionRejection"} 1'
+    ) in response
+    assert not_found.startswith(b"HTTP/1.1 404 Not Found\r\n")
+
+
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        # The request is never completed.
+        b"GET /metrics HTTP/1.1\r\n",
+        # The request line is longer than the limit of the stream.
+        b"GET /" + b"a" * 2**17 + b" HTTP/1.1\r\n\r\n",
+    ],
+)
+async def test_metrics_server_disconnects_invalid_requests(request_head: bytes):
+    async def collect() -> dict:
+        return {}
+
+    server = await start_metrics_server(collect, 0, "127.0.0.1", request_timeout=0.1)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(request_head)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), 5)
+        except ConnectionResetError:
+            # The server closed the connection before reading all the data.
+            data = b""
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert data == b""
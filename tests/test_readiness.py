@@ -0,0 +1,77 @@
+import asyncio
+import pickle
+from typing import List
+
+from rasa_sdk.admission import AdmissionController
+from rasa_sdk.executor import ActionExecutor
+from rasa_sdk.readiness import ReadinessMonitor
+
+
+def _set_in_flight(executor: ActionExecutor, count: int) -> None:
+    executor.metrics.actions_in_flight.set("action", value=count)
+
+
+def test_monitor_without_limits_is_always_ready():
+    monitor = ReadinessMonitor()
+    executor = ActionExecutor()
+    _set_in_flight(executor, 1000)
+
+    assert not monitor.enabled
+    assert monitor.check(executor, loop_lag=10.0)
+
+
+def test_monitor_recovers_with_hysteresis():
+    monitor = ReadinessMonitor(max_in_flight=10, recovery_ratio=0.5)
+    executor = ActionExecutor()
+    changes: List[bool] = []
+    monitor.add_listener(changes.append)
+
+    _set_in_flight(executor, 11)
+    assert not monitor.check(executor)
+    assert monitor.status() == {
+        "status": "not ready",
+        "loop_lag": 0.0,
+        "reasons": ["actions in flight 11 exceeds 10"],
+    }
+
+    # Dropping below the limit isn't enough to become ready again.
+    _set_in_flight(executor, 8)
+    assert not monitor.check(executor)
+    assert monitor.reasons == ["actions in flight 8 exceeds 5"]
+
+    _set_in_flight(executor, 5)
+    assert monitor.check(executor)
+    assert monitor.status()["status"] == "ready"
+    assert changes == [False, True]
+
+
+def test_monitor_checks_loop_lag_and_queue_depth():
+    controller = AdmissionController(max_concurrent_actions=1)
+    executor = ActionExecutor(admission_controller=controller)
+    monitor = ReadinessMonitor(max_loop_lag=0.1, max_queue_depth=0)
+
+    assert not monitor.check(executor, loop_lag=0.5)
+    assert monitor.reasons == ["event loop lag 0.5 exceeds 0.1"]
+    assert monitor.check(executor, loop_lag=0.0)
+
+
+async def test_watch_checks_periodically():
+    monitor = ReadinessMonitor(max_in_flight=0, check_interval=0.01)
+    executor = ActionExecutor()
+    _set_in_flight(executor, 1)
+
+    task = asyncio.create_task(monitor.watch(executor))
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert not monitor.ready
+
+
+def test_pickled_monitor_drops_listeners():
+    monitor = ReadinessMonitor(max_in_flight=3)
+    monitor.add_listener(print)
+
+    restored = pickle.loads(pickle.dumps(monitor))
+
+    assert restored.max_in_flight == 3
+    assert restored._listeners == []
@@ -0,0 +1,76 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from rasa_sdk.reloader import (
+    ModuleWatcher,
+    reload_on_signal,
+    signal_reload,
+    snapshot_modification_times,
+)
+
+
+def test_snapshot_modification_times_scans_python_files(tmp_path: Path):
+    package = tmp_path / "actions"
+    (package / "__pycache__").mkdir(parents=True)
+    (package / "sub").mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "sub" / "action.py").write_text("")
+    (package / "README.md").write_text("")
+    (package / "__pycache__" / "cached.py").write_text("")
+    single_module = tmp_path / "actions.py"
+    single_module.write_text("")
+
+    times = snapshot_modification_times([str(package), str(single_module)])
+
+    assert set(times) == {
+        str(package / "__init__.py"),
+        str(package / "sub" / "action.py"),
+        str(single_module),
+    }
+
+
+def test_module_watcher_polling_reports_changes(tmp_path: Path):
+    action_file = tmp_path / "action.py"
+    action_file.write_text("")
+    changed = threading.Event()
+
+    watcher = ModuleWatcher(
+        [str(tmp_path)], changed.set, poll_interval=0.01, use_watchfiles=False
+    )
+    watcher.start()
+    try:
+        time.sleep(0.05)
+        assert not changed.is_set()
+
+        mod_time = time.time() + 10
+        os.utime(action_file, times=(mod_time, mod_time))
+
+        assert changed.wait(timeout=5)
+    finally:
+        watcher.stop(timeout=5)
+
+
+def test_module_watcher_ignores_missing_paths(tmp_path: Path):
+    watcher = ModuleWatcher([str(tmp_path / "missing"), str(tmp_path)], MagicMock())
+
+    assert watcher.paths == [str(tmp_path)]
+
+
+async def test_reload_on_signal_reloads_once_per_signal():
+    generation = multiprocessing.Value("Q", 0)
+    reload = MagicMock()
+    task = asyncio.create_task(reload_on_signal(reload, generation, interval=0.01))
+
+    await asyncio.sleep(0.05)
+    reload.assert_not_called()
+
+    signal_reload(generation)
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    reload.assert_called_once_with()
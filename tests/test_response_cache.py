@@ -0,0 +1,151 @@
+import asyncio
+import pickle
+from typing import Any, Dict, Text
+
+import pytest
+
+from rasa_sdk.response_cache import ResponseCache
+
+
+def _action_call(**tracker: Any) -> Dict[Text, Any]:
+    return {
+        "next_action": "action_search",
+        "tracker": {
+            "sender_id": "1",
+            "latest_message": {"message_id": "m1"},
+            "events": [{"event": "user"}],
+            **tracker,
+        },
+    }
+
+
+def test_key_identifies_call():
+    assert ResponseCache.key(_action_call()) == ("1", "m1", "action_search", 1)
+
+
+@pytest.mark.parametrize(
+    "action_call",
+    [
+        {"next_action": "action_search"},
+        _action_call(latest_message={}),
+        _action_call(sender_id=None),
+        {"tracker": _action_call()["tracker"]},
+    ],
+)
+def test_key_of_unidentifiable_call_is_none(action_call: Dict[Text, Any]):
+    assert ResponseCache.key(action_call) is None
+
+
+async def test_concurrent_identical_calls_share_one_run():
+    cache = ResponseCache()
+    runs = 0
+    release = asyncio.Event()
+
+    async def run() -> Text:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return "result"
+
+    first = asyncio.ensure_future(cache.get_or_run("key", run))
+    second = asyncio.ensure_future(cache.get_or_run("key", run))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["result", "result"]
+    assert runs == 1
+    assert cache.stats() == {
+        "entries": 1,
+        "in_flight": 0,
+        "hits": 0,
+        "shared": 1,
+        "misses": 1,
+    }
+
+
+async def test_finished_result_is_cached_until_it_expires(monkeypatch: Any):
+    cache = ResponseCache(ttl=10)
+    now = 100.0
+    monkeypatch.setattr("rasa_sdk.response_cache.time.monotonic", lambda: now)
+    runs = 0
+
+    async def run() -> int:
+        nonlocal runs
+        runs += 1
+        return runs
+
+    assert await cache.get_or_run("key", run) == 1
+    assert await cache.get_or_run("key", run) == 1
+
+    now += 10
+    assert await cache.get_or_run("key", run) == 2
+    assert cache.stats()["hits"] == 1
+
+
+async def test_least_recently_used_result_is_dropped():
+    cache = ResponseCache(max_entries=2)
+
+    async def run() -> None:
+        return None
+
+    for key in ("a", "b", "a", "c"):
+        await cache.get_or_run(key, run)
+
+    assert list(cache._results) == ["a", "c"]
+
+
+async def test_failed_call_is_not_cached():
+    cache = ResponseCache()
+    runs = 0
+
+    async def run() -> None:
+        nonlocal runs
+        runs += 1
+        raise ValueError("failed")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await cache.get_or_run("key", run)
+
+    assert runs == 2
+    assert cache.stats()["entries"] == 0
+
+
+async def test_shared_call_is_cancelled_with_its_last_caller():
+    cache = ResponseCache()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def run() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(cache.get_or_run("key", run))
+    second = asyncio.ensure_future(cache.get_or_run("key", run))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert cache.stats()["in_flight"] == 0
+
+
+async def test_pickling_drops_results():
+    cache = ResponseCache(max_entries=3, ttl=5)
+
+    async def run() -> Text:
+        return "result"
+
+    await cache.get_or_run("key", run)
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.stats()["entries"] == 0
+    assert (restored.max_entries, restored.ttl) == (3, 5)
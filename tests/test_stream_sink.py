@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, Dict, List, Text
+
+from rasa_sdk.stream_sink import StreamSink
+
+
+def _chunk(text: Text, **fields: Any) -> Dict[Text, Any]:
+    return {"event": "stream_chunk", "text": text, **fields}
+
+
+def _drain(sink: StreamSink) -> List[Dict[Text, Any]]:
+    events = []
+    while not sink.empty():
+        events.append(sink.get_nowait())
+    return events
+
+
+async def test_queued_text_chunks_are_merged():
+    sink = StreamSink()
+    await sink.put({"event": "stream_start"})
+    await sink.put(_chunk("Hello "))
+    await sink.put(_chunk("world"))
+    await sink.put(_chunk("!", image="https://example.com/a.png"))
+    await sink.put(_chunk(" Bye"))
+    await sink.put({"event": "stream_end"})
+
+    assert _drain(sink) == [
+        {"event": "stream_start"},
+        _chunk("Hello world"),
+        _chunk("!", image="https://example.com/a.png"),
+        _chunk(" Bye"),
+        {"event": "stream_end"},
+    ]
+
+
+async def test_merged_chunks_respect_max_size():
+    sink = StreamSink(coalesce_max_size=5)
+    for text in ["abc", "de", "f", "ghijkl"]:
+        await sink.put(_chunk(text))
+
+    assert [event["text"] for event in _drain(sink)] == ["abcde", "f", "ghijkl"]
+
+
+async def test_max_size_zero_disables_merging():
+    sink = StreamSink(coalesce_max_size=0)
+    await sink.put(_chunk("a"))
+    await sink.put(_chunk("b"))
+
+    assert sink.qsize() == 2
+
+
+async def test_chunks_wait_above_high_water_mark():
+    sink = StreamSink(high_water_mark=2, coalesce_max_size=0)
+    await sink.put(_chunk("a"))
+    await sink.put(_chunk("b"))
+
+    blocked = asyncio.ensure_future(sink.put(_chunk("c")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    # Other events never wait.
+    await asyncio.wait_for(sink.put({"event": "stream_end"}), 1)
+
+    assert (await sink.get())["text"] == "a"
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    assert (await sink.get())["text"] == "b"
+    await asyncio.wait_for(blocked, 1)
+    assert _drain(sink) == [{"event": "stream_end"}, _chunk("c")]
+
+
+async def test_get_holds_text_chunk_for_max_delay():
+    sink = StreamSink(coalesce_max_delay=0.2)
+    await sink.put(_chunk("Hel"))
+
+    getter = asyncio.ensure_future(sink.get())
+    await asyncio.sleep(0.01)
+    await sink.put(_chunk("lo"))
+    await sink.put({"event": "stream_end"})
+
+    assert await asyncio.wait_for(getter, 1) == _chunk("Hello")
+    assert await sink.get() == {"event": "stream_end"}
+
+
+async def test_get_returns_held_chunk_after_max_delay():
+    sink = StreamSink(coalesce_max_delay=0.01)
+    await sink.put(_chunk("Hello"))
+
+    assert await asyncio.wait_for(sink.get(), 1) == _chunk("Hello")
+    await sink.put(_chunk(" world"))
+    assert sink.get_nowait() == _chunk(" world")
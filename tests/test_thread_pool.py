@@ -0,0 +1,76 @@
+import asyncio
+import contextvars
+import pickle
+import threading
+from typing import Any, Optional, Text
+
+from rasa_sdk.thread_pool import SyncThreadPool, call_action_code, use_thread_pool
+
+request_id: contextvars.ContextVar[Optional[Text]] = contextvars.ContextVar(
+    "request_id", default=None
+)
+
+
+def current_thread_and_request() -> Any:
+    return threading.current_thread(), request_id.get()
+
+
+async def test_thread_pool_runs_function_in_copied_context():
+    thread_pool = SyncThreadPool(max_workers=1)
+    request_id.set("r1")
+
+    thread, seen_request_id = await thread_pool.run(current_thread_and_request)
+
+    assert thread is not threading.current_thread()
+    assert thread.name.startswith("rasa_sdk_action")
+    assert seen_request_id == "r1"
+
+
+async def test_thread_pool_bounds_number_of_threads():
+    thread_pool = SyncThreadPool(max_workers=2)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def blocking_call() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        threading.Event().wait(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(thread_pool.run(blocking_call) for _ in range(6)))
+
+    assert max_running == 2
+
+
+async def test_call_action_code_runs_sync_function_in_active_thread_pool():
+    with use_thread_pool(SyncThreadPool()):
+        thread, _ = await call_action_code(current_thread_and_request)
+
+    assert thread is not threading.current_thread()
+
+
+async def test_call_action_code_runs_in_event_loop_without_thread_pool():
+    async def async_function() -> threading.Thread:
+        return threading.current_thread()
+
+    with use_thread_pool(None):
+        sync_thread, _ = await call_action_code(current_thread_and_request)
+    with use_thread_pool(SyncThreadPool()):
+        async_thread = await call_action_code(async_function)
+
+    assert sync_thread is threading.current_thread()
+    assert async_thread is threading.current_thread()
+
+
+async def test_thread_pool_can_be_pickled_after_use():
+    thread_pool = SyncThreadPool(max_workers=3)
+    await thread_pool.run(current_thread_and_request)
+
+    restored = pickle.loads(pickle.dumps(thread_pool))
+
+    assert restored.max_workers == 3
+    assert restored._executor is None
@@ -0,0 +1,78 @@
+import pickle
+
+from rasa_sdk.tracker_cache import TrackerCache
+
+
+def _events(count: int, start: int = 0):
+    return [{"event": "user", "text": str(index)} for index in range(start, count)]
+
+
+def test_events_prepends_cached_events():
+    cache = TrackerCache()
+    cache.store("1", _events(3))
+
+    assert cache.events("1", 3, _events(5, start=3)) == _events(5)
+    assert cache.events("1", 2, [{"event": "restart"}]) == [
+        *_events(2),
+        {"event": "restart"},
+    ]
+    assert cache.stats()["hits"] == 2
+
+
+def test_events_misses_unknown_or_longer_base():
+    cache = TrackerCache()
+    cache.store("1", _events(3))
+
+    assert cache.events("2", 0, []) is None
+    assert cache.events("1", 4, []) is None
+    assert cache.events("1", -1, []) is None
+    assert cache.stats()["misses"] == 3
+
+
+def test_stored_events_are_copied():
+    cache = TrackerCache()
+    events = _events(2)
+    cache.store("1", events)
+    events.append({"event": "bot"})
+
+    assert cache.events("1", 2, []) == _events(2)
+
+
+def test_store_evicts_least_recently_used_conversations():
+    cache = TrackerCache(max_entries=2)
+    cache.store("1", _events(1))
+    cache.store("2", _events(1))
+    cache.events("1", 1, [])
+    cache.store("3", _events(1))
+
+    assert cache.events("2", 0, []) is None
+    assert cache.events("1", 1, []) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_store_limits_total_events():
+    cache = TrackerCache(max_events=5)
+    cache.store("1", _events(3))
+    cache.store("2", _events(3))
+
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["events"] == 3
+    assert cache.events("1", 0, []) is None
+
+    # Replacing a conversation doesn't count its previous events.
+    cache.store("2", _events(5))
+    assert cache.stats()["events"] == 5
+
+    cache.store("3", _events(6))
+    assert cache.events("3", 0, []) is None
+
+
+def test_pickled_cache_is_empty():
+    cache = TrackerCache(max_entries=3)
+    cache.store("1", _events(2))
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.max_entries == 3
+    assert restored.stats()["entries"] == 0
+    assert restored.stats()["events"] == 0
@@ -232,3 +232,14 @@ def test_configure_default_logging():
     with open(handler_filename, "r") as logs:
         data = logs.readlines()
         assert "[INFO ]  rasa_sdk  -  Testing info log." in data[-1]
+
+
+def test_check_version_compatibility_warns_once_per_version():
+    rasa_sdk.utils.check_version_compatibility.cache_clear()
+
+    with pytest.warns(UserWarning, match="might not be compatible") as record:
+        for _ in range(3):
+            rasa_sdk.utils.check_version_compatibility("0.1.0")
+            rasa_sdk.utils.check_version_compatibility(None)
+
+    assert len(record) == 2
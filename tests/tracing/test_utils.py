@@ -1,5 +1,6 @@
 import json
 import argparse
+from unittest.mock import MagicMock
 
 import rasa_sdk.endpoint as ep
 
@@ -9,6 +10,7 @@ from opentelemetry.sdk.trace import TracerProvider
 from rasa_sdk.tracing.utils import (
     get_tracer_provider,
     get_tracer_and_context,
+    start_request_span,
 )
 
 from tests.tracing.conftest import (
@@ -77,3 +79,25 @@ def test_get_tracer_and_context() -> None:
 
     assert isinstance(tracer, ProxyTracer)
     assert context is None
+
+
+def test_start_request_span_without_tracer_provider() -> None:
+    """Tests that no tracing work is done if tracing is disabled."""
+    tracing_carrier = MagicMock()
+
+    with start_request_span("create_app.webhook", None, tracing_carrier) as span:
+        assert not span.is_recording()
+
+    tracing_carrier.assert_not_called()
+
+
+def test_start_request_span_with_tracer_provider() -> None:
+    """Tests that the span is recorded if tracing is enabled."""
+    tracing_carrier = MagicMock(return_value=None)
+
+    with start_request_span(
+        "create_app.webhook", TracerProvider(), tracing_carrier
+    ) as span:
+        assert span.is_recording()
+
+    tracing_carrier.assert_called_once_with()